@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Enemy bullet store throughput check.
+
+Keeps N bullets alive in a BulletStore (spiral emitters refilling what leaves
+the screen) and times what GameScene does with them every frame: update,
+collision against the player hitbox and the per-bullet iteration the draw
+pass uses. Runs each available backend (numpy, stdlib array) and fails when
+the numpy backend's mean frame cost goes over budget at the given density.
+No pyxel needed.
+
+    python scripts/bench_bullets.py --bullets 1000 2000 4000 --budget-ms 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.systems import bullets as bullet_mod  # noqa: E402
+from src.systems.barrage import BarragePattern  # noqa: E402
+
+W, H = 256, 144
+PLAYER = (24.0, 64.0, 10.0, 10.0)  # forgiving player hitbox (x, y, w, h)
+
+
+def run(backend: str, target: int, frames: int) -> float:
+    store = bullet_mod.make_bullet_store(target + 64, backend)
+    spiral = BarragePattern.build("bench", {"kind": "spiral", "count": 8, "speed": 1.0, "spin_deg": 7.0})
+    emitters = [(W * (0.3 + 0.6 * i / 7), H * (0.2 + 0.6 * (i % 3) / 2)) for i in range(8)]
+    volley = 0
+    # fill to the target density before timing
+    while len(store) < target:
+        for x, y in emitters:
+            store.emit(*spiral.volley(x, y, 0.0, 0.0, volley), 10, 600)
+        store.update(W, H)
+        volley += 1
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        while len(store) < target:
+            x, y = emitters[volley % len(emitters)]
+            store.emit(*spiral.volley(x, y, 0.0, 0.0, volley), 10, 600)
+            volley += 1
+        store.update(W, H)
+        store.collide(*PLAYER)
+        for x, y, _, _ in store.rows():
+            int(x), int(y)  # what the draw loop does per bullet, minus pyxel.blt
+    return (time.perf_counter() - t0) * 1000.0 / frames
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--bullets", type=int, nargs="+", default=[500, 1000, 2000, 4000])
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--budget-ms", type=float, default=4.0, help="numpy backend, densest run")
+    args = ap.parse_args()
+
+    backends = ["array"] if bullet_mod.np is None else ["numpy", "array"]
+    worst = 0.0
+    for backend in backends:
+        for n in args.bullets:
+            ms = run(backend, n, args.frames)
+            print(f"{backend:<6} bullets={n:>5}  {ms:.3f} ms/frame  ({ms * 1000 / n:.2f} us/bullet)")
+            if backend == "numpy":
+                worst = max(worst, ms)
+    if bullet_mod.np is None:
+        print("numpy not installed: budget not checked")
+        return 0
+    print(f"numpy worst: {worst:.3f} ms/frame (budget {args.budget_ms:.1f} ms)")
+    if worst > args.budget_ms:
+        print("FAIL: over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Scripted enemy throughput check.
+
+Keeps N enemies alive, each driven by a behaviour script (stop_shoot / hover,
+the same generators GameScene runs), and times ScriptRunner.update() per
+frame. Enemies that leave the screen are replaced, so scripts keep starting
+and finishing. Sleeping scripts wait in the timer heap; the "resumed" column
+is how many actually ran per frame. Fails when the mean frame cost at the
+largest N goes over budget. No pyxel needed.
+
+    python scripts/bench_scripts.py --enemies 100 500 2000 --budget-ms 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from math import ceil
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.systems.enemy_scripts import BEHAVIOURS, Fire, Move  # noqa: E402
+from src.systems.scripting import Script, ScriptRunner  # noqa: E402
+
+W, H = 256, 144
+COOLDOWN = 60
+SPEED = 0.8
+
+
+class Dummy:
+    def __init__(self, x: float) -> None:
+        self.active = True
+        self.x = x
+        self.move_mul = 1.0
+
+
+def act(script: Script, cmd: Any) -> int:
+    if isinstance(cmd, Move):
+        script.actor.move_mul = cmd.mul
+        return 0
+    if isinstance(cmd, Fire):
+        return COOLDOWN
+    return 0
+
+
+def eta(e: Dummy, x: float) -> int:
+    if e.x <= x:
+        return 0
+    step = SPEED * e.move_mul
+    return max(1, ceil((e.x - x) / step)) if step > 0 else 1
+
+
+def run(n: int, frames: int) -> tuple[float, float]:
+    runner = ScriptRunner(BEHAVIOURS, act, eta)
+    names = sorted(BEHAVIOURS)
+    enemies: list[Dummy] = []
+    spawned = 0
+    spent = 0.0
+    resumed = 0
+    for frame in range(frames):
+        while len(enemies) < n:
+            # staggered entry so wake frames spread out like real spawns
+            e = Dummy(W + 10 + spawned % 97)
+            enemies.append(e)
+            runner.start(names[spawned % len(names)], (COOLDOWN, W, H), e, frame)
+            spawned += 1
+        for e in enemies:
+            e.x -= SPEED * e.move_mul
+            if e.x < -24:
+                e.active = False
+        enemies = [e for e in enemies if e.active]
+        t0 = time.perf_counter()
+        runner.update(frame)
+        spent += time.perf_counter() - t0
+        resumed += runner.resumed
+        if frame % 45 == 0:
+            runner.prune()
+    return spent * 1000.0 / frames, resumed / frames
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--enemies", type=int, nargs="+", default=[100, 500, 2000])
+    ap.add_argument("--frames", type=int, default=1200)
+    ap.add_argument("--budget-ms", type=float, default=1.0, help="largest --enemies run")
+    args = ap.parse_args()
+
+    worst = 0.0
+    for n in args.enemies:
+        ms, resumed = run(n, args.frames)
+        print(f"enemies={n:>5}  {ms:.3f} ms/frame  resumed {resumed:.1f}/frame")
+        worst = ms
+    print(f"largest run: {worst:.3f} ms/frame (budget {args.budget_ms:.1f} ms)")
+    if worst > args.budget_ms:
+        print("FAIL: over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Time-to-first-frame check.
+
+Launches the game N times with run_app(exit_after_first_frame=True), parses the
+startup report each run prints, and fails when the median total exceeds the
+budget. Needs pyxel and a display (use SDL_VIDEODRIVER=dummy on CI).
+
+    python scripts/bench_startup.py --runs 5 --budget-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+_REPORT = re.compile(r"^startup: (.*) total=([0-9.]+)ms$")
+
+
+def run_once() -> tuple[float, float, str]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", "from src.core.app import run_app; run_app(exit_after_first_frame=True)"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "SDL_AUDIODRIVER": os.environ.get("SDL_AUDIODRIVER", "dummy")},
+        timeout=60,
+    )
+    wall_ms = (time.perf_counter() - t0) * 1000.0
+    for line in proc.stdout.splitlines():
+        m = _REPORT.match(line.strip())
+        if m:
+            return float(m.group(2)), wall_ms, m.group(1)
+    raise RuntimeError(f"no startup report (exit={proc.returncode}):\n{proc.stdout}\n{proc.stderr}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget-ms", type=float, default=400.0, help="median time-to-first-frame budget")
+    args = ap.parse_args()
+
+    totals: list[float] = []
+    walls: list[float] = []
+    for i in range(args.runs):
+        total, wall, phases = run_once()
+        totals.append(total)
+        walls.append(wall)
+        print(f"run {i + 1}: {phases} total={total:.1f}ms process={wall:.1f}ms")
+
+    median = statistics.median(totals)
+    print(f"median time-to-first-frame: {median:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    print(f"median process wall time:   {statistics.median(walls):.1f}ms")
+    if median > args.budget_ms:
+        print("FAIL: over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Local loader benchmark for the web build.
+
+Serves site/ from a static file server on localhost and counts every request the
+Pyxel WASM loader makes (and the bytes served). Time-to-title is the time from
+navigation until the game prints its "startup:" report to the browser console.
+
+    ./scripts/build_pages.sh            # or: ./scripts/build_pages.sh --archive
+    python scripts/bench_web_load.py --browser   # automated, needs playwright + chromium
+    python scripts/bench_web_load.py             # serve only; open the URL yourself, Ctrl+C for the summary
+
+The Pyxel runtime itself comes from the CDN and is not counted; only requests
+for this game's files are.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests: list[tuple[float, str, int, int]] = []  # (t, path, status, bytes)
+
+    def add(self, path: str, status: int, size: int) -> None:
+        with self.lock:
+            self.requests.append((time.perf_counter(), path, status, size))
+
+
+def _make_handler(stats: _Stats, directory: Path) -> type[SimpleHTTPRequestHandler]:
+    class Handler(SimpleHTTPRequestHandler):
+        _content_length = 0
+
+        def send_header(self, keyword: str, value: str) -> None:
+            if keyword.lower() == "content-length":
+                self._content_length = int(value)
+            super().send_header(keyword, value)
+
+        def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+            # called from send_response(), before the headers; record after the body instead
+            self._status = int(code) if str(code).isdigit() else 0
+
+        def handle_one_request(self) -> None:
+            self._status = 0
+            self._content_length = 0
+            super().handle_one_request()
+            if self._status:
+                stats.add(self.path, self._status, self._content_length)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+        def end_headers(self) -> None:
+            self.send_header("Cache-Control", "no-store")
+            super().end_headers()
+
+    return functools.partial(Handler, directory=str(directory))  # type: ignore[return-value]
+
+
+def _summary(stats: _Stats, t_nav: float | None, t_title: float | None) -> None:
+    reqs = list(stats.requests)
+    total_bytes = sum(r[3] for r in reqs)
+    print(f"requests: {len(reqs)}  bytes: {total_bytes}")
+    for t, path, status, size in reqs:
+        rel = (t - t_nav) * 1000.0 if t_nav is not None else 0.0
+        print(f"  +{rel:8.1f}ms  {status}  {size:>8}  {path}")
+    if t_nav is not None and t_title is not None:
+        print(f"time-to-title: {(t_title - t_nav) * 1000.0:.1f}ms")
+
+
+def _run_browser(url: str, stats: _Stats, timeout_s: float) -> int:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("playwright is not installed: pip install playwright && playwright install chromium", file=sys.stderr)
+        return 2
+    t_title: list[float] = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page()
+
+        def on_console(msg: object) -> None:
+            text = getattr(msg, "text", "")
+            if not t_title and str(text).startswith("startup:"):
+                t_title.append(time.perf_counter())
+                print(f"game: {text}")
+
+        page.on("console", on_console)
+        t_nav = time.perf_counter()
+        page.goto(url)
+        deadline = t_nav + timeout_s
+        while not t_title and time.perf_counter() < deadline:
+            page.wait_for_timeout(50)
+        browser.close()
+    _summary(stats, t_nav, t_title[0] if t_title else None)
+    if not t_title:
+        print("FAIL: no startup report before timeout", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Count requests and time-to-title for the web build.")
+    ap.add_argument("--site", type=Path, default=ROOT / "site")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--browser", action="store_true", help="drive headless chromium via playwright")
+    ap.add_argument("--timeout", type=float, default=120.0)
+    args = ap.parse_args()
+
+    if not (args.site / "index.html").exists():
+        print(f"{args.site}/index.html not found; run ./scripts/build_pages.sh first", file=sys.stderr)
+        return 2
+
+    stats = _Stats()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), _make_handler(stats, args.site))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{args.port}/index.html"
+    try:
+        if args.browser:
+            return _run_browser(url, stats, args.timeout)
+        print(f"serving {args.site} at {url} (Ctrl+C to stop)")
+        t0 = time.perf_counter()
+        try:
+            while True:
+                time.sleep(0.5)
+        except KeyboardInterrupt:
+            pass
+        _summary(stats, stats.requests[0][0] if stats.requests else t0, None)
+        return 0
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,62 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+# Usage:
+#   ./scripts/build_pages.sh            loose files for <pyxel-run> (one request per module)
+#   ./scripts/build_pages.sh --archive  one precompiled .pyxapp for <pyxel-play> (needs pyxel)
+MODE="loose"
+if [[ "${1:-}" == "--archive" ]]; then
+  MODE="archive"
+fi
+APP_NAME="2d_shooting_pyxel"
+PYTHON="${PYTHON:-python3}"
+
 rm -rf site
 mkdir -p site
 
-# Copy runtime files for <pyxel-run>.
-cp -f main.py site/main.py
-cp -f README.md site/README.md || true
-cp -rf config site/config
-cp -rf src site/src
+if [[ "$MODE" == "archive" ]]; then
+  # Stage the runtime tree, precompile it and pack everything into one archive
+  # so the browser fetches a single file instead of every module and directory.
+  STAGE="build/$APP_NAME"
+  rm -rf build
+  mkdir -p "$STAGE"
+  cp -f main.py "$STAGE/main.py"
+  cp -rf config "$STAGE/config"
+  cp -rf src "$STAGE/src"
+  find "$STAGE" -name __pycache__ -type d -prune -exec rm -rf {} +
+
+  # Bytecode is only used when its tag matches the browser's Python (CPython 3.12
+  # for the pinned Pyxel); otherwise the sources next to it are imported as usual.
+  "$PYTHON" -m compileall -q --invalidation-mode unchecked-hash "$STAGE"
+  # Bake the compiled config cache so the first load skips TOML parsing.
+  (cd "$STAGE" && "$PYTHON" -c "from src.core.config import load_config; load_config()")
+
+  (cd build && pyxel package "$APP_NAME" "$APP_NAME/main.py")
+  cp -f "build/$APP_NAME.pyxapp" "site/$APP_NAME.pyxapp"
+  RUNNER="<pyxel-play root=\".\" name=\"$APP_NAME.pyxapp\" gamepad=\"enabled\"></pyxel-play>"
+else
+  # Copy runtime files for <pyxel-run>.
+  cp -f main.py site/main.py
+  cp -f README.md site/README.md || true
+  cp -rf config site/config
+  cp -rf src site/src
 
-# Pyxel WASM loader uses synchronous XHR against directory paths (e.g. "src", "src/core").
-# GitHub Pages serves directories only when an index.html exists, so add minimal ones.
-for d in \
-  site/config \
-  site/src \
-  site/src/core \
-  site/src/scenes \
-  site/src/entities \
-  site/src/systems \
-  site/src/ui
-do
-  mkdir -p "$d"
-  printf '%s\n' '<!doctype html><meta charset="utf-8"><title>dir</title>' > "$d/index.html"
-done
+  # Pyxel WASM loader uses synchronous XHR against directory paths (e.g. "src", "src/core").
+  # GitHub Pages serves directories only when an index.html exists, so add minimal ones.
+  for d in \
+    site/config \
+    site/src \
+    site/src/core \
+    site/src/scenes \
+    site/src/entities \
+    site/src/systems \
+    site/src/ui
+  do
+    mkdir -p "$d"
+    printf '%s\n' '<!doctype html><meta charset="utf-8"><title>dir</title>' > "$d/index.html"
+  done
+  RUNNER='<pyxel-run root="." name="main.py" gamepad="enabled"></pyxel-run>'
+fi
 
 cat > site/index.html <<'HTML'
 <!doctype html>
@@ -70,7 +103,7 @@ const t = setInterval(() => {
 }, 50);
 </script>
 
-<pyxel-run root="." name="main.py" gamepad="enabled"></pyxel-run>
 HTML
+printf '%s\n' "$RUNNER" >> site/index.html
 
-echo "Built: site/index.html"
+echo "Built ($MODE): site/index.html"
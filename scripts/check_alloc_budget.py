@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Per-frame allocation budget check.
+
+Runs a headless GameScene under the weapon-stress autopilot with particles on,
+skips the warm-up (pools filling and growing, first spawns), then measures each update()
+with the tracemalloc-based AllocTracker. Fails when the average per-frame
+allocation peak or the average number of blocks left behind per frame goes
+over budget, so allocation regressions in the frame loop show up in CI.
+Needs pyxel importable (no window is opened).
+
+    python scripts/check_alloc_budget.py --frames 1800 --budget-peak-kb 4 --budget-blocks 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.allocs import AllocTracker  # noqa: E402
+from src.core.config import load_config  # noqa: E402
+from src.scenes.game_scene import GameScene  # noqa: E402
+from src.sim.headless import make_headless_context  # noqa: E402
+from src.sim.policy import make_policy  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--config", default=str(ROOT / "config" / "game.toml"))
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--warmup", type=int, default=2400, help="frames run before measuring (pools grow to size)")
+    ap.add_argument("--frames", type=int, default=1800, help="frames measured")
+    ap.add_argument("--budget-peak-kb", type=float, default=4.0, help="average per-frame allocation peak")
+    ap.add_argument("--budget-blocks", type=float, default=1.0, help="average blocks retained per frame")
+    ap.add_argument("--top", type=int, default=10, help="allocation sites listed on failure")
+    args = ap.parse_args()
+
+    config = load_config(args.config).data
+    ctx = make_headless_context(config, args.seed, skip_cosmetic=False)
+    dead: list[int] = []
+    scene = GameScene(ctx, selected_ship="propeller", on_game_over=dead.append)
+    policy = make_policy("stress")
+    policy.reset(args.seed)
+
+    def step() -> None:
+        ctx.input.feed(policy.act(scene))
+        scene.update()
+
+    for _ in range(args.warmup):
+        step()
+    tracker = AllocTracker()
+    tracker.dump_top(0)  # baseline for the failure report
+    for _ in range(args.frames):
+        if dead:
+            break
+        tracker.begin("update")
+        step()
+        tracker.end()
+    stats = tracker.phases.get("update")
+    if stats is None or dead:
+        print(f"FAIL: player died after {scene.frame} frames; no steady state to measure", file=sys.stderr)
+        return 1
+
+    peak_kb = stats.avg_peak_bytes() / 1024
+    blocks = stats.avg_net_blocks()
+    print(tracker.report())
+    print(f"avg allocation peak: {peak_kb:.2f}KB/frame (budget {args.budget_peak_kb:.1f}KB)")
+    print(f"avg retained blocks: {blocks:.2f}/frame (budget {args.budget_blocks:.1f})")
+    failed = peak_kb > args.budget_peak_kb or blocks > args.budget_blocks
+    if failed:
+        print(tracker.dump_top(args.top))
+        print("FAIL: over allocation budget", file=sys.stderr)
+    tracker.stop()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
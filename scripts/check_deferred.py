@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Deferred work survives restarts and save states.
+
+The stage queues the next section's strip rendering as a one-shot on the
+game's FrameScheduler; restarting the game or restoring a save state drops
+pending one-shots, so the stage has to queue it again. Runs a headless
+GameScene into a later section, then checks that "next_strips" is pending
+after reset(), after set_state() into another section and after set_state()
+within the current one. Needs pyxel importable (no window is opened).
+
+    python scripts/check_deferred.py --frames 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.core.config import load_config  # noqa: E402
+from src.scenes.game_scene import GameScene  # noqa: E402
+from src.sim.headless import make_headless_context  # noqa: E402
+from src.sim.policy import make_policy  # noqa: E402
+
+TASK = "next_strips"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--config", default=str(ROOT / "config" / "game.toml"))
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--frames", type=int, default=3000, help="frames run before the checks (past section 1)")
+    args = ap.parse_args()
+
+    config = load_config(args.config).data
+    ctx = make_headless_context(config, args.seed)
+    scene = GameScene(ctx, selected_ship="propeller", on_game_over=lambda _: None)
+    if len(scene.stage.sections) < 2:
+        print(f"only one stage section; nothing queues {TASK}")
+        return 0
+    policy = make_policy("dodge")
+    policy.reset(args.seed)
+
+    def step() -> None:
+        ctx.input.feed(policy.act(scene))
+        scene.update()
+
+    def run_until(pred: Callable[[], bool]) -> None:
+        for _ in range(args.frames):
+            if pred():
+                return
+            step()
+
+    failures: list[str] = []
+
+    def check(what: str) -> None:
+        ok = scene.tasks.pending(TASK)
+        print(f"{what:<34} section={scene.stage.section_index}  {TASK} {'pending' if ok else 'MISSING'}")
+        if not ok:
+            failures.append(what)
+
+    run_until(lambda: scene.stage.section_index > 0)
+    state_later = scene.get_state()
+    scene.reset("propeller")
+    check("reset() from a later section")
+    scene.reset("propeller")
+    check("reset() from section 0")
+    for _ in range(30):
+        step()
+    state_first = scene.get_state()
+    scene.set_state(state_later)
+    check("set_state() into another section")
+    scene.set_state(state_later)
+    check("set_state() within the section")
+    scene.set_state(state_first)
+    check("set_state() back to section 0")
+
+    if failures:
+        print(f"FAIL: {TASK} not queued after " + ", ".join(failures), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
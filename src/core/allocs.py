@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+
+@dataclass
+class PhaseAllocs:
+    frames: int = 0
+    peak_bytes: int = 0  # sum over frames of the traced-memory rise during the phase
+    max_peak_bytes: int = 0
+    net_bytes: int = 0  # sum of (end - start) traced memory: > 0 on average means retention
+    net_blocks: int = 0  # sys.getallocatedblocks() delta, same idea in object counts
+    gc_gen0: int = 0  # gen-0 collections triggered inside the phase (~700 container allocs each)
+    gc_off_frames: int = 0  # frames with automatic collection off (gc.mode = "scheduled"): gc_gen0 stays 0
+    last_peak_bytes: int = 0
+    last_net_blocks: int = 0
+
+    def avg_peak_bytes(self) -> float:
+        return self.peak_bytes / max(1, self.frames)
+
+    def avg_net_blocks(self) -> float:
+        return self.net_blocks / max(1, self.frames)
+
+
+class AllocTracker:
+    # Per-phase allocation accounting for the frame loop (debug only: tracemalloc
+    # slows Python down noticeably). Wrap each phase in begin()/end():
+    # - peak bytes: how far traced memory rose above the phase start, i.e. the
+    #   temporaries (Vec2/Rect/tuples/f-strings) alive at the worst moment
+    # - net bytes / blocks: what the phase left behind
+    # - gc gen-0 collections: allocation churn of container objects; only
+    #   meaningful while automatic collection is on, reported as "off" otherwise
+    def __init__(self, nframes: int = 1) -> None:
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start(nframes)
+        self.phases: dict[str, PhaseAllocs] = {}
+        self._phase: str | None = None
+        self._cur0 = 0
+        self._blocks0 = 0
+        self._gc0 = 0
+        self._gc_runs = 0
+        self._gc_auto = True
+        self._baseline: tracemalloc.Snapshot | None = None
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, event: str, info: dict[str, int]) -> None:
+        if event == "start" and info.get("generation") == 0:
+            self._gc_runs += 1
+
+    def begin(self, phase: str) -> None:
+        self._phase = phase
+        self._gc0 = self._gc_runs
+        self._gc_auto = gc.isenabled()
+        self._blocks0 = sys.getallocatedblocks()
+        self._cur0, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+    def end(self) -> None:
+        blocks = sys.getallocatedblocks()  # before the ints below are allocated
+        cur, peak = tracemalloc.get_traced_memory()
+        if self._phase is None:
+            return
+        st = self.phases.get(self._phase)
+        if st is None:
+            st = self.phases[self._phase] = PhaseAllocs()
+        rise = max(0, peak - self._cur0)
+        st.frames += 1
+        st.peak_bytes += rise
+        st.max_peak_bytes = max(st.max_peak_bytes, rise)
+        st.net_bytes += cur - self._cur0
+        st.net_blocks += blocks - self._blocks0
+        st.gc_gen0 += self._gc_runs - self._gc0
+        if not self._gc_auto:
+            st.gc_off_frames += 1
+        st.last_peak_bytes = rise
+        st.last_net_blocks = blocks - self._blocks0
+        self._phase = None
+
+    def reset(self) -> None:
+        self.phases.clear()
+
+    def overlay_text(self) -> str:
+        # one short line for the debug overlay: last frame per phase
+        return " ".join(
+            f"{name[0].upper()}:{st.last_peak_bytes / 1024:.1f}K/{st.last_net_blocks:+d}"
+            for name, st in self.phases.items()
+        )
+
+    def report(self) -> str:
+        lines = ["phase    frames  avg peak KB  max peak KB  avg net blocks  gen0 gc/frame"]
+        gc_off = False
+        for name, st in self.phases.items():
+            gen0 = "off" if st.gc_off_frames else f"{st.gc_gen0 / max(1, st.frames):.3f}"
+            gc_off = gc_off or st.gc_off_frames > 0
+            lines.append(
+                f"{name:<8} {st.frames:>6}  {st.avg_peak_bytes() / 1024:>11.2f}  {st.max_peak_bytes / 1024:>11.2f}"
+                f"  {st.avg_net_blocks():>14.2f}  {gen0:>13}"
+            )
+        if gc_off:
+            lines.append("gen0 gc off: gc.mode = scheduled collects between frames (see the GC overlay line)")
+        return "\n".join(lines)
+
+    def dump_top(self, limit: int = 15) -> str:
+        # Top allocation sites: growth since the previous dump (or all live
+        # traced memory on the first one).
+        snap = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            )
+        )
+        if self._baseline is None:
+            title = "top allocation sites (live)"
+            stats = [(s.traceback, s.size, s.count) for s in snap.statistics("lineno")[:limit]]
+        else:
+            title = "top allocation sites (growth since last dump)"
+            stats = [(s.traceback, s.size_diff, s.count_diff) for s in snap.compare_to(self._baseline, "lineno")[:limit]]
+        self._baseline = snap
+        lines = [title]
+        for tb, size, count in stats:
+            frame = tb[0]
+            lines.append(f"{size / 1024:>9.1f} KB {count:>7} blocks  {frame.filename}:{frame.lineno}")
+        return "\n".join(lines)
+
+    def stop(self) -> None:
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
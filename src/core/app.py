@@ -1,21 +1,32 @@
 from __future__ import annotations
 
-from random import Random
+import atexit
+import sys
+from time import perf_counter
 
 import pyxel
 
+from src.core.allocs import AllocTracker
+from src.core.audio import SoundMixer
 from src.core.config import load_config
 from src.core.context import GameContext
 from src.core.env import load_dotenv
-from src.core.input import Input
-from src.core.scene_manager import SceneManager
+from src.core.gcpolicy import GcPolicy
+from src.core.input import TOGGLE_DEBUG, Input
+from src.core.profiling import StartupProfiler
+from src.core.rng import RngStreams
+from src.core.scene_manager import Scene, SceneManager
+from src.core.statehash import StateTraceWriter
+from src.core.telemetry import TelemetryRecorder
 
 
-def run_app() -> None:
+def run_app(*, exit_after_first_frame: bool = False) -> None:
+    startup = StartupProfiler()
     _ = load_dotenv(".env")  # keep optional; app must start without it
 
     cfg_result = load_config("config/game.toml")
     cfg = cfg_result.data
+    startup.mark("config")
 
     window = cfg.get("window", {})
     width = int(window.get("width", 256))
@@ -24,49 +35,131 @@ def run_app() -> None:
     title = str(window.get("title", "Side-Scrolling Shooter"))
 
     pyxel.init(width, height, title=title, fps=fps)
+    startup.mark("pyxel_init")
 
     input_system = Input(cfg)
-    rng = Random()
+    rng = RngStreams()
 
-    from src.core.assets import Assets  # local import: pyxel must be initialized
+    from src.core.assets import SOUND_SPECS, Assets  # local import: pyxel must be initialized
 
+    # Title assets only; tiles, themes and gameplay sounds load with the first GameScene.
     assets = Assets(cfg)
     assets.load()
+    gc_policy = GcPolicy.from_config(cfg)
+    gc_policy.freeze()
+    startup.mark("assets")
+
+    debug_cfg = cfg.get("debug", {})
+    debug_enabled = bool(debug_cfg.get("enabled", False))
+    trace_path = str(debug_cfg.get("state_trace", ""))
+    trace = StateTraceWriter(trace_path) if trace_path else None
+    if trace is not None:
+        atexit.register(trace.close)
+    ctx = GameContext(
+        config=cfg,
+        input=input_system,
+        rng=rng,
+        debug_enabled=debug_enabled,
+        assets=assets,
+        audio=SoundMixer(SOUND_SPECS, fps=fps),
+        trace=trace,
+    )
 
-    debug_enabled = bool(cfg.get("debug", {}).get("enabled", False))
-    ctx = GameContext(config=cfg, input=input_system, rng=rng, debug_enabled=debug_enabled, assets=assets)
-
-    from src.scenes.game_over_scene import GameOverScene
-    from src.scenes.game_scene import GameScene
     from src.scenes.title_scene import TitleScene
 
     manager = SceneManager(scene=TitleScene(ctx, on_start=lambda _ship: None))
 
+    ship = ["propeller"]  # ship of the current / last run (retry reuses it)
+
     def go_title() -> None:
-        manager.change(TitleScene(ctx, on_start=start_game))
+        manager.change(manager.pooled("title", lambda: TitleScene(ctx, on_start=start_game)))
 
     def start_game(selected_ship: str) -> None:
-        def on_game_over(kills: int) -> None:
-            manager.change(
-                GameOverScene(
-                    ctx,
-                    kills=kills,
-                    on_retry=lambda: start_game(selected_ship),
-                    on_title=go_title,
-                )
-            )
-
-        manager.change(GameScene(ctx, selected_ship=selected_ship, on_game_over=on_game_over))
+        # gameplay modules are imported on first use, not before the title screen
+        from src.scenes.game_scene import GameScene
+
+        ship[0] = selected_ship
+        game = manager.pooled("game", lambda: GameScene(ctx, selected_ship=selected_ship, on_game_over=on_game_over))
+        game.reset(selected_ship)  # no-op when already prepared during game over
+        manager.change(game)
+
+    def on_game_over(kills: int) -> None:
+        from src.scenes.game_over_scene import GameOverScene
+        from src.scenes.game_scene import GameScene
+
+        over = manager.pooled(
+            "game_over",
+            lambda: GameOverScene(ctx, kills=kills, on_retry=lambda: start_game(ship[0]), on_title=go_title),
+        )
+        over.reset(kills)
+        manager.change(over)
+        # reset the run while the static game-over screen is up so retry is instant
+        game = manager.pooled("game", lambda: GameScene(ctx, selected_ship=ship[0], on_game_over=on_game_over))
+        manager.prepare(lambda: game.reset(ship[0]))
 
     go_title()
+    startup.mark("scenes")
+
+    telemetry_cfg = cfg.get("telemetry", {})
+    telemetry: TelemetryRecorder | None = None
+    if bool(telemetry_cfg.get("enabled", False)):
+        telemetry = TelemetryRecorder(
+            capacity=int(telemetry_cfg.get("capacity", 3600)),
+            out_dir=str(telemetry_cfg.get("dir", "telemetry")),
+            fmt=str(telemetry_cfg.get("format", "jsonl")),
+        )
+
+    def on_scene_change(old: Scene, new: Scene) -> None:
+        gc_policy.on_scene_change(old, new)
+        if telemetry is not None:
+            telemetry.on_scene_change(old, new)
+
+    manager.on_change = on_scene_change
+    allocs = AllocTracker() if bool(debug_cfg.get("alloc_tracking", False)) else None
+    draw_ms = 0.0  # last draw, recorded with the next update (Pyxel may skip draws)
 
     def update() -> None:
+        t0 = perf_counter()
+        if allocs is not None:
+            allocs.begin("update")
         ctx.input.update()
-        if ctx.input.state.is_pressed("toggle_debug"):
+        if ctx.input.state.is_pressed(TOGGLE_DEBUG):
             ctx.debug_enabled = not ctx.debug_enabled
         manager.update()
+        ctx.audio.flush()
+        if allocs is not None:
+            allocs.end()
+            if ctx.input.state.is_pressed("alloc_dump"):
+                print(allocs.report(), flush=True)
+                print(allocs.dump_top(), flush=True)
+        update_ms = (perf_counter() - t0) * 1000.0
+        if telemetry is not None:
+            telemetry.record(pyxel.frame_count, update_ms, draw_ms, manager.scene)
+            if ctx.input.state.is_pressed("telemetry_dump"):
+                path = telemetry.flush("manual")
+                if path is not None:
+                    print(f"telemetry: writing {path}", flush=True)
+        gc_policy.end_frame(update_ms + draw_ms)
 
     def draw() -> None:
+        nonlocal draw_ms
+        t0 = perf_counter()
+        if allocs is not None:
+            allocs.begin("draw")
         manager.draw()
+        if allocs is not None:
+            allocs.end()
+        if ctx.debug_enabled:
+            pyxel.text(1, height - 7, gc_policy.overlay_text(), 7)
+            if allocs is not None:
+                pyxel.text(1, height - 14, allocs.overlay_text(), 7)
+        draw_ms = (perf_counter() - t0) * 1000.0
+        if not startup.finished:
+            startup.finish()
+            # always reported in the browser build (console), for load benchmarks
+            if ctx.debug_enabled or exit_after_first_frame or sys.platform == "emscripten":
+                print(startup.report(), flush=True)
+            if exit_after_first_frame:
+                pyxel.quit()
 
     pyxel.run(update, draw)
@@ -1,10 +1,31 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 
 import pyxel
 
+from src.core.audio import SoundSpec
+from src.core.sprite_patterns import ENEMY_PATTERN, ITEM_PATTERNS, SHIP_PATTERN, SHOT_PATTERNS
+from src.core.themes import LAYER_NAMES, ThemeCache
+from src.systems.masks import MaskSet, build_masks
+
+# Mixer priority / length / rate limit per sound id (see Assets._build_*_sounds).
+SOUND_SPECS: dict[int, SoundSpec] = {
+    0: SoundSpec(priority=10, ticks=10),  # cursor
+    1: SoundSpec(priority=90, ticks=48),  # start
+    2: SoundSpec(priority=20, ticks=8, cooldown=3),  # cannon
+    3: SoundSpec(priority=30, ticks=48, cooldown=4),  # missile
+    4: SoundSpec(priority=30, ticks=14, cooldown=4),  # bomb
+    5: SoundSpec(priority=50, ticks=24),  # laser
+    6: SoundSpec(priority=40, ticks=16, cooldown=4),  # explosion
+    7: SoundSpec(priority=60, ticks=24),  # item
+    8: SoundSpec(priority=100, ticks=66),  # gameover
+    **{i: SoundSpec(priority=15, ticks=4) for i in range(9, 15)},  # laser charge
+    15: SoundSpec(priority=25, ticks=24),  # flame loop
+}
+
 
 @dataclass(frozen=True)
 class Sprite:
@@ -18,8 +39,8 @@ class Sprite:
 
 @dataclass(frozen=True)
 class ThemeTiles:
-    far: list[list[int]]
-    near: list[list[int]]
+    # background layer name -> rows of tile (u, v) indices; (0, 0) is empty
+    layers: dict[str, list[list[tuple[int, int]]]]
     map_w: int
     map_h: int
 
@@ -29,12 +50,14 @@ class SpriteFont:
         self._sprite_map = sprite_map
         self._glyph_w = glyph_w
 
-    def draw(self, x: int, y: int, text: str) -> None:
+    def draw(self, x: int, y: int, text: str, target: Any = None) -> None:
+        # target: an off-screen pyxel.Image (StaticLayer); default is the screen
+        blt = pyxel.blt if target is None else target.blt
         cx = x
         for ch in text:
             sprite = self._sprite_map.get(ch.upper(), self._sprite_map.get("?", None))
             if sprite is not None:
-                pyxel.blt(cx, y, sprite.img, sprite.u, sprite.v, sprite.w, sprite.h, sprite.colkey)
+                blt(cx, y, sprite.img, sprite.u, sprite.v, sprite.w, sprite.h, sprite.colkey)
             cx += self._glyph_w
 
 
@@ -43,44 +66,94 @@ class Assets:
     IMG_FONT = 1
     IMG_TILES = 2
 
-    TM_FAR = 0
-    TM_NEAR = 1
+    THEME_NAMES = ("moon", "space", "planet1", "planet2")
+    LAYER_NAMES = LAYER_NAMES
+    TILE = 8
 
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
         self.sprites: dict[str, Sprite] = {}
+        self.masks: MaskSet | None = None  # collision masks, built with the sprites
         self.font: SpriteFont | None = None
-        self.themes: dict[str, ThemeTiles] = {}
+        assets_cfg = config.get("assets", {})
+        # built on first use or ahead of time on a worker thread (prefetch_theme)
+        self.themes = ThemeCache(
+            self._build_theme,
+            capacity=int(assets_cfg.get("theme_cache", 3)),
+            prefetch=bool(assets_cfg.get("prefetch_themes", True)),
+        )
+        # theme name -> {layer name: pre-rendered strip image}, same cap as the themes
+        self._strips: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._gameplay_loaded = False
 
     def load(self) -> None:
+        # Only what the title screen needs; gameplay assets come from load_gameplay().
         pyxel.images[self.IMG_SPRITES].cls(0)
         pyxel.images[self.IMG_FONT].cls(0)
         pyxel.images[self.IMG_TILES].cls(0)
 
         self._build_sprites()
         self._build_font()
-        self._build_tiles_and_themes()
-        self._build_sounds()
-
-    def apply_theme(self, name: str) -> None:
-        theme = self.themes.get(name)
-        if theme is None:
-            theme = next(iter(self.themes.values()))
-        far_tm = pyxel.tilemaps[self.TM_FAR]
-        near_tm = pyxel.tilemaps[self.TM_NEAR]
-        far_tm.imgsrc = self.IMG_TILES
-        near_tm.imgsrc = self.IMG_TILES
-
-        # Tilemap.set() signature differs by Pyxel version; use pset for portability.
-        for y, row in enumerate(theme.far):
-            for x, tile in enumerate(row):
-                far_tm.pset(x, y, tile)
-        for y, row in enumerate(theme.near):
-            for x, tile in enumerate(row):
-                near_tm.pset(x, y, tile)
+        self._build_ui_sounds()
+
+    def load_gameplay(self) -> None:
+        if self._gameplay_loaded:
+            return
+        self._gameplay_loaded = True
+        self._build_tiles()
+        self._build_gameplay_sounds()
+
+    def theme(self, name: str) -> ThemeTiles:
+        if name not in self.THEME_NAMES:
+            name = self.THEME_NAMES[0]
+        return self.themes.get(name)
+
+    def prefetch_theme(self, name: str) -> None:
+        if name not in self.THEME_NAMES:
+            name = self.THEME_NAMES[0]
+        self.themes.prefetch(name)
+
+    def apply_theme(self, name: str, layers: Sequence[str] = ("far", "near")) -> list[Any]:
+        # Strip images for the given layers (back to front). Rendered once per
+        # theme and layer, then reused until the theme drops out of the cache.
+        self.load_gameplay()
+        if name not in self.THEME_NAMES:
+            name = self.THEME_NAMES[0]
+        strips = self._strips.get(name)
+        if strips is None:
+            strips = {}
+            self._strips[name] = strips
+            while len(self._strips) > self.themes.capacity:
+                self._strips.popitem(last=False)
+        self._strips.move_to_end(name)
+        out = []
+        for layer in layers:
+            strip = strips.get(layer)
+            if strip is None:
+                strip = self._render_strip(self.theme(name), layer)
+                strips[layer] = strip
+            out.append(strip)
+        return out
+
+    def _render_strip(self, theme: ThemeTiles, layer: str) -> Any:
+        # The layer's whole map width, screen height (top rows of the map),
+        # painted tile by tile into an off-screen image.
+        rows = theme.layers.get(layer)
+        if rows is None:
+            raise ValueError(f"unknown background layer: {layer} (expected one of {', '.join(self.LAYER_NAMES)})")
+        ts = self.TILE
+        h = min(theme.map_h * ts, int(self.config.get("window", {}).get("height", 144)))
+        strip = pyxel.Image(theme.map_w * ts, h)
+        strip.cls(0)
+        for ty in range((h + ts - 1) // ts):
+            for tx, (u, v) in enumerate(rows[ty]):
+                if u or v:
+                    strip.blt(tx * ts, ty * ts, self.IMG_TILES, u * ts, v * ts, ts, ts)
+        return strip
 
     def _build_sprites(self) -> None:
         img = pyxel.images[self.IMG_SPRITES]
+        self.masks = build_masks()
 
         def put(u: int, v: int, pattern: list[str], color: int) -> None:
             for y, row in enumerate(pattern):
@@ -95,25 +168,7 @@ class Assets:
             "ufo": (48, 0, 10),
         }
         for name, (u0, v0, col) in ships.items():
-            pattern = [
-                "     **        ",
-                "    ****       ",
-                "   ******      ",
-                "***********    ",
-                "************** ",
-                "***********    ",
-                "   ******      ",
-                "    ****       ",
-                "     **        ",
-                "               ",
-                "   *      *    ",
-                "    *    *     ",
-                "     *  *      ",
-                "      **       ",
-                "               ",
-                "               ",
-            ]
-            put(u0, v0, pattern, col)
+            put(u0, v0, SHIP_PATTERN, col)
             self.sprites[f"ship:{name}"] = Sprite(self.IMG_SPRITES, u0, v0, 16, 16, 0)
 
         # Enemies
@@ -121,43 +176,20 @@ class Assets:
             "drone": (0, 24, 2),
             "fighter": (16, 24, 3),
             "turret": (32, 24, 5),
+            "interceptor": (48, 24, 14),
         }
         for name, (u0, v0, col) in enemy_defs.items():
-            pattern = [
-                "    ****    ",
-                "   ******   ",
-                "************",
-                "************",
-                "************",
-                "  ********  ",
-                "   ******   ",
-                "    ****    ",
-            ]
-            put(u0, v0, pattern, col)
+            put(u0, v0, ENEMY_PATTERN, col)
             self.sprites[f"enemy:{name}"] = Sprite(self.IMG_SPRITES, u0, v0, 12, 8, 0)
 
         # Projectiles
-        put(0, 40, ["**", "**"], 7)
+        put(0, 40, SHOT_PATTERNS["cannon"], 7)
         self.sprites["shot:cannon"] = Sprite(self.IMG_SPRITES, 0, 40, 2, 2, 0)
 
-        put(8, 40, [" ** ", "****", " ** "], 14)
+        put(8, 40, SHOT_PATTERNS["missile"], 14)
         self.sprites["shot:missile"] = Sprite(self.IMG_SPRITES, 8, 40, 4, 3, 0)
 
-        put(
-            16,
-            40,
-            [
-                "  ****  ",
-                " ****** ",
-                "********",
-                "********",
-                "********",
-                "********",
-                " ****** ",
-                "  ****  ",
-            ],
-            9,
-        )
+        put(16, 40, SHOT_PATTERNS["bomb"], 9)
         self.sprites["shot:bomb"] = Sprite(self.IMG_SPRITES, 16, 40, 8, 8, 0)
 
         put(24, 40, ["********"], 11)
@@ -240,11 +272,11 @@ class Assets:
         self.sprites["shot:flame_blue_b"] = Sprite(self.IMG_SPRITES, 64, 40, 8, 8, 0)
 
         # Items
-        put(0, 48, [" ** ", "****", "****", " ** "], 8)
+        put(0, 48, ITEM_PATTERNS["heal"], 8)
         self.sprites["item:heal"] = Sprite(self.IMG_SPRITES, 0, 48, 4, 4, 0)
-        put(8, 48, ["****", "*  *", "*  *", "****"], 10)
+        put(8, 48, ITEM_PATTERNS["power"], 10)
         self.sprites["item:power"] = Sprite(self.IMG_SPRITES, 8, 48, 4, 4, 0)
-        put(16, 48, [" ** ", "*** ", " ** ", " ***"], 12)
+        put(16, 48, ITEM_PATTERNS["speed"], 12)
         self.sprites["item:speed"] = Sprite(self.IMG_SPRITES, 16, 48, 4, 4, 0)
 
         # HUD icons
@@ -344,12 +376,14 @@ class Assets:
         self.font = SpriteFont(sprite_map, glyph_w=cell_w)
         self.sprites.update({f"font:{k}": v for k, v in sprite_map.items()})
 
-    def _build_sounds(self) -> None:
+    def _build_ui_sounds(self) -> None:
         # Simple 1-channel SFX; keep it lightweight.
         # 0: cursor, 1: start, 2: cannon, 3: missile, 4: bomb, 5: laser, 6: explosion, 7: item, 8: gameover
         # 9-14: laser_charge (low -> high pitch)
         pyxel.sounds[0].set("c3", "p", "6", "n", 10)
         pyxel.sounds[1].set("c3 e3 g3 c4", "t", "6644", "n", 12)
+
+    def _build_gameplay_sounds(self) -> None:
         pyxel.sounds[2].set("g4", "p", "7", "n", 8)
         pyxel.sounds[3].set("c4 d4 e4", "t", "665", "n", 16)
         pyxel.sounds[4].set("a3", "n", "6", "n", 14)
@@ -366,7 +400,7 @@ class Assets:
         # flame loop
         pyxel.sounds[15].set("a2 g2 a2 g2", "n", "2222", "n", 6)
 
-    def _build_tiles_and_themes(self) -> None:
+    def _build_tiles(self) -> None:
         img = pyxel.images[self.IMG_TILES]
         img.cls(0)
 
@@ -384,14 +418,13 @@ class Assets:
         tile(32, 0, ["********", "********", "********", "********", "********", "********", "********", "********"], 4)  # planet soil
         tile(40, 0, ["   **   ", "  ****  ", " ****** ", "********", "********", " ****** ", "  ****  ", "   **   "], 13)  # planet dot
 
-        def tile_uv(u: int, v: int) -> tuple[int, int]:
-            return (u // 8, v // 8)
-
-        star = tile_uv(8, 0)
-        moon = tile_uv(16, 0)
-        space = tile_uv(24, 0)
-        soil = tile_uv(32, 0)
-        planet = tile_uv(40, 0)
+    def _build_theme(self, name: str) -> ThemeTiles:
+        # tile indices (u//8, v//8) of the tiles drawn by _build_tiles()
+        star = (1, 0)
+        moon = (2, 0)
+        space = (3, 0)
+        soil = (4, 0)
+        planet = (5, 0)
         empty = (0, 0)
 
         map_w = 64
@@ -407,49 +440,48 @@ class Assets:
                     if (x * 13 + y * 7) % density == 0:
                         m[y][x] = star
 
-        themes: dict[str, ThemeTiles] = {}
-
-        # Moon: stars + ground band
-        far = empty_map(space)
-        sprinkle_stars(far, density=23)
-        near = empty_map(empty)
-        for y in range(map_h - 4, map_h):
-            for x in range(map_w):
-                near[y][x] = moon
-        themes["moon"] = ThemeTiles(far=far, near=near, map_w=map_w, map_h=map_h)
-
-        # Space: dense stars, no ground
-        far = empty_map(space)
-        sprinkle_stars(far, density=17)
-        near = empty_map(empty)
-        for y in range(3, map_h, 9):
-            for x in range(5, map_w, 11):
-                near[y][x] = planet
-        themes["space"] = ThemeTiles(far=far, near=near, map_w=map_w, map_h=map_h)
-
-        # Planet1: stars + soil band + planet dots
-        far = empty_map(space)
-        sprinkle_stars(far, density=29)
-        near = empty_map(empty)
-        for y in range(map_h - 5, map_h):
-            for x in range(map_w):
-                near[y][x] = soil
-        for y in range(map_h - 12, map_h - 6):
-            for x in range(4, map_w, 13):
-                near[y][x] = planet
-        themes["planet1"] = ThemeTiles(far=far, near=near, map_w=map_w, map_h=map_h)
-
-        # Planet2: different density
-        far = empty_map(space)
-        sprinkle_stars(far, density=19)
-        near = empty_map(empty)
-        for y in range(map_h - 6, map_h):
+        if name == "moon":
+            # Moon: stars + ground band
+            far = empty_map(space)
+            sprinkle_stars(far, density=23)
+            near = empty_map(empty)
+            for y in range(map_h - 4, map_h):
+                for x in range(map_w):
+                    near[y][x] = moon
+        elif name == "space":
+            # Space: dense stars, no ground
+            far = empty_map(space)
+            sprinkle_stars(far, density=17)
+            near = empty_map(empty)
+            for y in range(3, map_h, 9):
+                for x in range(5, map_w, 11):
+                    near[y][x] = planet
+        elif name == "planet1":
+            # Planet1: stars + soil band + planet dots
+            far = empty_map(space)
+            sprinkle_stars(far, density=29)
+            near = empty_map(empty)
+            for y in range(map_h - 5, map_h):
+                for x in range(map_w):
+                    near[y][x] = soil
+            for y in range(map_h - 12, map_h - 6):
+                for x in range(4, map_w, 13):
+                    near[y][x] = planet
+        else:
+            # Planet2: different density
+            far = empty_map(space)
+            sprinkle_stars(far, density=19)
+            near = empty_map(empty)
+            for y in range(map_h - 6, map_h):
+                for x in range(map_w):
+                    near[y][x] = soil
+            for y in range(map_h - 14, map_h - 7):
+                for x in range(7, map_w, 9):
+                    near[y][x] = planet
+        # Dust: sparse transparent stars between far and near (any theme)
+        dust = empty_map(empty)
+        for y in range(map_h):
             for x in range(map_w):
-                near[y][x] = soil
-        for y in range(map_h - 14, map_h - 7):
-            for x in range(7, map_w, 9):
-                near[y][x] = planet
-        themes["planet2"] = ThemeTiles(far=far, near=near, map_w=map_w, map_h=map_h)
-
-        self.themes = themes
-        self.apply_theme(next(iter(themes.keys())))
+                if (x * 5 + y * 11) % 41 == 0:
+                    dust[y][x] = star
+        return ThemeTiles(layers={"far": far, "dust": dust, "near": near}, map_w=map_w, map_h=map_h)
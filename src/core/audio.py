@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pyxel
+
+
+@dataclass(frozen=True)
+class SoundSpec:
+    priority: int
+    ticks: int  # notes * speed; Pyxel plays 120 ticks per second
+    cooldown: int = 0  # min frames between two starts of this sound
+
+
+_DEFAULT_SPEC = SoundSpec(priority=0, ticks=0)
+
+
+@dataclass
+class _Voice:
+    sound: int = -1
+    priority: int = -1
+    until: int = 0  # frame the one-shot ends
+    tag: str | None = None
+    loop: bool = False
+
+    def busy(self, frame: int) -> bool:
+        return self.loop or frame < self.until
+
+    def clear(self) -> None:
+        self.sound = -1
+        self.priority = -1
+        self.until = 0
+        self.tag = None
+        self.loop = False
+
+
+class SoundMixer:
+    # Scenes queue sounds during update(); flush() runs once per frame and turns
+    # them into the minimum number of pyxel.play/stop calls:
+    # - the same sound requested several times in a frame plays once
+    # - a sound restarted within its cooldown is dropped
+    # - voices go to free channels first, then steal the lowest-priority one
+    def __init__(self, specs: dict[int, SoundSpec], fps: int = 60, channels: int = 4) -> None:
+        self._specs = specs
+        self._fps = max(1, fps)
+        self._voices = [_Voice() for _ in range(channels)]
+        self._requests: dict[int, str | None] = {}
+        self._loops: dict[str, int] = {}
+        self._stops: set[str] = set()
+        self._last_start: dict[int, int] = {}
+        self._frame = 0
+        # stats (debug overlay / telemetry)
+        self.requested = 0
+        self.played = 0
+        self.dropped = 0
+
+    def play(self, sound: int, tag: str | None = None) -> None:
+        # tag: voices with the same tag replace each other and can be stopped together
+        self.requested += 1
+        self._requests[sound] = tag
+
+    def loop(self, tag: str, sound: int) -> None:
+        # keeps `sound` looping until stop(tag); re-acquires a channel if it was stolen
+        self._loops[tag] = sound
+
+    def stop(self, tag: str) -> None:
+        self._loops.pop(tag, None)
+        self._stops.add(tag)
+        for sound, t in list(self._requests.items()):
+            if t == tag:
+                del self._requests[sound]
+
+    def stop_all(self) -> None:
+        self._loops.clear()
+        self._requests.clear()
+        self._stops.clear()
+        for ch, v in enumerate(self._voices):
+            if v.busy(self._frame):
+                pyxel.stop(ch)
+            v.clear()
+
+    def flush(self) -> None:
+        self._frame += 1
+        frame = self._frame
+        voices = self._voices
+
+        if self._stops:
+            for ch, v in enumerate(voices):
+                if v.tag is not None and v.tag in self._stops:
+                    if v.busy(frame):
+                        pyxel.stop(ch)
+                    v.clear()
+            self._stops.clear()
+
+        pending: list[tuple[int, int, str | None, bool]] = []
+        for tag, sound in self._loops.items():
+            if not any(v.loop and v.tag == tag for v in voices):
+                pending.append((self._spec(sound).priority, sound, tag, True))
+        if self._requests:
+            for sound, tag in self._requests.items():
+                pending.append((self._spec(sound).priority, sound, tag, False))
+            self._requests.clear()
+        if not pending:
+            return
+        if len(pending) > 1:
+            pending.sort(key=lambda r: -r[0])
+
+        for priority, sound, tag, loop in pending:
+            spec = self._spec(sound)
+            if not loop and spec.cooldown > 0:
+                last = self._last_start.get(sound)
+                if last is not None and frame - last < spec.cooldown:
+                    self.dropped += 1
+                    continue
+            ch = self._pick_channel(frame, priority, tag)
+            if ch < 0:
+                if not loop:  # loops retry next frame
+                    self.dropped += 1
+                continue
+            pyxel.play(ch, sound, loop=loop)
+            self.played += 1
+            self._last_start[sound] = frame
+            v = voices[ch]
+            v.sound = sound
+            v.priority = priority
+            v.tag = tag
+            v.loop = loop
+            v.until = frame + (spec.ticks * self._fps + 119) // 120
+
+    def _spec(self, sound: int) -> SoundSpec:
+        return self._specs.get(sound, _DEFAULT_SPEC)
+
+    def _pick_channel(self, frame: int, priority: int, tag: str | None) -> int:
+        voices = self._voices
+        if tag is not None:
+            for ch, v in enumerate(voices):
+                if v.tag == tag and v.busy(frame):
+                    return ch
+        for ch, v in enumerate(voices):
+            if not v.busy(frame):
+                return ch
+        victim = -1
+        victim_priority = priority
+        for ch, v in enumerate(voices):
+            if v.priority < victim_priority:
+                victim = ch
+                victim_priority = v.priority
+        return victim
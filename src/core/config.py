@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import marshal
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11: fall back to parse_toml_minimal
+    tomllib = None  # type: ignore[assignment]
+
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     merged = dict(base)
@@ -18,7 +25,23 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
 def default_config() -> dict[str, Any]:
     return {
         "window": {"width": 256, "height": 144, "fps": 60, "title": "Side-Scrolling Shooter"},
-        "debug": {"enabled": False},
+        "debug": {"enabled": False, "state_trace": "", "alloc_tracking": False},
+        "gc": {"mode": "scheduled", "freeze": True, "idle_fraction": 0.5, "max_pending": 20000},
+        "pools": {
+            "projectiles": 128,
+            "enemy_shots": 1024,
+            "particles": 160,
+            "grow": True,
+            "grow_factor": 1.5,
+            "grow_at": 0.75,
+            "max_scale": 4.0,
+        },
+        "bullets": {"backend": "auto"},
+        "collision": {"mode": "rect"},
+        "assets": {"theme_cache": 3, "prefetch_themes": True},
+        "scheduler": {"enabled": True, "budget_fraction": 0.5},
+        "barrages": {},
+        "telemetry": {"enabled": False, "capacity": 3600, "format": "jsonl", "dir": "telemetry"},
         "input": {
             "up": ["W", "UP", "GAMEPAD1_BUTTON_DPAD_UP"],
             "down": ["S", "DOWN", "GAMEPAD1_BUTTON_DPAD_DOWN"],
@@ -33,6 +56,8 @@ def default_config() -> dict[str, Any]:
             "fire_laser": ["U", "V", "GAMEPAD1_BUTTON_Y"],
             "fire_flame": ["I", "B", "GAMEPAD1_BUTTON_START"],
             "toggle_debug": "TAB",
+            "telemetry_dump": "F9",
+            "alloc_dump": "F10",
         },
         "player": {"max_life": 100, "invincible_frames": 60, "base_speed": 1.6, "max_speed": 3.2},
         "weapons": {
@@ -91,24 +116,79 @@ def default_config() -> dict[str, Any]:
                 },
             },
         },
+        "enemies": {
+            "drone": {"hp": 2, "score": 1, "speed": 1.4, "w": 12, "h": 8, "shoot_cooldown_frames": 60},
+            "fighter": {"hp": 3, "score": 1, "speed": 1.4, "w": 12, "h": 8, "shoot_cooldown_frames": 60},
+            "turret": {
+                "hp": 4,
+                "score": 2,
+                "speed": 1.4,
+                "w": 12,
+                "h": 8,
+                "shoot_cooldown_frames": 60,
+                "shot_speed": 2.4,
+                "shot_damage": 10,
+            },
+            "interceptor": {"hp": 1, "score": 1, "speed": 2.0, "w": 12, "h": 8, "shoot_cooldown_frames": 60},
+        },
         "items": {"drop_chance": 0.22, "heal_amount": 25, "power_amount": 1, "speed_amount": 0.2},
         "stage": {
             "scroll_speed": 1.2,
+            "spawn_mode": "stream",
+            "formation_chance": 0.12,
+            "formation_cooldown_frames": 120,
             "sections": [
-                {"name": "moon", "distance": 900, "spawn_rate": 0.06},
-                {"name": "space", "distance": 900, "spawn_rate": 0.08},
-                {"name": "planet1", "distance": 900, "spawn_rate": 0.10},
-                {"name": "planet2", "distance": 900, "spawn_rate": 0.12},
+                {
+                    "name": "moon",
+                    "distance": 900,
+                    "layers": ["far:0.3", "near:1.0"],
+                    "spawn_rate": 0.06,
+                    "spawns": ["drone:straight", "fighter:sine", "turret:stop_shoot"],
+                    "spawn_weights": [0.65, 0.23, 0.12],
+                    "formation": ["drone", "drone", "drone"],
+                },
+                {
+                    "name": "space",
+                    "distance": 900,
+                    "layers": ["far:0.3", "dust:0.6", "near:1.0"],
+                    "spawn_rate": 0.08,
+                    "spawns": ["fighter:sine", "drone:dash", "turret:stop_shoot"],
+                    "spawn_weights": [0.55, 0.25, 0.20],
+                    "formation": ["drone", "fighter", "drone"],
+                },
+                {
+                    "name": "planet1",
+                    "distance": 900,
+                    "layers": ["far:0.3", "near:1.0"],
+                    "spawn_rate": 0.10,
+                    "spawns": ["drone:wave", "fighter:sine", "turret:stop_shoot"],
+                    "spawn_weights": [0.45, 0.33, 0.22],
+                    "formation": ["drone", "fighter", "drone"],
+                },
+                {
+                    "name": "planet2",
+                    "distance": 900,
+                    "layers": ["far:0.3", "dust:0.6", "near:1.0"],
+                    "spawn_rate": 0.12,
+                    "spawns": ["drone:dash", "fighter:sine", "turret:stop_shoot", "interceptor:dash"],
+                    "spawn_weights": [0.35, 0.35, 0.30, 0.10],
+                    "formation": ["drone", "fighter", "drone"],
+                },
             ],
         },
     }
 
 
+class ConfigError(ValueError):
+    pass
+
+
 @dataclass(frozen=True)
 class ConfigResult:
     data: dict[str, Any]
     loaded_from: Path | None
     warnings: list[str]
+    from_cache: bool = False
 
 
 def _strip_toml_comment(line: str) -> str:
@@ -221,17 +301,330 @@ def parse_toml_minimal(text: str) -> dict[str, Any]:
     return root
 
 
-def load_config(path: str | Path = "config/game.toml") -> ConfigResult:
+@dataclass(frozen=True)
+class MapOf:
+    # table with free-form keys (e.g. input actions, enemy kinds)
+    item: Any
+
+
+@dataclass(frozen=True)
+class ListOf:
+    item: Any
+
+
+def _infer_schema(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _infer_schema(v) for k, v in value.items()}
+    if isinstance(value, list):
+        if value and all(isinstance(v, dict) for v in value):
+            merged: dict[str, Any] = {}
+            for v in value:
+                merged.update(_infer_schema(v))
+            return ListOf(merged)
+        return ListOf(_infer_schema(value[0]) if value else object)
+    return type(value)
+
+
+def config_schema() -> dict[str, Any]:
+    # Every key in default_config() is declared with the type of its default;
+    # open-ended tables are overridden below. All keys are optional.
+    schema = _infer_schema(default_config())
+    schema["input"] = MapOf((str, ListOf(str)))
+    enemy = dict(schema["enemies"]["drone"])
+    enemy.update(
+        {
+            "shot_speed": float,
+            "shot_damage": int,
+            "sprite": str,
+            "hitbox": ListOf(int),
+            "barrage": str,
+        }
+    )
+    schema["enemies"] = MapOf(enemy)
+    schema["stage"]["sections"].item["script"] = str
+    schema["barrages"] = MapOf(
+        {
+            "kind": str,
+            "count": int,
+            "speed": float,
+            "angle_deg": float,
+            "spread_deg": float,
+            "spin_deg": float,
+            "volleys": int,
+            "volley_interval": int,
+            "cooldown_frames": int,
+            "damage": int,
+            "lifetime": int,
+        }
+    )
+    return schema
+
+
+_TYPE_NAMES = {bool: "bool", int: "int", float: "float", str: "string", object: "value"}
+
+
+def _describe(spec: Any) -> str:
+    if isinstance(spec, tuple):
+        return " or ".join(_describe(s) for s in spec)
+    if isinstance(spec, ListOf):
+        return f"array of {_describe(spec.item)}"
+    if isinstance(spec, (dict, MapOf)):
+        return "table"
+    return _TYPE_NAMES.get(spec, getattr(spec, "__name__", str(spec)))
+
+
+def _matches(value: Any, spec: Any) -> bool:
+    if isinstance(spec, tuple):
+        return any(_matches(value, s) for s in spec)
+    if isinstance(spec, ListOf):
+        return isinstance(value, list) and all(_matches(v, spec.item) for v in value)
+    if isinstance(spec, (dict, MapOf)):
+        return isinstance(value, dict)
+    if spec is object:
+        return True
+    if spec is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if spec is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, spec)
+
+
+def _validate(value: Any, spec: Any, path: list[str | int], errors: list[tuple[list[str | int], str]]) -> None:
+    if isinstance(spec, dict):
+        if not isinstance(value, dict):
+            errors.append((path, f"expected table, got {type(value).__name__}"))
+            return
+        for key, sub in value.items():
+            if key not in spec:
+                errors.append((path + [key], "unknown key"))
+                continue
+            _validate(sub, spec[key], path + [key], errors)
+        return
+    if isinstance(spec, MapOf):
+        if not isinstance(value, dict):
+            errors.append((path, f"expected table, got {type(value).__name__}"))
+            return
+        for key, sub in value.items():
+            _validate(sub, spec.item, path + [key], errors)
+        return
+    if isinstance(spec, ListOf) and isinstance(spec.item, dict):
+        if not isinstance(value, list):
+            errors.append((path, f"expected array of tables, got {type(value).__name__}"))
+            return
+        for i, sub in enumerate(value):
+            _validate(sub, spec.item, path + [i], errors)
+        return
+    if not _matches(value, spec):
+        errors.append((path, f"expected {_describe(spec)}, got {type(value).__name__} ({value!r})"))
+
+
+def _format_path(path: list[str | int]) -> str:
+    out = ""
+    for part in path:
+        out += f"[{part}]" if isinstance(part, int) else (f".{part}" if out else str(part))
+    return out
+
+
+def _find_line(text: str, path: list[str | int]) -> int | None:
+    # Best-effort source line for an error path; only runs when validation fails.
+    target = [str(p) for p in path]
+    current: list[str] = []
+    array_counts: dict[str, int] = {}
+    for lineno, raw_line in enumerate(text.splitlines(), start=1):
+        line = _strip_toml_comment(raw_line).strip()
+        if not line:
+            continue
+        if line.startswith("[[") and line.endswith("]]"):
+            parts = [p.strip() for p in line[2:-2].split(".")]
+            name = ".".join(parts)
+            idx = array_counts.get(name, 0)
+            array_counts[name] = idx + 1
+            current = parts + [str(idx)]
+            if current == target:
+                return lineno
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            current = [p.strip() for p in line[1:-1].split(".")]
+            if current == target:
+                return lineno
+            continue
+        if "=" in line:
+            key = [p.strip().strip('"') for p in line.split("=", 1)[0].split(".")]
+            if current + key == target:
+                return lineno
+    if path and isinstance(path[-1], int):
+        return _find_line(text, path[:-1])  # array element: the line of its key
+    return None
+
+
+def _one_of(what: str, value: Any, names: Any) -> str:
+    return f"unknown {what} {value!r} (expected one of {', '.join(sorted(names)) or 'none'})"
+
+
+def _cross_check(data: dict[str, Any], errors: list[tuple[list[str | int], str]]) -> None:
+    # Values that name another entry or come from a fixed list; the schema
+    # only checks types. Runs on the merged config so defaults count as defined.
+    # Local imports: only cold parses get here, startup stays lean. What a wave
+    # script spawns is checked when GameScene is built (that runs the script).
+    from src.core.gcpolicy import GC_MODES
+    from src.core.names import BEHAVIOUR_NAMES, COLLISION_MODES, MOVE_PATTERNS, SPAWN_MODES, WAVE_NAMES, split_spec
+    from src.core.themes import LAYER_NAMES
+
+    cfg = _deep_merge(default_config(), data)
+    kinds = set(cfg.get("enemies", {}))
+    patterns = MOVE_PATTERNS + BEHAVIOUR_NAMES
+    barrages = set(cfg.get("barrages", {}))
+    for kind, enemy in cfg.get("enemies", {}).items():
+        barrage = enemy.get("barrage", "")
+        if barrage and barrage not in barrages:
+            errors.append((["enemies", kind, "barrage"], _one_of("barrage", barrage, barrages)))
+    named: tuple[tuple[list[str | int], str, Any, tuple[str, ...]], ...] = (
+        (["collision", "mode"], "collision mode", cfg.get("collision", {}).get("mode", "rect"), COLLISION_MODES),
+        (["gc", "mode"], "gc mode", cfg.get("gc", {}).get("mode", "scheduled"), GC_MODES),
+        (["stage", "spawn_mode"], "spawn mode", cfg.get("stage", {}).get("spawn_mode", "stream"), SPAWN_MODES),
+    )
+    for key_path, what, value, names in named:
+        if value not in names:
+            errors.append((key_path, _one_of(what, value, names)))
+
+    for i, sec in enumerate(cfg.get("stage", {}).get("sections", [])):
+        path: list[str | int] = ["stage", "sections", i]
+        for j, entry in enumerate(sec.get("spawns", [])):
+            kind, pattern = split_spec(entry)
+            if kind not in kinds:
+                errors.append((path + ["spawns", j], _one_of("enemy kind", kind, kinds)))
+            if pattern not in patterns:
+                errors.append((path + ["spawns", j], _one_of("pattern", pattern, patterns)))
+        for j, kind in enumerate(sec.get("formation", [])):
+            if kind not in kinds:
+                errors.append((path + ["formation", j], _one_of("enemy kind", kind, kinds)))
+        for j, entry in enumerate(sec.get("layers", [])):
+            name, _, speed = str(entry).partition(":")
+            if name.strip() not in LAYER_NAMES:
+                errors.append((path + ["layers", j], _one_of("layer", name.strip(), LAYER_NAMES)))
+            if speed.strip():
+                try:
+                    float(speed)
+                except ValueError:
+                    errors.append((path + ["layers", j], f"bad parallax factor {speed!r}"))
+        script = sec.get("script", "")
+        if script and script not in WAVE_NAMES:
+            errors.append((path + ["script"], _one_of("wave script", script, WAVE_NAMES)))
+
+
+def validate_config(data: dict[str, Any], text: str = "", source: str = "<config>") -> None:
+    errors: list[tuple[list[str | int], str]] = []
+    _validate(data, config_schema(), [], errors)
+    if not errors:
+        _cross_check(data, errors)
+    if not errors:
+        return
+    lines: list[str] = []
+    for path, message in errors:
+        lineno = _find_line(text, path) if text else None
+        where = f"{source}:{lineno}" if lineno is not None else source
+        lines.append(f"{where}: {_format_path(path)}: {message}")
+    raise ConfigError("invalid config:\n  " + "\n  ".join(lines))
+
+
+def parse_toml(text: str, source: str = "<config>") -> dict[str, Any]:
+    if tomllib is None:
+        return parse_toml_minimal(text)
+    try:
+        return tomllib.loads(text)
+    except tomllib.TOMLDecodeError as exc:
+        raise ConfigError(f"{source}: {exc}") from exc
+
+
+# Bump when the cached payload layout or the parse/validate rules change.
+_CACHE_VERSION = 2
+_memo: dict[Path, tuple[int, int, ConfigResult]] = {}
+
+
+def _defaults_fingerprint() -> str:
+    return hashlib.blake2b(repr(default_config()).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _cache_path(cfg_path: Path, cache_dir: Path | None) -> Path:
+    base = cache_dir if cache_dir is not None else cfg_path.parent / "__pycache__"
+    return base / f"{cfg_path.name}.cache"
+
+
+def _read_cache(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+        return None
+    return payload
+
+
+def _write_cache(path: Path, payload: dict[str, Any]) -> None:
+    # Best effort: read-only or in-memory filesystems (web build) just skip the cache.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(marshal.dumps(payload))
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def load_config(
+    path: str | Path = "config/game.toml",
+    *,
+    use_cache: bool = True,
+    cache_dir: str | Path | None = None,
+) -> ConfigResult:
     cfg_path = Path(path)
-    defaults = default_config()
     if not cfg_path.exists():
-        return ConfigResult(data=defaults, loaded_from=None, warnings=[f"config not found: {cfg_path}"])
+        return ConfigResult(data=default_config(), loaded_from=None, warnings=[f"config not found: {cfg_path}"])
 
-    try:
-        loaded = parse_toml_minimal(cfg_path.read_text(encoding="utf-8"))
-        if not isinstance(loaded, dict):
-            return ConfigResult(data=defaults, loaded_from=None, warnings=["invalid config; using defaults"])
-        merged = _deep_merge(defaults, loaded)
-        return ConfigResult(data=merged, loaded_from=cfg_path, warnings=[])
-    except Exception as exc:
-        return ConfigResult(data=defaults, loaded_from=None, warnings=[f"failed to load config; using defaults: {exc}"])
+    stat = cfg_path.stat()
+    if use_cache:
+        memo = _memo.get(cfg_path)
+        if memo is not None and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+
+    cache_file = _cache_path(cfg_path, Path(cache_dir) if cache_dir is not None else None)
+    payload = _read_cache(cache_file) if use_cache else None
+    defaults_fp = _defaults_fingerprint()
+    if payload is not None and payload.get("defaults") != defaults_fp:
+        payload = None
+
+    # Warm path 1: unchanged mtime/size -> no read, no parse.
+    if payload is not None and payload.get("mtime_ns") == stat.st_mtime_ns and payload.get("size") == stat.st_size:
+        result = ConfigResult(data=payload["data"], loaded_from=cfg_path, warnings=[], from_cache=True)
+        _memo[cfg_path] = (stat.st_mtime_ns, stat.st_size, result)
+        return result
+
+    raw = cfg_path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    # Warm path 2: touched but identical content -> refresh the stamp, still no parse.
+    if payload is not None and payload.get("digest") == digest:
+        data = payload["data"]
+        from_cache = True
+    else:
+        text = raw.decode("utf-8")
+        loaded = parse_toml(text, source=str(cfg_path))
+        validate_config(loaded, text=text, source=str(cfg_path))
+        data = _deep_merge(default_config(), loaded)
+        from_cache = False
+
+    if use_cache:
+        _write_cache(
+            cache_file,
+            {
+                "version": _CACHE_VERSION,
+                "defaults": defaults_fp,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "digest": digest,
+                "data": data,
+            },
+        )
+    result = ConfigResult(data=data, loaded_from=cfg_path, warnings=[], from_cache=from_cache)
+    if use_cache:
+        _memo[cfg_path] = (stat.st_mtime_ns, stat.st_size, result)
+    return result
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from random import Random
 from typing import Any
 
+from src.core.audio import SoundMixer
 from src.core.input import Input
+from src.core.rng import RngStreams
+from src.core.statehash import StateTraceWriter
 
 
 @dataclass
 class GameContext:
     config: dict[str, Any]
     input: Input
-    rng: Random
+    rng: RngStreams
     debug_enabled: bool
     assets: Any
+    audio: SoundMixer
+    trace: StateTraceWriter | None = None  # debug.state_trace: per-frame state hashes
+    skip_cosmetic: bool = False  # headless / fast-forward: no FX, particles or cosmetic rng
+    realtime: bool = True  # False in headless sims: nothing may depend on wall-clock time
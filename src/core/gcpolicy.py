@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import gc
+from time import perf_counter
+from typing import Any
+
+GC_MODES = ("auto", "scheduled")
+
+
+class GcPolicy:
+    # Keeps CPython's cyclic collector out of the middle of a frame.
+    # - freeze(): long-lived objects (assets, config, scene) move to the
+    #   permanent generation so collections never rescan them
+    # - "scheduled": automatic collection is off; young generations are
+    #   collected at the end of update() when the previous frame left enough
+    #   headroom, full collections only run at scene changes
+    # - "auto": CPython's own thresholds (pauses are still measured)
+    def __init__(
+        self,
+        mode: str = "scheduled",
+        freeze: bool = True,
+        fps: int = 60,
+        idle_fraction: float = 0.5,
+        max_pending: int = 20000,
+    ) -> None:
+        if mode not in GC_MODES:
+            raise ValueError(f"unknown gc mode: {mode}")
+        self.mode = mode
+        self.use_freeze = freeze
+        self.frame_ms = 1000.0 / max(1, fps)
+        self.idle_fraction = idle_fraction
+        self.max_pending = max_pending  # young objects allowed to pile up before collecting anyway
+        threshold0, threshold1, _ = gc.get_threshold()
+        self._min_pending = max(1, threshold0)  # same batch size automatic collection would use
+        self._gen1_every = max(1, threshold1)
+        self._young_runs = 0
+        self._t0 = 0.0
+        # pause stats; window_max_ms is the worst pause since the last scene change
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.window_max_ms = 0.0
+        self.collections = 0
+        self.total_ms = 0.0
+        gc.callbacks.append(self._on_gc)
+        if mode == "scheduled":
+            gc.disable()
+
+    @staticmethod
+    def from_config(cfg: dict[str, Any]) -> GcPolicy:
+        gc_cfg = cfg.get("gc", {})
+        return GcPolicy(
+            mode=str(gc_cfg.get("mode", "scheduled")),
+            freeze=bool(gc_cfg.get("freeze", True)),
+            fps=int(cfg.get("window", {}).get("fps", 60)),
+            idle_fraction=float(gc_cfg.get("idle_fraction", 0.5)),
+            max_pending=int(gc_cfg.get("max_pending", 20000)),
+        )
+
+    def _on_gc(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._t0 = perf_counter()
+            return
+        ms = (perf_counter() - self._t0) * 1000.0
+        self.last_ms = ms
+        self.max_ms = max(self.max_ms, ms)
+        self.window_max_ms = max(self.window_max_ms, ms)
+        self.collections += 1
+        self.total_ms += ms
+
+    def freeze(self) -> None:
+        # after Assets.load / a scene change: everything alive now is long-lived
+        if not self.use_freeze:
+            return
+        gc.collect()
+        gc.freeze()
+
+    def on_scene_change(self, old: Any, new: Any) -> None:
+        # The transition frame already hitches (new pools, theme), so do the
+        # full collection here; unfreeze first so cycles in the old scene go too.
+        if self.use_freeze:
+            gc.unfreeze()
+        gc.collect()
+        if self.use_freeze:
+            gc.freeze()
+        self._young_runs = 0
+        self.window_max_ms = 0.0
+
+    def end_frame(self, work_ms: float) -> None:
+        # work_ms: this update plus the last draw; the rest of the frame is idle
+        if self.mode != "scheduled":
+            return
+        pending = gc.get_count()[0]
+        if pending < self._min_pending:
+            return
+        if work_ms > self.frame_ms * self.idle_fraction and pending < self.max_pending:
+            return
+        self._young_runs += 1
+        gc.collect(1 if self._young_runs % self._gen1_every == 0 else 0)
+
+    def overlay_text(self) -> str:
+        return f"GC {self.last_ms:.2f}ms max {self.window_max_ms:.2f}ms n={self.collections}"
+
+    def close(self) -> None:
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        gc.enable()
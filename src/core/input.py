@@ -1,10 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Any, Iterable
 
 import pyxel
 
+# Built-in actions get fixed ids (bit positions) so game code can test bits
+# directly; extra actions from config are appended after these.
+ACTIONS = (
+    "up",
+    "down",
+    "left",
+    "right",
+    "confirm",
+    "back",
+    "pause",
+    "fire_cannon",
+    "fire_missile",
+    "fire_bomb",
+    "fire_laser",
+    "fire_flame",
+    "toggle_debug",
+)
+(
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+    CONFIRM,
+    BACK,
+    PAUSE,
+    FIRE_CANNON,
+    FIRE_MISSILE,
+    FIRE_BOMB,
+    FIRE_LASER,
+    FIRE_FLAME,
+    TOGGLE_DEBUG,
+) = (1 << i for i in range(len(ACTIONS)))
+
 
 def _keycode(name: str) -> int:
     normalized = name.strip().upper()
@@ -21,45 +53,113 @@ def _keycode(name: str) -> int:
     raise KeyError(f"unknown key name: {name}")
 
 
-@dataclass
 class InputState:
-    held: dict[str, bool]
-    pressed: dict[str, bool]
+    # Held / pressed actions as bitmasks; mutated in place every frame.
+    def __init__(self, action_bits: dict[str, int]) -> None:
+        self.held = 0
+        self.pressed = 0
+        self._bits = action_bits
+
+    def bit(self, action: str | int) -> int:
+        if isinstance(action, int):
+            return action
+        return self._bits.get(action, 0)
+
+    def is_held(self, action: str | int) -> bool:
+        return (self.held & self.bit(action)) != 0
+
+    def is_pressed(self, action: str | int) -> bool:
+        return (self.pressed & self.bit(action)) != 0
+
+
+class InputHistory:
+    # Fixed-size ring buffer of the last N frames of (held, pressed) bits.
+    def __init__(self, size: int) -> None:
+        self.size = max(1, size)
+        self._held = [0] * self.size
+        self._pressed = [0] * self.size
+        self._head = -1
+        self.count = 0
 
-    def is_held(self, action: str) -> bool:
-        return bool(self.held.get(action, False))
+    def push(self, held: int, pressed: int) -> None:
+        self._head = (self._head + 1) % self.size
+        self._held[self._head] = held
+        self._pressed[self._head] = pressed
+        if self.count < self.size:
+            self.count += 1
 
-    def is_pressed(self, action: str) -> bool:
-        return bool(self.pressed.get(action, False))
+    def held_at(self, frames_ago: int) -> int:
+        if frames_ago >= self.count:
+            return 0
+        return self._held[(self._head - frames_ago) % self.size]
+
+    def pressed_at(self, frames_ago: int) -> int:
+        if frames_ago >= self.count:
+            return 0
+        return self._pressed[(self._head - frames_ago) % self.size]
+
+    def held_frames(self, bits: int) -> int:
+        # consecutive frames (ending now) in which any of `bits` was held
+        n = 0
+        while n < self.count and (self._held[(self._head - n) % self.size] & bits):
+            n += 1
+        return n
 
 
 class Input:
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(self, config: dict[str, Any], history_frames: int = 120) -> None:
         mapping = dict(config.get("input", {}))
-        self._bindings: dict[str, list[int]] = {}
         self._warnings: list[str] = []
+        self.action_bits: dict[str, int] = {name: 1 << i for i, name in enumerate(ACTIONS)}
+        for action in mapping:
+            if action not in self.action_bits:
+                self.action_bits[action] = 1 << len(self.action_bits)
+
+        # Each physical key is polled once per frame and ORs in every action bound to it.
+        key_masks: dict[int, int] = {}
         for action, key_name in mapping.items():
-            codes: list[int] = []
             for spec in _iter_binding_specs(key_name):
                 try:
-                    codes.append(_keycode(str(spec)))
+                    code = _keycode(str(spec))
                 except Exception as exc:
                     self._warnings.append(f"invalid key for {action}: {spec} ({exc})")
-            if codes:
-                self._bindings[action] = codes
-        self.state = InputState(held={}, pressed={})
+                    continue
+                key_masks[code] = key_masks.get(code, 0) | self.action_bits[action]
+        self._keys = list(key_masks.keys())
+        self._key_masks = list(key_masks.values())
+        self._prev_keys = 0  # bit i = self._keys[i] was down last frame
+
+        self.state = InputState(self.action_bits)
+        self.history = InputHistory(history_frames)
 
     @property
     def warnings(self) -> list[str]:
         return list(self._warnings)
 
     def update(self) -> None:
-        held: dict[str, bool] = {}
-        pressed: dict[str, bool] = {}
-        for action, keys in self._bindings.items():
-            held[action] = any(pyxel.btn(key) for key in keys)
-            pressed[action] = any(pyxel.btnp(key) for key in keys)
-        self.state = InputState(held=held, pressed=pressed)
+        held = 0
+        pressed = 0
+        keys_down = 0
+        prev = self._prev_keys
+        masks = self._key_masks
+        btn = pyxel.btn
+        for i, key in enumerate(self._keys):
+            if btn(key):
+                keys_down |= 1 << i
+                held |= masks[i]
+                if not (prev >> i) & 1:
+                    pressed |= masks[i]
+        self._prev_keys = keys_down
+        self.state.held = held
+        self.state.pressed = pressed
+        self.history.push(held, pressed)
+
+    def feed(self, held: int) -> None:
+        # Scripted input (bots, replays, headless runs) instead of polling keys.
+        pressed = held & ~self.state.held
+        self.state.held = held
+        self.state.pressed = pressed
+        self.history.push(held, pressed)
 
 
 def _iter_binding_specs(value: Any) -> Iterable[str]:
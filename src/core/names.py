@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+# Names config values can take, for validating a config without importing
+# pyxel or the gameplay modules that use them (background layers:
+# themes.LAYER_NAMES, gc modes: gcpolicy.GC_MODES).
+
+COLLISION_MODES = ("rect", "mask")
+SPAWN_MODES = ("stream", "timeline")
+# patterns GameScene moves without a script
+MOVE_PATTERNS = ("straight", "dash", "sine", "wave", "formation")
+# keys of enemy_scripts.BEHAVIOURS (scripted patterns) and enemy_scripts.WAVES
+BEHAVIOUR_NAMES = ("stop_shoot", "hover")
+WAVE_NAMES = ("pincer", "gauntlet")
+
+
+def split_spec(raw: Any) -> tuple[str, str]:
+    # "kind:pattern" spawn table entry -> (kind, pattern)
+    kind, _, pattern = str(raw).strip().partition(":")
+    return kind.strip() or "drone", pattern.strip() or "straight"
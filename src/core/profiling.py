@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable
+
+
+class StartupProfiler:
+    def __init__(self, clock: Callable[[], float] = perf_counter, t0: float | None = None) -> None:
+        self._clock = clock
+        self._t0 = clock() if t0 is None else t0
+        self._last = self._t0
+        self.phases: list[tuple[str, float]] = []  # (name, ms)
+        self.finished = False
+
+    def mark(self, name: str) -> None:
+        # closes the phase that started at the previous mark
+        if self.finished:
+            return
+        now = self._clock()
+        self.phases.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    def finish(self) -> None:
+        if self.finished:
+            return
+        self.mark("first_frame")
+        self.finished = True
+
+    @property
+    def total_ms(self) -> float:
+        return sum(ms for _, ms in self.phases)
+
+    def report(self) -> str:
+        parts = " ".join(f"{name}={ms:.1f}ms" for name, ms in self.phases)
+        return f"startup: {parts} total={self.total_ms:.1f}ms"
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import os
+from array import array
+from random import Random
+from typing import Any
+
+# Gameplay streams: consuming one never shifts another, so e.g. a different
+# drop chance leaves the spawn sequence untouched.
+GAMEPLAY_STREAMS = ("spawn", "drops")
+# Visual-only randomness (laser / flame jitter). Skippable without changing gameplay.
+COSMETIC_STREAM = "cosmetic"
+
+
+class RngStreams:
+    # Independent named Random streams derived from one session seed.
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed = int.from_bytes(os.urandom(8), "little") if seed is None else seed
+        self._streams = {name: Random(f"{self.seed}:{name}") for name in (*GAMEPLAY_STREAMS, COSMETIC_STREAM)}
+        self.spawn = self._streams["spawn"]
+        self.drops = self._streams["drops"]
+        self.cosmetic = self._streams[COSMETIC_STREAM]
+
+    def stream(self, name: str) -> Random:
+        return self._streams[name]
+
+    def get_state(self, names: tuple[str, ...]) -> tuple[Any, ...]:
+        # Mersenne Twister state as raw uint32 bytes: half the size of the int
+        # tuple from getstate() and cheap to hash / diff
+        out = []
+        for name in names:
+            version, words, gauss = self._streams[name].getstate()
+            out.append((name, version, array("I", words).tobytes(), gauss))
+        return tuple(out)
+
+    def set_state(self, state: tuple[Any, ...]) -> None:
+        for name, version, words, gauss in state:
+            self._streams[name].setstate((version, tuple(array("I", words)), gauss))
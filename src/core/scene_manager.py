@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Protocol, TypeVar, cast
 
 
 class Scene(Protocol):
@@ -11,16 +11,44 @@ class Scene(Protocol):
     def draw(self) -> None: ...
 
 
+S = TypeVar("S", bound=Scene)
+
+
 @dataclass
 class SceneManager:
     scene: Scene
+    on_change: Optional[Callable[[Scene, Scene], None]] = None  # (old, new); telemetry / debug hooks
+    # one reusable instance per key (title, game, game over); see pooled()
+    _pool: dict[str, Scene] = field(default_factory=dict)
+    _prepare: list[Callable[[], None]] = field(default_factory=list)
 
     def change(self, next_scene: Scene) -> None:
-        self.scene.on_exit()
+        old = self.scene
+        old.on_exit()
         self.scene = next_scene
         self.scene.on_enter()
+        if self.on_change is not None:
+            self.on_change(old, next_scene)
+
+    def pooled(self, key: str, factory: Callable[[], S]) -> S:
+        # Returns the pooled scene for key, building it on first use. Callers
+        # reset() it in place instead of constructing a new one per transition.
+        scene = self._pool.get(key)
+        if scene is None:
+            scene = self._pool[key] = factory()
+        return cast(S, scene)
+
+    def prepare(self, job: Callable[[], None]) -> None:
+        # Work for a scene that is not active yet (e.g. resetting the game
+        # scene while the game-over screen shows); runs before the next update.
+        self._prepare.append(job)
 
     def update(self) -> None:
+        if self._prepare:
+            jobs = self._prepare[:]
+            self._prepare.clear()
+            for job in jobs:
+                job()
         self.scene.update()
 
     def draw(self) -> None:
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable
+
+
+@dataclass
+class ScheduledTask:
+    name: str
+    fn: Callable[[], Any]
+    every: int  # period in frames; 0 = one-shot (defer())
+    max_delay: int  # frames a due run may wait for budget before it runs anyway
+    cost_ms: float  # estimate, replaced by a moving average of measured runs
+    phase: int = 0
+    next_due: int = 0
+    runs: int = 0
+    deferred: int = 0  # frames spent due but waiting for budget
+    last_ms: float = 0.0
+    done: bool = False  # finished one-shot
+
+    def deadline(self) -> int:
+        return self.next_due + self.max_delay
+
+
+class FrameScheduler:
+    # Periodic and deferrable per-frame work (list compaction, FX refreshes,
+    # pre-rendering the next section's background). Due frames sit on a fixed
+    # grid (frame % every == phase) so they do not depend on when a task last
+    # ran; save states and rewind need no scheduler state.
+    # - budgeted (realtime): due tasks run while their estimated cost fits in
+    #   what is left of budget_fraction of the frame after update + draw;
+    #   anything past its max_delay runs regardless
+    # - fixed (headless sims, scheduler.enabled = false): every task runs on
+    #   its due frame, so runs are reproducible
+    def __init__(self, fps: int = 60, budget_fraction: float = 0.5, budgeted: bool = True) -> None:
+        self.frame_ms = 1000.0 / max(1, fps)
+        self.budget_fraction = budget_fraction
+        self.budgeted = budgeted
+        self._tasks: list[ScheduledTask] = []
+        self._frame = 0
+        self.last_spent_ms = 0.0
+        self.last_waiting = 0
+
+    @staticmethod
+    def from_config(cfg: dict[str, Any], realtime: bool = True) -> FrameScheduler:
+        sched = cfg.get("scheduler", {})
+        return FrameScheduler(
+            fps=int(cfg.get("window", {}).get("fps", 60)),
+            budget_fraction=float(sched.get("budget_fraction", 0.5)),
+            budgeted=realtime and bool(sched.get("enabled", True)),
+        )
+
+    def every(
+        self, name: str, fn: Callable[[], Any], frames: int, max_delay: int = 0, cost_ms: float = 0.05
+    ) -> ScheduledTask:
+        frames = max(1, frames)
+        # staggered by registration order so periods do not line up on one tick
+        task = ScheduledTask(name, fn, frames, max(0, max_delay), cost_ms, phase=len(self._tasks) % frames)
+        task.next_due = self._grid_after(task, self._frame)
+        self._tasks.append(task)
+        return task
+
+    def defer(self, name: str, fn: Callable[[], Any], max_delay: int, cost_ms: float = 1.0) -> ScheduledTask:
+        # One-shot work that can happen any time in the next max_delay frames;
+        # replaces a pending one-shot of the same name.
+        self._tasks = [t for t in self._tasks if not (t.every == 0 and t.name == name)]
+        task = ScheduledTask(name, fn, 0, max(0, max_delay), cost_ms, next_due=self._frame + 1)
+        self._tasks.append(task)
+        return task
+
+    def cancel(self, name: str) -> None:
+        self._tasks = [t for t in self._tasks if t.name != name]
+
+    def pending(self, name: str) -> bool:
+        return any(t.every == 0 and t.name == name and not t.done for t in self._tasks)
+
+    def reset(self, frame: int) -> None:
+        # after a restart / set_state: pending one-shots are dropped (their
+        # owner re-queues them), periodic tasks realign to the grid
+        self._tasks = [t for t in self._tasks if t.every > 0]
+        self._frame = frame
+        for task in self._tasks:
+            task.next_due = self._grid_after(task, frame)
+
+    def _grid_after(self, task: ScheduledTask, frame: int) -> int:
+        # first frame > frame with frame % every == phase
+        nxt = frame + 1
+        return nxt + (task.phase - nxt) % task.every
+
+    def run(self, frame: int, work_ms: float) -> None:
+        # work_ms: this frame's update so far plus the last draw
+        self._frame = frame
+        left = self.frame_ms * self.budget_fraction - work_ms
+        spent = 0.0
+        waiting = 0
+        done = False
+        for overdue_pass in (True, False):
+            for task in self._tasks:
+                if frame < task.next_due or task.done:
+                    continue
+                overdue = not self.budgeted or frame >= task.deadline()
+                if overdue != overdue_pass:
+                    continue
+                if not overdue and spent + task.cost_ms > left:
+                    task.deferred += 1
+                    waiting += 1
+                    continue
+                spent += self._run_task(task)
+                if task.every == 0:
+                    task.done = done = True
+                else:
+                    task.next_due = self._grid_after(task, frame)
+        if done:
+            self._tasks = [t for t in self._tasks if not t.done]
+        self.last_spent_ms = spent
+        self.last_waiting = waiting
+
+    def _run_task(self, task: ScheduledTask) -> float:
+        t0 = perf_counter()
+        task.fn()
+        ms = (perf_counter() - t0) * 1000.0
+        task.last_ms = ms
+        task.cost_ms = ms if task.runs == 0 else task.cost_ms * 0.8 + ms * 0.2
+        task.runs += 1
+        return ms
+
+    def overlay_text(self) -> str:
+        return f"TASKS {self.last_spent_ms:.2f}ms waiting={self.last_waiting} n={len(self._tasks)}"
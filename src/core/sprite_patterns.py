@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+# ASCII shapes ("*" = pixel) of every sprite that takes part in collision.
+# Assets paints them into the image bank; src.systems.masks turns the same
+# data into collision masks, so headless runs (no pyxel) collide identically.
+
+SHIP_PATTERN = [
+    "     **        ",
+    "    ****       ",
+    "   ******      ",
+    "***********    ",
+    "************** ",
+    "***********    ",
+    "   ******      ",
+    "    ****       ",
+    "     **        ",
+    "               ",
+    "   *      *    ",
+    "    *    *     ",
+    "     *  *      ",
+    "      **       ",
+    "               ",
+    "               ",
+]
+
+ENEMY_PATTERN = [
+    "    ****    ",
+    "   ******   ",
+    "************",
+    "************",
+    "************",
+    "  ********  ",
+    "   ******   ",
+    "    ****    ",
+]
+
+SHIP_NAMES = ("propeller", "jet", "fighter", "ufo")
+ENEMY_SPRITES = ("drone", "fighter", "turret", "interceptor")
+
+SHOT_PATTERNS: dict[str, list[str]] = {
+    "cannon": ["**", "**"],
+    "missile": [" ** ", "****", " ** "],
+    "bomb": [
+        "  ****  ",
+        " ****** ",
+        "********",
+        "********",
+        "********",
+        "********",
+        " ****** ",
+        "  ****  ",
+    ],
+}
+
+ITEM_PATTERNS: dict[str, list[str]] = {
+    "heal": [" ** ", "****", "****", " ** "],
+    "power": ["****", "*  *", "*  *", "****"],
+    "speed": [" ** ", "*** ", " ** ", " ***"],
+}
+
+
+def collision_patterns() -> dict[str, list[str]]:
+    # keyed like Assets.sprites
+    out: dict[str, list[str]] = {}
+    for name in SHIP_NAMES:
+        out[f"ship:{name}"] = SHIP_PATTERN
+    for name in ENEMY_SPRITES:
+        out[f"enemy:{name}"] = ENEMY_PATTERN
+    for kind, pattern in SHOT_PATTERNS.items():
+        out[f"shot:{kind}"] = pattern
+    for kind, pattern in ITEM_PATTERNS.items():
+        out[f"item:{kind}"] = pattern
+    return out
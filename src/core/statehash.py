@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import marshal
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Protocol
+
+# Trace file: header, then one fixed-size record per GameScene.update():
+#   frame, rolling hash, one crc32 per subsystem (all uint32, little endian)
+# The rolling hash chains every record in the file (across retries too), so two
+# traces agree on it only if they agreed on every earlier record.
+_MAGIC = b"STRC"
+_VERSION = 1
+
+
+class _HasState(Protocol):
+    frame: int
+
+    def get_state(self) -> dict[str, Any]: ...
+
+
+def hash_state(state: dict[str, Any]) -> tuple[list[str], list[int]]:
+    # marshal format 2 is canonical (no refs / interning flags), see sim.savestate
+    names = list(state)
+    return names, [zlib.crc32(marshal.dumps(state[name], 2)) for name in names]
+
+
+class StateTraceWriter:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._f: IO[bytes] | None = None
+        self._names: list[str] = []
+        self._record: struct.Struct | None = None
+        self._rolling = 0
+        self.records = 0
+
+    def record(self, scene: _HasState) -> None:
+        names, hashes = hash_state(scene.get_state())
+        if self._f is None:
+            self._open(names)
+        elif names != self._names:
+            raise ValueError(f"state subsystems changed mid-trace: {names} != {self._names}")
+        frame = scene.frame
+        self._rolling = zlib.crc32(struct.pack(f"<{len(hashes)}I", *hashes), self._rolling)
+        assert self._f is not None and self._record is not None
+        self._f.write(self._record.pack(frame, self._rolling, *hashes))
+        self.records += 1
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def _open(self, names: list[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._names = names
+        self._record = struct.Struct(f"<{2 + len(names)}I")
+        header = "\0".join(names).encode("utf-8")
+        f = self.path.open("wb")
+        f.write(_MAGIC + struct.pack("<HHI", _VERSION, len(names), len(header)) + header)
+        self._f = f
+
+
+@dataclass
+class StateTrace:
+    names: list[str]
+    frames: list[int]
+    rolling: list[int]
+    hashes: list[tuple[int, ...]]
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+def read_trace(path: str | Path) -> StateTrace:
+    data = Path(path).read_bytes()
+    if data[:4] != _MAGIC:
+        raise ValueError(f"{path}: not a state trace")
+    version, count, header_len = struct.unpack_from("<HHI", data, 4)
+    if version != _VERSION:
+        raise ValueError(f"{path}: trace version {version} != {_VERSION}")
+    offset = 4 + 8
+    names = data[offset : offset + header_len].decode("utf-8").split("\0") if count else []
+    offset += header_len
+    record = struct.Struct(f"<{2 + count}I")
+    usable = (len(data) - offset) // record.size * record.size  # ignore a torn last record
+    trace = StateTrace(names=names, frames=[], rolling=[], hashes=[])
+    for values in record.iter_unpack(data[offset : offset + usable]):
+        trace.frames.append(values[0])
+        trace.rolling.append(values[1])
+        trace.hashes.append(values[2:])
+    return trace
+
+
+@dataclass
+class Divergence:
+    index: int  # record index (frames are per session, so they can repeat)
+    frame: int
+    subsystems: list[str]
+
+
+def first_divergence(a: StateTrace, b: StateTrace, ignore: tuple[str, ...] = ()) -> Divergence | None:
+    if a.names != b.names:
+        raise ValueError(f"traces record different subsystems: {a.names} != {b.names}")
+    n = min(len(a), len(b))
+    if ignore:
+        # the rolling hash covers every subsystem, so compare the kept ones record by record
+        keep = [i for i, name in enumerate(a.names) if name not in ignore]
+        for index in range(n):
+            ha, hb = a.hashes[index], b.hashes[index]
+            differing = [a.names[i] for i in keep if ha[i] != hb[i]]
+            if differing or a.frames[index] != b.frames[index]:
+                return Divergence(index=index, frame=a.frames[index], subsystems=differing or ["<frame>"])
+        if len(a) == len(b):
+            return None
+        return Divergence(index=n, frame=(a.frames if len(a) > n else b.frames)[n], subsystems=["<length>"])
+    # rolling hashes only ever disagree from the first divergence on, so the
+    # first mismatch can be found by bisection
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a.rolling[mid] == b.rolling[mid] and a.frames[mid] == b.frames[mid]:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo >= n:
+        if len(a) == len(b):
+            return None
+        return Divergence(index=n, frame=(a.frames if len(a) > n else b.frames)[n], subsystems=["<length>"])
+    differing = [name for name, x, y in zip(a.names, a.hashes[lo], b.hashes[lo]) if x != y]
+    return Divergence(index=lo, frame=a.frames[lo], subsystems=differing or ["<frame>"])
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import atexit
+import json
+import queue
+import struct
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+import pyxel
+
+# (name, array typecode) per column; one value per frame
+COLUMNS = (
+    ("frame", "I"),
+    ("update_ms", "f"),
+    ("draw_ms", "f"),
+    ("enemies", "H"),
+    ("projectiles", "H"),
+    ("enemy_shots", "H"),
+    ("particles", "H"),
+    ("items", "H"),
+    ("blits", "I"),
+    ("section", "b"),  # index into stage sections, -1 outside GameScene
+    ("weapon_level", "H"),
+    ("weapons", "B"),  # WEAPON_* bits
+)
+WEAPON_LASER = 1
+WEAPON_LASER_CHARGING = 2
+WEAPON_FLAME = 4
+
+_BIN_MAGIC = b"TLM1"
+
+
+class _BlitCounter:
+    # Wraps pyxel.blt / pyxel.bltm while telemetry is on; every draw call in
+    # the game goes through the pyxel module attribute, so this sees them all.
+    def __init__(self) -> None:
+        self.count = 0
+        self._blt = pyxel.blt
+        self._bltm = pyxel.bltm
+
+        def blt(*args: Any, **kwargs: Any) -> Any:
+            self.count += 1
+            return self._blt(*args, **kwargs)
+
+        def bltm(*args: Any, **kwargs: Any) -> Any:
+            self.count += 1
+            return self._bltm(*args, **kwargs)
+
+        pyxel.blt = blt
+        pyxel.bltm = bltm
+
+    def take(self) -> int:
+        n = self.count
+        self.count = 0
+        return n
+
+
+class TelemetryRecorder:
+    # Fixed-size columnar ring buffer of per-frame records. flush() copies the
+    # ring out (a few array slices) and hands it to a background writer thread,
+    # so the frame never waits on disk I/O.
+    def __init__(self, capacity: int = 3600, out_dir: str | Path = "telemetry", fmt: str = "jsonl") -> None:
+        if fmt not in ("jsonl", "bin"):
+            raise ValueError(f"unknown telemetry format: {fmt}")
+        self.capacity = max(1, capacity)
+        self.out_dir = Path(out_dir)
+        self.fmt = fmt
+        self._columns: dict[str, array[Any]] = {name: array(code, [0] * self.capacity) for name, code in COLUMNS}
+        self._head = 0  # next slot to write
+        self._count = 0
+        self._flushes = 0
+        self._sections: list[str] = []
+        self._ended: Any = None  # GameScene left during this frame's update; flushed after its record
+        self._blits = _BlitCounter()
+        self._queue: queue.Queue[tuple[Path, dict[str, array], dict[str, Any]] | None] = queue.Queue()
+        self._thread: threading.Thread | None = threading.Thread(
+            target=self._writer, name="telemetry-writer", daemon=True
+        )
+        try:
+            self._thread.start()
+        except RuntimeError:  # no threads (browser build): write inline
+            self._thread = None
+        atexit.register(self.close)
+        self.last_path: Path | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, frame: int, update_ms: float, draw_ms: float, scene: Any) -> None:
+        if self._ended is not None:
+            # the frame a run ended in belongs to it (the manager has already
+            # switched to the next scene)
+            scene = self._ended
+        i = self._head
+        c = self._columns
+        c["frame"][i] = frame
+        c["update_ms"][i] = update_ms
+        c["draw_ms"][i] = draw_ms
+        c["blits"][i] = self._blits.take()
+        sample = getattr(scene, "telemetry_sample", None)
+        if sample is None:
+            c["enemies"][i] = c["projectiles"][i] = c["enemy_shots"][i] = c["particles"][i] = c["items"][i] = 0
+            c["section"][i] = -1
+            c["weapon_level"][i] = c["weapons"][i] = 0
+        else:
+            (
+                c["enemies"][i],
+                c["projectiles"][i],
+                c["enemy_shots"][i],
+                c["particles"][i],
+                c["items"][i],
+                c["section"][i],
+                c["weapon_level"][i],
+                c["weapons"][i],
+            ) = sample()
+            self._sections = scene.stage_section_names
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        if self._ended is not None:
+            self._ended = None
+            self.flush("run")
+
+    def on_scene_change(self, old: Any, new: Any) -> None:
+        # leaving a GameScene (game over, back to title) ends a run: it is
+        # written out once this frame is recorded
+        if hasattr(old, "telemetry_sample"):
+            self._ended = old
+
+    def flush(self, reason: str = "manual") -> Path | None:
+        if self._count == 0:
+            return None
+        n = self._count
+        start = (self._head - n) % self.capacity
+        snapshot: dict[str, array] = {}
+        for name, col in self._columns.items():
+            if start + n <= self.capacity:
+                snapshot[name] = col[start : start + n]
+            else:
+                snapshot[name] = col[start:] + col[: self._head]
+        self._count = 0
+        self._flushes += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = self.out_dir / f"telemetry-{stamp}-{self._flushes:03d}-{reason}.{self.fmt}"
+        meta = {"reason": reason, "frames": n, "sections": list(self._sections)}
+        if self._thread is None:
+            _write(path, snapshot, meta)
+        else:
+            self._queue.put((path, snapshot, meta))
+        self.last_path = path
+        return path
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5.0)
+
+    def _writer(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            _write(*job)
+
+
+def _write(path: Path, columns: dict[str, array], meta: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".bin":
+            _write_bin(path, columns, meta)
+        else:
+            _write_jsonl(path, columns, meta)
+    except OSError as exc:
+        print(f"telemetry: failed to write {path}: {exc}")
+
+
+def _write_jsonl(path: Path, columns: dict[str, array], meta: dict[str, Any]) -> None:
+    names = list(columns)
+    sections = meta["sections"]
+    with path.open("w", encoding="utf-8") as f:
+        f.write(json.dumps({"meta": meta}) + "\n")
+        for row in zip(*(columns[name] for name in names)):
+            rec = dict(zip(names, row))
+            rec["update_ms"] = round(rec["update_ms"], 3)
+            rec["draw_ms"] = round(rec["draw_ms"], 3)
+            s = rec["section"]
+            rec["section"] = sections[s] if 0 <= s < len(sections) else None
+            f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+
+
+def _write_bin(path: Path, columns: dict[str, array], meta: dict[str, Any]) -> None:
+    # magic, u32 header length, JSON header (meta + column layout), then each
+    # column's raw array bytes (native byte order) back to back
+    header = dict(meta)
+    header["columns"] = [[name, col.typecode] for name, col in columns.items()]
+    blob = json.dumps(header).encode("utf-8")
+    with path.open("wb") as f:
+        f.write(_BIN_MAGIC + struct.pack("<I", len(blob)) + blob)
+        for col in columns.values():
+            f.write(col.tobytes())
+
+
+def read_bin(path: str | Path) -> tuple[dict[str, Any], dict[str, array]]:
+    data = Path(path).read_bytes()
+    if data[:4] != _BIN_MAGIC:
+        raise ValueError(f"{path}: not a telemetry file")
+    (size,) = struct.unpack_from("<I", data, 4)
+    header = json.loads(data[8 : 8 + size])
+    offset = 8 + size
+    columns: dict[str, array] = {}
+    for name, code in header["columns"]:
+        col = array(code)
+        nbytes = col.itemsize * header["frames"]
+        col.frombytes(data[offset : offset + nbytes])
+        offset += nbytes
+        columns[name] = col
+    return header, columns
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+# background layers every theme provides, back to front
+LAYER_NAMES = ("far", "dust", "near")
+
+
+class ThemeCache:
+    # Built stage themes (tile index maps), least recently used first, at most
+    # `capacity` kept. prefetch() builds a theme on a worker thread so the
+    # section change that needs it finds it ready; get() builds synchronously
+    # on a miss and waits for an in-flight prefetch instead of building twice.
+    # Only the tile data is built off-thread: rendering it into pyxel images
+    # stays on the main thread (Assets.apply_theme).
+    def __init__(self, build: Callable[[str], Any], capacity: int = 3, prefetch: bool = True) -> None:
+        self._build = build
+        self.capacity = max(2, capacity)  # the theme on screen + the one being prefetched
+        self._themes: OrderedDict[str, Any] = OrderedDict()
+        self._pending: set[str] = set()
+        self._ready = threading.Condition()
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._use_thread = prefetch
+        self._thread: threading.Thread | None = None
+        # hits / synchronous builds / background builds / LRU drops
+        self.hits = 0
+        self.misses = 0  # built synchronously on the main thread
+        self.prefetched = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._themes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._themes
+
+    def get(self, name: str) -> Any:
+        with self._ready:
+            while name in self._pending:
+                self._ready.wait()
+            theme = self._themes.get(name)
+            if theme is not None:
+                self._themes.move_to_end(name)
+                self.hits += 1
+                return theme
+        theme = self._build(name)
+        with self._ready:
+            self.misses += 1
+            self._store(name, theme)
+        return theme
+
+    def prefetch(self, name: str) -> None:
+        if not self._start():
+            return
+        with self._ready:
+            if name in self._themes or name in self._pending:
+                return
+            self._pending.add(name)
+        self._queue.put(name)
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5.0)
+
+    def _start(self) -> bool:
+        # worker starts with the first prefetch, not at startup
+        if self._thread is not None:
+            return True
+        if not self._use_thread:
+            return False
+        thread = threading.Thread(target=self._worker, name="theme-builder", daemon=True)
+        try:
+            thread.start()
+        except RuntimeError:  # no threads (browser build): themes build on first use
+            self._use_thread = False
+            return False
+        self._thread = thread
+        atexit.register(self.close)
+        return True
+
+    def _store(self, name: str, theme: Any) -> None:
+        self._themes[name] = theme
+        self._themes.move_to_end(name)
+        while len(self._themes) > self.capacity:
+            self._themes.popitem(last=False)
+            self.evicted += 1
+
+    def _worker(self) -> None:
+        while True:
+            name = self._queue.get()
+            if name is None:
+                return
+            try:
+                theme = self._build(name)
+            except Exception as exc:  # get() rebuilds on the main thread and raises there
+                print(f"themes: prefetch of {name!r} failed: {exc}")
+                theme = None
+            with self._ready:
+                self._pending.discard(name)
+                if theme is not None:
+                    self.prefetched += 1
+                    self._store(name, theme)
+                self._ready.notify_all()
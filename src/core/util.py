@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from math import cos, radians, sin
 from typing import TypeVar
 
 T = TypeVar("T", int, float)
@@ -22,3 +23,12 @@ def approach(value: float, target: float, delta: float) -> float:
 def lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
+
+# Degree-based trig (same convention as pyxel.sin/cos) that works without a
+# pyxel window, so headless simulation and the game produce identical floats.
+def sin_deg(deg: float) -> float:
+    return sin(radians(deg))
+
+
+def cos_deg(deg: float) -> float:
+    return cos(radians(deg))
@@ -1,25 +1,105 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from src.core.types import Rect, Vec2
 
 
+@dataclass(frozen=True)
+class EnemyArchetype:
+    # Shared, immutable per-kind data. Enemy instances only point at one of these.
+    index: int
+    kind: str
+    hp: int
+    score: int
+    w: int
+    h: int
+    speed: float
+    shoot_cooldown: int
+    shot_speed: float
+    shot_damage: int
+    barrage: str  # [barrages] pattern name; "" = one straight shot per cooldown
+    sprite_key: str
+    hit_x: int
+    hit_y: int
+    hit_w: int
+    hit_h: int
+
+
+class EnemyArchetypeTable:
+    def __init__(self, archetypes: list[EnemyArchetype]) -> None:
+        if not archetypes:
+            raise ValueError("at least one enemy archetype is required")
+        self.archetypes: tuple[EnemyArchetype, ...] = tuple(archetypes)
+        self._by_kind = {a.kind: a for a in archetypes}
+
+    def __len__(self) -> int:
+        return len(self.archetypes)
+
+    def __getitem__(self, index: int) -> EnemyArchetype:
+        return self.archetypes[index]
+
+    def get(self, kind: str) -> EnemyArchetype:
+        arch = self._by_kind.get(kind)
+        if arch is None:
+            raise ValueError(f"unknown enemy kind: {kind}")
+        return arch
+
+    @staticmethod
+    def from_config(config: dict[str, Any]) -> EnemyArchetypeTable:
+        out: list[EnemyArchetype] = []
+        for kind, raw in config.get("enemies", {}).items():
+            if not isinstance(raw, dict):
+                continue
+            w = int(raw.get("w", 12))
+            h = int(raw.get("h", 8))
+            hitbox = raw.get("hitbox")
+            if isinstance(hitbox, list) and len(hitbox) == 4:
+                hit_x, hit_y, hit_w, hit_h = (int(v) for v in hitbox)
+            else:
+                hit_x, hit_y, hit_w, hit_h = 0, 0, w, h
+            out.append(
+                EnemyArchetype(
+                    index=len(out),
+                    kind=str(kind),
+                    hp=int(raw.get("hp", 2)),
+                    score=int(raw.get("score", 1)),
+                    w=w,
+                    h=h,
+                    speed=float(raw.get("speed", 1.4)),
+                    shoot_cooldown=int(raw.get("shoot_cooldown_frames", 60)),
+                    shot_speed=float(raw.get("shot_speed", 2.4)),
+                    shot_damage=int(raw.get("shot_damage", 10)),
+                    barrage=str(raw.get("barrage", "")),
+                    sprite_key=f"enemy:{raw.get('sprite', kind)}",
+                    hit_x=hit_x,
+                    hit_y=hit_y,
+                    hit_w=hit_w,
+                    hit_h=hit_h,
+                )
+            )
+        return EnemyArchetypeTable(out)
+
+
 @dataclass
 class Enemy:
     active: bool
-    kind: str
+    arch: EnemyArchetype
     pos: Vec2
-    vel: Vec2
     hp: int
     timer: int
     pattern: str
-    w: int
-    h: int
-    score: int
     shoot_cooldown: int = 0
+    volleys_fired: int = 0  # drives burst position and spiral rotation
     burn_timer: int = 0
     burn_tick: int = 0
+    move_mul: float = 1.0  # speed multiplier set by behaviour scripts
+
+    @property
+    def kind(self) -> str:
+        return self.arch.kind
 
     def rect(self) -> Rect:
-        return Rect(self.pos.x, self.pos.y, self.w, self.h)
+        a = self.arch
+        return Rect(self.pos.x + a.hit_x, self.pos.y + a.hit_y, a.hit_w, a.hit_h)
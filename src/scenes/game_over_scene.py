@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any, Callable
 
 import pyxel
 
 from src.core.context import GameContext
+from src.core.input import BACK, CONFIRM
+from src.ui.static_layer import StaticLayer
 
 
 class GameOverScene:
@@ -13,6 +15,14 @@ class GameOverScene:
         self._kills = kills
         self._on_retry = on_retry
         self._on_title = on_title
+        window = ctx.config.get("window", {})
+        # nothing on this screen changes while it is up; kills only between visits
+        self._static = StaticLayer(int(window.get("width", 256)), int(window.get("height", 144)), self._paint_static)
+
+    def reset(self, kills: int) -> None:
+        if kills != self._kills:
+            self._kills = kills
+            self._static.invalidate()
 
     def on_enter(self) -> None:
         pass
@@ -22,18 +32,21 @@ class GameOverScene:
 
     def update(self) -> None:
         inp = self._ctx.input.state
-        if inp.is_pressed("confirm"):
-            pyxel.play(0, 1)
+        if inp.is_pressed(CONFIRM):
+            self._ctx.audio.play(1)
             self._on_retry()
-        if inp.is_pressed("back"):
-            pyxel.play(0, 0)
+        if inp.is_pressed(BACK):
+            self._ctx.audio.play(0)
             self._on_title()
 
-    def draw(self) -> None:
-        pyxel.cls(0)
+    def _paint_static(self, target: Any) -> None:
         font = self._ctx.assets.font
-        if font is None:
+        font.draw(92, 44, "GAME OVER", target)
+        font.draw(84, 68, f"KILLS:{self._kills}", target)
+        font.draw(56, 104, "J:RETRY  O:TITLE", target)
+
+    def draw(self) -> None:
+        if self._ctx.assets.font is None:
+            pyxel.cls(0)
             return
-        font.draw(92, 44, "GAME OVER")
-        font.draw(84, 68, f"KILLS:{self._kills}")
-        font.draw(56, 104, "J:RETRY  O:TITLE")
+        self._static.draw()
@@ -1,24 +1,42 @@
 from __future__ import annotations
 
+from math import ceil
+from time import perf_counter
 from typing import Any, Callable
 
 import pyxel
 
 from src.core.context import GameContext
+from src.core.input import DOWN, FIRE_BOMB, FIRE_CANNON, FIRE_FLAME, FIRE_LASER, FIRE_MISSILE, LEFT, RIGHT, UP, InputState
+from src.core.names import COLLISION_MODES, MOVE_PATTERNS
+from src.core.rng import COSMETIC_STREAM, GAMEPLAY_STREAMS
+from src.core.scheduler import FrameScheduler
+from src.core.telemetry import WEAPON_FLAME, WEAPON_LASER, WEAPON_LASER_CHARGING
 from src.core.types import Vec2
-from src.core.util import lerp
+from src.core.util import cos_deg, lerp, sin_deg
 from src.entities.effects import Particle
-from src.entities.enemy import Enemy
+from src.entities.enemy import Enemy, EnemyArchetypeTable
 from src.entities.item import Item
 from src.entities.player import Player
 from src.entities.projectile import FlameStream, LaserBeam, Projectile
+from src.systems.barrage import BarrageTable, single_shot
+from src.systems.bullets import make_bullet_store
 from src.systems.collision import aabb
 from src.systems.drop_table import roll_drop
+from src.systems.enemy_scripts import BEHAVIOURS, WAVES, Fire, Move, Spawn, wave_spawns
+from src.systems.events import EnemyKilled, EventQueue, ExplosionRequested, ItemDropped, PlayerHit
+from src.systems.masks import CollisionMask, masked_hit
+from src.systems.pools import PoolPolicy, PoolStats, grow_pool
+from src.systems.scripting import Script, ScriptRunner
 from src.systems.spawner import Spawner
 from src.systems.stage import Stage
 from src.ui.hud import HUD
 
 
+# get_state() entries that only affect drawing (skipped with ctx.skip_cosmetic)
+COSMETIC_STATE = ("particles", "fx")
+
+
 class GameScene:
     def __init__(self, ctx: GameContext, selected_ship: str, on_game_over: Callable[[int], None]) -> None:
         self._ctx = ctx
@@ -27,55 +45,141 @@ class GameScene:
         self._w = int(window.get("width", 256))
         self._h = int(window.get("height", 144))
 
-        self.stage = Stage(ctx.config, ctx.assets)
+        ctx.assets.load_gameplay()
+        # periodic / deferrable work, run at the end of update() within the frame budget
+        self.tasks = FrameScheduler.from_config(ctx.config, realtime=ctx.realtime)
+        self._draw_ms = 0.0
+        self.stage = Stage(ctx.config, ctx.assets, self.tasks)
         self.player = Player.from_config(ctx.config, ship=selected_ship, start_x=24, start_y=self._h // 2 - 8)
         self.kills = 0
+        self.frame = 0
+        # damage dealt per weapon (balance reports / telemetry)
+        self.damage_dealt: dict[str, int] = dict.fromkeys(("cannon", "missile", "bomb", "laser", "flame", "burn"), 0)
 
         self.enemies: list[Enemy] = []
+        self.events = EventQueue()
         self.items: list[Item] = []
-        self.spawner = Spawner(ctx.rng, self._w, self._h)
+        stage_cfg = ctx.config.get("stage", {})
+        self.archetypes = EnemyArchetypeTable.from_config(ctx.config)
+        # a typo in a spawn table fails here, not when that entry is first rolled
+        for section in self.stage.sections:
+            for spec in section.spawn_table.specs + section.spawn_table.formation:
+                self.archetypes.get(spec.kind)
+        self.spawner = Spawner(
+            ctx.rng.spawn,
+            self._w,
+            self._h,
+            self.archetypes,
+            mode=str(stage_cfg.get("spawn_mode", "stream")),
+            formation_chance=float(stage_cfg.get("formation_chance", 0.12)),
+            formation_cooldown=int(stage_cfg.get("formation_cooldown_frames", 120)),
+        )
+        # enemy behaviours (by spawn pattern) and section wave scripts
+        self.scripts = ScriptRunner({**BEHAVIOURS, **WAVES}, self._script_act, self._script_eta)
+        for section in self.stage.sections:
+            if not section.script:
+                continue
+            if section.script not in WAVES:
+                raise ValueError(f"unknown wave script: {section.script}")
+            for spawn in wave_spawns(section.script, self._w, self._h):
+                # an unknown kind or pattern fails here, not mid-wave
+                self.archetypes.get(spawn.kind)
+                if spawn.pattern not in MOVE_PATTERNS and spawn.pattern not in BEHAVIOURS:
+                    raise ValueError(f"{section.script} spawns unknown pattern: {spawn.pattern}")
+        self._begin_section()
         self.hud = HUD(ctx.assets, self._w)
 
+        pools = ctx.config.get("pools", {})
+        self.pool_policy = PoolPolicy.from_config(ctx.config)
         self.projectiles: list[Projectile] = [
-            Projectile(
-                active=False,
-                kind="cannon",
-                owner="player",
-                pos=Vec2(0.0, 0.0),
-                vel=Vec2(0.0, 0.0),
-                w=2,
-                h=2,
-                damage=1,
-                lifetime=0,
-            )
-            for _ in range(128)
+            _new_shot("cannon", "player", 1) for _ in range(int(pools.get("projectiles", 128)))
         ]
-        self.enemy_shots: list[Projectile] = [
-            Projectile(
-                active=False,
-                kind="enemy",
-                owner="enemy",
-                pos=Vec2(0.0, 0.0),
-                vel=Vec2(0.0, 0.0),
-                w=2,
-                h=2,
-                damage=10,
-                lifetime=0,
-            )
-            for _ in range(64)
-        ]
-        self.laser = LaserBeam(
+        # enemy fire: columnar store (numpy when available), patterns from [barrages]
+        self.bullets = make_bullet_store(
+            int(pools.get("enemy_shots", 1024)), str(ctx.config.get("bullets", {}).get("backend", "auto"))
+        )
+        barrages = BarrageTable.from_config(ctx.config)
+        self._barrages = tuple(
+            barrages.get(a.barrage) if a.barrage else single_shot(a.shot_speed, a.shot_damage, a.shoot_cooldown)
+            for a in self.archetypes.archetypes
+        )
+        collision_mode = str(ctx.config.get("collision", {}).get("mode", "rect"))
+        if collision_mode not in COLLISION_MODES:
+            raise ValueError(f"unknown collision mode: {collision_mode}")
+        # "mask": pixel test after each rect hit; None keeps plain rects
+        self._masks = ctx.assets.masks if collision_mode == "mask" else None
+        self._enemy_masks: tuple[CollisionMask | None, ...] = tuple(
+            self._masks.hitbox(a.sprite_key, a.hit_x, a.hit_y, a.hit_w, a.hit_h) if self._masks else None
+            for a in self.archetypes.archetypes
+        )
+        self.laser = self._new_laser()
+        self.flame = self._new_flame()
+        self.particles: list[Particle] = [_new_particle() for _ in range(int(pools.get("particles", 160)))]
+        self.pool_stats: dict[str, PoolStats] = {
+            "projectiles": self.pool_policy.new_stats(len(self.projectiles)),
+            "enemy_shots": self.pool_policy.new_stats(self.bullets.capacity),
+            "particles": self.pool_policy.new_stats(len(self.particles)),
+        }
+        self._laser_charging = False
+        self._laser_charge_frames = 0
+        self._laser_fx: list[tuple[int, int, int]] = []  # (dy, variant, branch_dir)
+        self._laser_charge_sfx_timer = 0
+        self._flame_fx: list[tuple[int, int]] = []  # (dy, variant)
+        self._flame_charge_frames = 0
+        # dead enemies / items only cost iteration until compacted, so that can wait
+        self.tasks.every("cleanup", self._compact_entities, 45, max_delay=45)
+        self.tasks.every("laser_fx", self._refresh_laser_fx, 3, max_delay=1)
+        self.tasks.every("flame_fx", self._refresh_flame_fx, 2, max_delay=1)
+
+    def reset(self, selected_ship: str, on_game_over: Callable[[int], None] | None = None) -> None:
+        # Warm restart (retry): pools, stage, archetypes, HUD and the applied
+        # theme are reused in place; only run state goes back to the start.
+        if on_game_over is not None:
+            self._on_game_over = on_game_over
+        if self.frame == 0 and self.player.ship == selected_ship:
+            return  # fresh, or already reset while the game-over screen was up
+        self.player = Player.from_config(self._ctx.config, ship=selected_ship, start_x=24, start_y=self._h // 2 - 8)
+        self.kills = 0
+        self.frame = 0
+        for key in self.damage_dealt:
+            self.damage_dealt[key] = 0
+        self.enemies.clear()
+        self.items.clear()
+        self.events.take()
+        self.bullets.clear()
+        self.scripts.clear()
+        # before the stage, which re-queues its next-section one-shot
+        self.tasks.reset(0)
+        self.stage.reset()
+        self._begin_section()
+        for _, pool in self._pools():
+            for obj in pool:
+                obj.active = False
+        self.laser = self._new_laser()
+        self.flame = self._new_flame()
+        self._laser_charging = False
+        self._laser_charge_frames = 0
+        self._laser_fx.clear()
+        self._laser_charge_sfx_timer = 0
+        self._flame_fx.clear()
+        self._flame_charge_frames = 0
+
+    def _new_laser(self) -> LaserBeam:
+        laser = self._ctx.config.get("weapons", {}).get("laser", {})
+        return LaserBeam(
             active=False,
             x=0.0,
             y=0.0,
-            length=int(ctx.config.get("weapons", {}).get("laser", {}).get("beam_length", 140)),
-            width=int(ctx.config.get("weapons", {}).get("laser", {}).get("beam_width", 4)),
-            damage=int(ctx.config.get("weapons", {}).get("laser", {}).get("damage", 1)),
+            length=int(laser.get("beam_length", 140)),
+            width=int(laser.get("beam_width", 4)),
+            damage=int(laser.get("damage", 1)),
             duration=0,
-            tick_interval=int(ctx.config.get("weapons", {}).get("laser", {}).get("tick_interval_frames", 6)),
+            tick_interval=int(laser.get("tick_interval_frames", 6)),
         )
-        flame_cfg = ctx.config.get("weapons", {}).get("flame", {})
-        self.flame = FlameStream(
+
+    def _new_flame(self) -> FlameStream:
+        flame_cfg = self._ctx.config.get("weapons", {}).get("flame", {})
+        return FlameStream(
             active=False,
             x=0.0,
             y=0.0,
@@ -84,41 +188,36 @@ class GameScene:
             damage=int(flame_cfg.get("damage", 1)),
             tick_interval=int(flame_cfg.get("tick_interval_frames", 3)),
         )
-        self.particles: list[Particle] = [
-            Particle(active=False, pos=Vec2(0.0, 0.0), vel=Vec2(0.0, 0.0), lifetime=0) for _ in range(160)
-        ]
-        self._cleanup_tick = 0
-        self._laser_charging = False
-        self._laser_charge_frames = 0
-        self._laser_fx: list[tuple[int, int, int]] = []  # (dy, variant, branch_dir)
-        self._laser_fx_refresh = 0
-        self._laser_charge_sfx_timer = 0
-        self._flame_fx: list[tuple[int, int]] = []  # (dy, variant)
-        self._flame_fx_refresh = 0
-        self._flame_charge_frames = 0
 
     def on_enter(self) -> None:
         pass
 
     def on_exit(self) -> None:
-        pyxel.stop(1)
-        pyxel.stop(2)
+        self._ctx.audio.stop("charge")
+        self._ctx.audio.stop("flame")
 
     def update(self) -> None:
+        t0 = perf_counter()
         inp = self._ctx.input.state
+        self.frame += 1
         self.player.step_cooldowns()
-        self.stage.update()
+        if self.stage.update():
+            self._begin_section()
 
         # Move player
-        dx = (1 if inp.is_held("right") else 0) - (1 if inp.is_held("left") else 0)
-        dy = (1 if inp.is_held("down") else 0) - (1 if inp.is_held("up") else 0)
+        held = inp.held
+        dx = (1 if held & RIGHT else 0) - (1 if held & LEFT else 0)
+        dy = (1 if held & DOWN else 0) - (1 if held & UP else 0)
         self.player.pos.x = float(self.player.pos.x + dx * self.player.speed)
         self.player.pos.y = float(self.player.pos.y + dy * self.player.speed)
         self.player.pos.x = float(max(0, min(self._w - self.player.w, self.player.pos.x)))
         self.player.pos.y = float(max(0, min(self._h - self.player.h, self.player.pos.y)))
 
         # Spawn enemies
-        self.spawner.update(self.stage.current_section().spawn_rate, self.enemies, self.stage.current_section().name)
+        n = len(self.enemies)
+        self.spawner.update(self.enemies)
+        for i in range(n, len(self.enemies)):
+            self._start_behaviour(self.enemies[i])
 
         # Shooting
         self._update_player_shooting(inp)
@@ -137,23 +236,67 @@ class GameScene:
         # Update items
         self._update_items()
 
-        # Update particles
-        self._update_particles()
+        # Update particles (visual only)
+        if not self._ctx.skip_cosmetic:
+            self._update_particles()
 
         # Collisions
         self._handle_collisions()
 
-        self._cleanup_tick += 1
-        if self._cleanup_tick >= 45:
-            self._cleanup_tick = 0
-            self.enemies = [e for e in self.enemies if e.active]
-            self.items = [it for it in self.items if it.active]
+        # Kills, drops, hits and explosions queued above
+        self._drain_events()
+
+        self.tasks.run(self.frame, (perf_counter() - t0) * 1000.0 + self._draw_ms)
+        self._grow_pools()
+
+        if self._ctx.trace is not None:
+            self._ctx.trace.record(self)
 
         if self.player.life <= 0:
-            pyxel.play(0, 8)
+            self._ctx.audio.play(8)
             self._on_game_over(self.kills)
 
+    def _compact_entities(self) -> None:
+        self.enemies = [e for e in self.enemies if e.active]
+        self.items = [it for it in self.items if it.active]
+        self.scripts.prune()
+
+    def _begin_section(self) -> None:
+        section = self.stage.current_section()
+        self.spawner.begin_section(section, self.stage.section_frames())
+        if section.script:
+            self.scripts.start(section.script, (self._w, self._h), None, self.frame)
+
+    def _start_behaviour(self, e: Enemy) -> None:
+        if e.pattern in BEHAVIOURS:
+            self.scripts.start(e.pattern, (e.shoot_cooldown, self._w, self._h), e, self.frame)
+
+    def _script_act(self, script: Script, cmd: Any) -> int:
+        # runs a command a script yielded; returns the frames it then sleeps
+        e = script.actor
+        if isinstance(cmd, Move):
+            e.move_mul = cmd.mul
+            return 0
+        if isinstance(cmd, Fire):
+            self._fire_barrage(e)
+            return max(1, e.shoot_cooldown)
+        if isinstance(cmd, Spawn):
+            enemy = self.spawner.create(cmd.kind, cmd.pattern, cmd.x, cmd.y)
+            self.enemies.append(enemy)
+            script.children.append(enemy)
+            self._start_behaviour(enemy)
+            return 0
+        raise ValueError(f"{script.name}: unknown script command {cmd!r}")
+
+    def _script_eta(self, e: Enemy, x: float) -> int:
+        # frames until e can reach x at its current speed (burning only slows it)
+        if e.pos.x <= x:
+            return 0
+        step = e.arch.speed * e.move_mul
+        return max(1, ceil((e.pos.x - x) / step)) if step > 0 else 1
+
     def draw(self) -> None:
+        t0 = perf_counter()
         self.stage.draw_background(self._w, self._h)
         self._draw_entities()
         self.hud.draw(self.player.life, self.player.max_life, self.kills, self.player.weapon_level, self.player.speed)
@@ -161,18 +304,23 @@ class GameScene:
             # Debug only: simple outlines using Pyxel primitives are allowed
             pr = self.player.rect()
             pyxel.rectb(int(pr.x), int(pr.y), int(pr.w), int(pr.h), 8)
+            pyxel.text(1, self._h - 21, self.pool_overlay_text(), 7)
+            pyxel.text(1, self._h - 28, self.tasks.overlay_text(), 7)
+            pyxel.text(1, self._h - 35, self.scripts.overlay_text(), 7)
+        self._draw_ms = (perf_counter() - t0) * 1000.0
 
-    def _update_player_shooting(self, inp: Any) -> None:
+    def _update_player_shooting(self, inp: InputState) -> None:
         weapons = self._ctx.config.get("weapons", {})
         level = self.player.weapon_level
+        held = inp.held
 
-        if inp.is_held("fire_cannon") and self.player.cooldown_cannon == 0:
+        if held & FIRE_CANNON and self.player.cooldown_cannon == 0:
             cannon = weapons.get("cannon", {})
             cooldown = int(cannon.get("cooldown_frames", 8))
             speed = float(cannon.get("speed", 4.0))
             damage = int(cannon.get("damage", 1))
             self.player.cooldown_cannon = max(1, cooldown - (level - 1))
-            pyxel.play(0, 2)
+            self._ctx.audio.play(2)
             for i in range(min(1 + (level - 1) // 2, 3)):
                 dy = (-1 + i) * 1.2 if i > 0 else 0.0
                 self._spawn_projectile(
@@ -188,13 +336,13 @@ class GameScene:
                     lifetime=60,
                 )
 
-        if inp.is_held("fire_missile") and self.player.cooldown_missile == 0:
+        if held & FIRE_MISSILE and self.player.cooldown_missile == 0:
             missile = weapons.get("missile", {})
             base_cd = int(missile.get("cooldown_frames", 18))
             reduction = int(missile.get("cooldown_reduction_per_level", 2))
             min_cd = int(missile.get("min_cooldown_frames", 8))
             self.player.cooldown_missile = max(min_cd, base_cd - (level - 1) * reduction)
-            pyxel.play(0, 3)
+            self._ctx.audio.play(3)
             self._spawn_projectile(
                 kind="missile",
                 owner="player",
@@ -208,10 +356,10 @@ class GameScene:
                 lifetime=120,
             )
 
-        if inp.is_held("fire_bomb") and self.player.cooldown_bomb == 0:
+        if held & FIRE_BOMB and self.player.cooldown_bomb == 0:
             bomb = weapons.get("bomb", {})
             self.player.cooldown_bomb = int(bomb.get("cooldown_frames", 28))
-            pyxel.play(0, 4)
+            self._ctx.audio.play(4)
             base_radius = int(bomb.get("radius", 18))
             radius_inc = int(bomb.get("radius_increase_per_level", 3))
             max_radius = int(bomb.get("max_radius", 36))
@@ -234,7 +382,7 @@ class GameScene:
                 radius=radius,
             )
 
-        laser_held = bool(inp.is_held("fire_laser"))
+        laser_held = bool(held & FIRE_LASER)
         if not self.laser.active and self.player.cooldown_laser == 0:
             if laser_held:
                 if not self._laser_charging:
@@ -249,10 +397,10 @@ class GameScene:
                     ratio = self._laser_charge_frames / max(1, max_frames)
                     tier_count = 6
                     tier = min(tier_count - 1, int(ratio * (tier_count - 1)))
-                    pyxel.play(1, 9 + tier)
+                    self._ctx.audio.play(9 + tier, tag="charge")
                     self._laser_charge_sfx_timer = int(lerp(10, 3, ratio))
             elif self._laser_charging:
-                pyxel.stop(1)
+                self._ctx.audio.stop("charge")
                 self._fire_laser(level)
                 self._laser_charging = False
                 self._laser_charge_frames = 0
@@ -260,17 +408,17 @@ class GameScene:
         else:
             # Cancel charge if laser can't be fired right now.
             if self._laser_charging:
-                pyxel.stop(1)
+                self._ctx.audio.stop("charge")
             self._laser_charging = False
             self._laser_charge_frames = 0
             self._laser_charge_sfx_timer = 0
 
         # Flame thrower (B)
-        flame_held = bool(inp.is_held("fire_flame"))
+        flame_held = bool(held & FIRE_FLAME)
         if flame_held and not self.laser.active:
             if not self.flame.active:
                 self.flame.active = True
-                pyxel.play(2, 15, loop=True)
+                self._ctx.audio.loop("flame", 15)
             flame_cfg = weapons.get("flame", {})
             base_len = int(flame_cfg.get("range", 70))
             base_w = int(flame_cfg.get("width", 16))
@@ -303,14 +451,14 @@ class GameScene:
         else:
             if self.flame.active:
                 self.flame.active = False
-                pyxel.stop(2)
+                self._ctx.audio.stop("flame")
             self._flame_charge_frames = 0
 
     def _fire_laser(self, level: int) -> None:
         weapons = self._ctx.config.get("weapons", {})
         laser = weapons.get("laser", {})
         self.player.cooldown_laser = int(laser.get("cooldown_frames", 40))
-        pyxel.play(0, 5)
+        self._ctx.audio.play(5)
         self.laser.active = True
         self.laser.x = self.player.pos.x + 14
         self.laser.y = self.player.pos.y + 8
@@ -359,27 +507,24 @@ class GameScene:
                 continue
             e.timer += 1
             speed_mul = burn_speed_mul if e.burn_timer > 0 else 1.0
+            vx = -e.arch.speed
             if e.pattern == "straight":
-                e.pos.x += e.vel.x * speed_mul
+                e.pos.x += vx * speed_mul
             elif e.pattern == "dash":
-                e.pos.x += e.vel.x * 1.8 * speed_mul
+                e.pos.x += vx * 1.8 * speed_mul
             elif e.pattern in ("sine", "wave"):
-                e.pos.x += e.vel.x * speed_mul
-                e.pos.y += (pyxel.sin(e.timer * 4) * 0.5) * speed_mul
-            elif e.pattern == "stop_shoot":
-                if e.timer < 40:
-                    e.pos.x += e.vel.x * speed_mul
-                else:
-                    e.pos.x += e.vel.x * 0.3 * speed_mul
-                    e.shoot_cooldown = max(0, e.shoot_cooldown - 1)
-                    if e.shoot_cooldown == 0:
-                        e.shoot_cooldown = 60
-                        self._spawn_enemy_shot(x=e.pos.x, y=e.pos.y + 3, vx=-2.4, vy=0.0, damage=10, lifetime=120)
+                e.pos.x += vx * speed_mul
+                e.pos.y += (sin_deg(e.timer * 4) * 0.5) * speed_mul
             elif e.pattern == "formation":
-                e.pos.x += e.vel.x * 1.2 * speed_mul
+                e.pos.x += vx * 1.2 * speed_mul
+            elif e.pattern in BEHAVIOURS:
+                # speed and firing come from the behaviour script
+                e.pos.x += vx * e.move_mul * speed_mul
 
             if e.pos.x < -24 or e.pos.y < -24 or e.pos.y > self._h + 24:
                 e.active = False
+        # only the scripts that are due this frame run
+        self.scripts.update(self.frame)
 
     def _update_projectiles(self) -> None:
         missile_turn = float(self._ctx.config.get("weapons", {}).get("missile", {}).get("turn_rate", 0.12))
@@ -395,7 +540,7 @@ class GameScene:
                 continue
 
             if p.kind == "missile":
-                target = self._nearest_enemy(p.pos.x, p.pos.y)
+                target = self.nearest_enemy(p.pos.x, p.pos.y)
                 if target is not None:
                     dx = (target.pos.x - p.pos.x)
                     dy = (target.pos.y - p.pos.y)
@@ -409,7 +554,7 @@ class GameScene:
                         speed = p.vel.length()
                         p.vel = Vec2(steer.x * speed, steer.y * speed)
             elif p.kind == "bomb" and self.player.bomb_homing:
-                target = self._nearest_enemy(p.pos.x, p.pos.y)
+                target = self.nearest_enemy(p.pos.x, p.pos.y)
                 if target is not None:
                     dx = (target.pos.x - p.pos.x)
                     dy = (target.pos.y - p.pos.y)
@@ -428,17 +573,7 @@ class GameScene:
             if p.pos.x > self._w + 24 or p.pos.y < -24 or p.pos.y > self._h + 24:
                 p.active = False
 
-        for p in self.enemy_shots:
-            if not p.active:
-                continue
-            p.lifetime -= 1
-            if p.lifetime <= 0:
-                p.active = False
-                continue
-            p.pos.x += p.vel.x
-            p.pos.y += p.vel.y
-            if p.pos.x < -24:
-                p.active = False
+        self.bullets.update(self._w, self._h)
 
     def _update_laser(self) -> None:
         if not self.laser.active:
@@ -446,17 +581,23 @@ class GameScene:
             return
         self.laser.x = self.player.pos.x + 14
         self.laser.y = self.player.pos.y + 8
-        self._update_laser_fx()
+        if not self._ctx.skip_cosmetic:
+            self._update_laser_fx()
         if self.laser.can_tick():
             self.laser.consume_tick()
             beam_rect = self.laser.rect()
+            masks = self._masks
             for e in self.enemies:
                 if not e.active:
                     continue
-                if aabb(beam_rect, e.rect()):
+                er = e.rect()
+                if aabb(beam_rect, er) and (
+                    masks is None or masked_hit(None, beam_rect, self._enemy_masks[e.arch.index], er)
+                ):
                     e.hp -= self.laser.damage
+                    self.damage_dealt["laser"] += self.laser.damage
                     if e.hp <= 0:
-                        self._kill_enemy(e)
+                        self._kill_enemy(e, "laser")
         self.laser.step()
 
     def _update_flame(self) -> None:
@@ -469,29 +610,39 @@ class GameScene:
         if self.flame.can_tick():
             self.flame.consume_tick()
             flame_rect = self.flame.rect()
+            masks = self._masks
             for e in self.enemies:
                 if not e.active:
                     continue
-                if aabb(flame_rect, e.rect()):
+                er = e.rect()
+                if aabb(flame_rect, er) and (
+                    masks is None or masked_hit(None, flame_rect, self._enemy_masks[e.arch.index], er)
+                ):
                     e.hp -= self.flame.damage
+                    self.damage_dealt["flame"] += self.flame.damage
                     self._ignite_enemy(e)
                     if e.hp <= 0:
-                        self._kill_enemy(e)
+                        self._kill_enemy(e, "flame")
         self.flame.step()
+        if not self._ctx.skip_cosmetic:
+            self._update_flame_fx()
 
+    def _update_flame_fx(self) -> None:
         seg_w = 8
         count = max(1, (int(self.flame.length) + seg_w - 1) // seg_w)
         if len(self._flame_fx) != count:
             self._flame_fx = [(0, 0) for _ in range(count)]
-            self._flame_fx_refresh = 0
-        self._flame_fx_refresh = max(0, self._flame_fx_refresh - 1)
-        if self._flame_fx_refresh == 0:
-            self._flame_fx_refresh = 2
-            amp = max(1, int(self.flame.width) // 3)
-            for i in range(count):
-                dy = self._ctx.rng.randint(-amp, amp)
-                variant = self._ctx.rng.randint(0, 1)
-                self._flame_fx[i] = (dy, variant)
+            self._refresh_flame_fx()
+
+    def _refresh_flame_fx(self) -> None:
+        if not self._flame_fx:
+            return
+        amp = max(1, int(self.flame.width) // 3)
+        rng = self._ctx.rng.cosmetic
+        for i in range(len(self._flame_fx)):
+            dy = rng.randint(-amp, amp)
+            variant = rng.randint(0, 1)
+            self._flame_fx[i] = (dy, variant)
 
     def _ignite_enemy(self, e: Enemy) -> None:
         flame_cfg = self._ctx.config.get("weapons", {}).get("flame", {})
@@ -521,8 +672,9 @@ class GameScene:
                 continue
             e.burn_tick = tick_interval
             e.hp -= burn_damage
+            self.damage_dealt["burn"] += burn_damage
             if e.hp <= 0:
-                self._kill_enemy(e)
+                self._kill_enemy(e, "burn")
                 continue
             for other in self.enemies:
                 if not other.active or other.burn_timer > 0:
@@ -534,23 +686,23 @@ class GameScene:
                     other.burn_tick = tick_interval
 
     def _update_laser_fx(self) -> None:
+        # a new beam gets its jitter now; the "laser_fx" task refreshes it after that
         seg_w = 8
         count = max(1, (int(self.laser.length) + seg_w - 1) // seg_w)
         if len(self._laser_fx) != count:
             self._laser_fx = [(0, 0, 0) for _ in range(count)]
-            self._laser_fx_refresh = 0
+            self._refresh_laser_fx()
 
-        self._laser_fx_refresh = max(0, self._laser_fx_refresh - 1)
-        if self._laser_fx_refresh > 0:
+    def _refresh_laser_fx(self) -> None:
+        if not self._laser_fx:
             return
-        self._laser_fx_refresh = 3
-
         amp = max(1, int(self.laser.width))
-        for i in range(count):
-            dy = self._ctx.rng.randint(-amp, amp)
-            variant = self._ctx.rng.randint(0, 1)
+        rng = self._ctx.rng.cosmetic
+        for i in range(len(self._laser_fx)):
+            dy = rng.randint(-amp, amp)
+            variant = rng.randint(0, 1)
             branch_dir = 0
-            if self._ctx.rng.random() < 0.20:
+            if rng.random() < 0.20:
                 branch_dir = -1 if (i % 2 == 0) else 1
             self._laser_fx[i] = (dy, variant, branch_dir)
 
@@ -576,26 +728,29 @@ class GameScene:
 
     def _handle_collisions(self) -> None:
         pr = self.player.rect()
+        masks = self._masks
+        enemy_masks = self._enemy_masks
+        pm = None
+        if masks is not None:
+            pl = self.player
+            pm = masks.hitbox(f"ship:{pl.ship}", int(pr.x - pl.pos.x), int(pr.y - pl.pos.y), int(pr.w), int(pr.h))
 
         # player vs enemies
         inv_frames = int(self._ctx.config.get("player", {}).get("invincible_frames", 60))
         for e in self.enemies:
             if not e.active:
                 continue
-            if aabb(pr, e.rect()):
+            er = e.rect()
+            if aabb(pr, er) and (masks is None or masked_hit(pm, pr, enemy_masks[e.arch.index], er)):
                 if self.player.apply_damage(20, inv_frames):
-                    self._spawn_explosion(self.player.pos.x + 8, self.player.pos.y + 8, 6)
+                    self.events.push(PlayerHit(20, self.player.pos.x + 8, self.player.pos.y + 8))
                 e.hp = 0
-                self._kill_enemy(e)
+                self._kill_enemy(e, "collision")
 
         # player vs enemy bullets
-        for p in self.enemy_shots:
-            if not p.active:
-                continue
-            if aabb(pr, p.rect()):
-                if self.player.apply_damage(p.damage, inv_frames):
-                    self._spawn_explosion(self.player.pos.x + 8, self.player.pos.y + 8, 6)
-                p.active = False
+        damage = self.bullets.collide(pr.x, pr.y, pr.w, pr.h, pm)
+        if damage is not None and self.player.apply_damage(damage, inv_frames):
+            self.events.push(PlayerHit(damage, self.player.pos.x + 8, self.player.pos.y + 8))
 
         # player bullets vs enemies
         for p in self.projectiles:
@@ -606,7 +761,7 @@ class GameScene:
                 for e in self.enemies:
                     if not e.active:
                         continue
-                    if aabb(p.rect(), e.rect()):
+                    if self._shot_hits(p, e):
                         self._explode_bomb(p)
                         p.active = False
                         break
@@ -615,26 +770,40 @@ class GameScene:
             for e in self.enemies:
                 if not e.active:
                     continue
-                if aabb(p.rect(), e.rect()):
+                if self._shot_hits(p, e):
                     e.hp -= p.damage
+                    self.damage_dealt[p.kind] = self.damage_dealt.get(p.kind, 0) + p.damage
                     p.active = False
                     if e.hp <= 0:
-                        self._kill_enemy(e)
+                        self._kill_enemy(e, p.kind)
                     break
 
         # items pickup
         for it in self.items:
             if not it.active:
                 continue
-            if aabb(pr, it.rect()):
+            ir = it.rect()
+            if aabb(pr, ir) and (
+                masks is None or masked_hit(pm, pr, masks.hitbox(f"item:{it.kind}", 0, 0, it.w, it.h), ir)
+            ):
                 self._apply_item(it.kind)
                 it.active = False
 
+    def _shot_hits(self, p: Projectile, e: Enemy) -> bool:
+        sr = p.rect()
+        er = e.rect()
+        if not aabb(sr, er):
+            return False
+        masks = self._masks
+        if masks is None:
+            return True
+        return masked_hit(masks.hitbox(f"shot:{p.kind}", 0, 0, p.w, p.h), sr, self._enemy_masks[e.arch.index], er)
+
     def _apply_item(self, kind: str) -> None:
         items = self._ctx.config.get("items", {})
         if kind == "heal":
             self.player.heal(int(items.get("heal_amount", 25)))
-            pyxel.play(0, 7)
+            self._ctx.audio.play(7)
         elif kind == "power":
             self.player.power_up(int(items.get("power_amount", 1)), int(self._ctx.config.get("weapons", {}).get("max_level", 5)))
             self.player.laser_maxed = True
@@ -642,38 +811,60 @@ class GameScene:
             self.player.bomb_homing = True
             self.player.bomb_big = True
             self.player.flame_upgraded = True
-            pyxel.play(0, 7)
+            self._ctx.audio.play(7)
         elif kind == "speed":
             self.player.speed_up(float(items.get("speed_amount", 0.2)))
-            pyxel.play(0, 7)
+            self._ctx.audio.play(7)
 
-    def _kill_enemy(self, e: Enemy) -> None:
+    def _kill_enemy(self, e: Enemy, cause: str) -> None:
+        # Called from hot loops: deactivate now (no double kills), everything
+        # else happens when the event queue is drained.
         if not e.active:
             return
         e.active = False
-        self.kills += e.score
-        pyxel.play(0, 6)
-        self._spawn_explosion(e.pos.x + e.w / 2, e.pos.y + e.h / 2, 5)
-        drop_kind = roll_drop(self._ctx.rng, float(self._ctx.config.get("items", {}).get("drop_chance", 0.22)))
-        if drop_kind is not None:
-            self.items.append(
-                Item(
-                    active=True,
-                    kind=drop_kind,
-                    pos=Vec2(e.pos.x, e.pos.y),
-                    vel=Vec2(-0.8, 0.2),
-                    w=4,
-                    h=4,
-                    lifetime=360,
-                )
-            )
+        self.events.push(EnemyKilled(e, cause))
+
+    def _drain_events(self) -> None:
+        drop_chance = float(self._ctx.config.get("items", {}).get("drop_chance", 0.22))
+        explosions: list[ExplosionRequested] = []
+        while self.events:
+            batch = self.events.take()
+            for ev in batch:
+                if type(ev) is EnemyKilled:
+                    e = ev.enemy
+                    self.kills += e.arch.score
+                    self.events.push(ExplosionRequested(e.pos.x + e.arch.w / 2, e.pos.y + e.arch.h / 2, 5, sound=6))
+                    drop_kind = roll_drop(self._ctx.rng.drops, drop_chance)
+                    if drop_kind is not None:
+                        self.events.push(ItemDropped(drop_kind, e.pos.x, e.pos.y))
+                elif type(ev) is ItemDropped:
+                    self.items.append(
+                        Item(
+                            active=True,
+                            kind=ev.kind,
+                            pos=Vec2(ev.x, ev.y),
+                            vel=Vec2(-0.8, 0.2),
+                            w=4,
+                            h=4,
+                            lifetime=360,
+                        )
+                    )
+                elif type(ev) is PlayerHit:
+                    self.events.push(ExplosionRequested(ev.x, ev.y, 6))
+                elif type(ev) is ExplosionRequested:
+                    explosions.append(ev)
+            self.events.notify(batch)
+        if explosions:
+            for sound in {ev.sound for ev in explosions if ev.sound >= 0}:
+                self._ctx.audio.play(sound)
+            if not self._ctx.skip_cosmetic:
+                self._emit_explosions(explosions)
 
     def _explode_bomb(self, p: Projectile) -> None:
         radius = max(1, p.radius)
         cx = p.pos.x
         cy = p.pos.y
-        pyxel.play(0, 6)
-        self._spawn_explosion(cx, cy, 10)
+        self.events.push(ExplosionRequested(cx, cy, 10, sound=6))
         r2 = radius * radius
         for e in self.enemies:
             if not e.active:
@@ -682,17 +873,204 @@ class GameScene:
             dy = (e.pos.y - cy)
             if dx * dx + dy * dy <= r2:
                 e.hp -= p.damage
+                self.damage_dealt["bomb"] += p.damage
                 if e.hp <= 0:
-                    self._kill_enemy(e)
+                    self._kill_enemy(e, "bomb")
+
+    def _emit_explosions(self, explosions: list[ExplosionRequested]) -> None:
+        # one pass over the particle pool for the whole frame's explosions
+        stats = self.pool_stats["particles"]
+        free = (i for i, fx in enumerate(self.particles) if not fx.active)
+        for n, ev in enumerate(explosions):
+            for i in range(ev.count):
+                slot = next(free, None)
+                if slot is None:
+                    # cosmetic: never grown mid-frame, _grow_pools() catches up at frame end
+                    stats.exhausted += 1
+                    stats.dropped += ev.count - i + sum(later.count for later in explosions[n + 1 :])
+                    return
+                if slot >= stats.high_water:
+                    stats.high_water = slot + 1
+                fx = self.particles[slot]
+                ang = (i * 37) % 360
+                fx.active = True
+                fx.pos.x = ev.x
+                fx.pos.y = ev.y
+                fx.vel.x = cos_deg(ang) * 1.2
+                fx.vel.y = sin_deg(ang) * 1.2
+                fx.lifetime = 18
+
+    def get_state(self) -> dict[str, Any]:
+        # Plain-data copy of everything update() reads, one entry per subsystem
+        # (save states, rewind, determinism hashes). Inactive pool slots and dead
+        # enemies are skipped: nothing reads them until they are respawned.
+        # Entries in COSMETIC_STATE never feed back into gameplay.
+        p = self.player
+        enemies = [e for e in self.enemies if e.active]
+        index = {id(e): i for i, e in enumerate(enemies)}
+        return {
+            "rng": self._ctx.rng.get_state(GAMEPLAY_STREAMS),
+            "scene": (
+                self.frame,
+                self.kills,
+                self._laser_charging,
+                self._laser_charge_frames,
+                self._laser_charge_sfx_timer,
+                self._flame_charge_frames,
+                tuple(self.damage_dealt.items()),
+                self._ctx.input.state.held,
+            ),
+            "player": (
+                p.ship, p.pos.x, p.pos.y, p.w, p.h, p.life, p.max_life, p.invincible, p.speed, p.max_speed,
+                p.weapon_level, p.laser_maxed, p.bomb_radius_maxed, p.bomb_homing, p.bomb_big, p.flame_upgraded,
+                p.cooldown_cannon, p.cooldown_missile, p.cooldown_bomb, p.cooldown_laser,
+            ),
+            "stage": self.stage.get_state(),
+            "spawner": self.spawner.get_state(),
+            "laser": (
+                self.laser.active, self.laser.x, self.laser.y, self.laser.length, self.laser.width,
+                self.laser.damage, self.laser.duration, self.laser.tick_interval, self.laser._tick,
+            ),
+            "flame": (
+                self.flame.active, self.flame.x, self.flame.y, self.flame.length, self.flame.width,
+                self.flame.damage, self.flame.tick_interval, self.flame._tick,
+            ),
+            "projectiles": _pool_state(self.projectiles),
+            "enemy_shots": self.bullets.get_state(),
+            "particles": tuple(
+                (i, fx.pos.x, fx.pos.y, fx.vel.x, fx.vel.y, fx.lifetime)
+                for i, fx in enumerate(self.particles)
+                if fx.active
+            ),
+            "enemies": tuple(
+                (
+                    e.kind, e.pos.x, e.pos.y, e.hp, e.timer, e.pattern, e.shoot_cooldown, e.volleys_fired,
+                    e.burn_timer, e.burn_tick, e.move_mul,
+                )
+                for e in enemies
+            ),
+            "scripts": self.scripts.get_state(lambda e: -1 if e is None else index[id(e)]),
+            "items": tuple(
+                (it.kind, it.pos.x, it.pos.y, it.vel.x, it.vel.y, it.w, it.h, it.lifetime)
+                for it in self.items
+                if it.active
+            ),
+            "fx": (
+                self._ctx.rng.get_state((COSMETIC_STREAM,)),
+                tuple(self._laser_fx),
+                tuple(self._flame_fx),
+            ),
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        self._ctx.rng.set_state(state["rng"])
+        (
+            self.frame,
+            self.kills,
+            self._laser_charging,
+            self._laser_charge_frames,
+            self._laser_charge_sfx_timer,
+            self._flame_charge_frames,
+            damage,
+            held,
+        ) = state["scene"]
+        self.damage_dealt = dict(damage)
+        self._ctx.input.feed(held)
+
+        p = self.player
+        (
+            p.ship, p.pos.x, p.pos.y, p.w, p.h, p.life, p.max_life, p.invincible, p.speed, p.max_speed,
+            p.weapon_level, p.laser_maxed, p.bomb_radius_maxed, p.bomb_homing, p.bomb_big, p.flame_upgraded,
+            p.cooldown_cannon, p.cooldown_missile, p.cooldown_bomb, p.cooldown_laser,
+        ) = state["player"]
+
+        self.tasks.reset(self.frame)
+        self.stage.set_state(state["stage"])
+        self.spawner.set_state(state["spawner"], self.stage.current_section())
+        la = self.laser
+        la.active, la.x, la.y, la.length, la.width, la.damage, la.duration, la.tick_interval, la._tick = state["laser"]
+        fl = self.flame
+        fl.active, fl.x, fl.y, fl.length, fl.width, fl.damage, fl.tick_interval, fl._tick = state["flame"]
+
+        for name, pool in self._pools():
+            self._fit_pool(name, pool, max((entry[0] + 1 for entry in state[name]), default=0))
+        _set_pool_state(self.projectiles, state["projectiles"])
+        self.bullets.set_state(state["enemy_shots"])
+        self._sync_bullet_stats()
+        for fx in self.particles:
+            fx.active = False
+        for i, x, y, vx, vy, lifetime in state["particles"]:
+            fx = self.particles[i]
+            fx.active = True
+            fx.pos.x, fx.pos.y, fx.vel.x, fx.vel.y, fx.lifetime = x, y, vx, vy, lifetime
+
+        self.enemies = [
+            Enemy(
+                active=True,
+                arch=self.archetypes.get(kind),
+                pos=Vec2(x, y),
+                hp=hp,
+                timer=timer,
+                pattern=pattern,
+                shoot_cooldown=shoot_cooldown,
+                volleys_fired=volleys_fired,
+                burn_timer=burn_timer,
+                burn_tick=burn_tick,
+                move_mul=move_mul,
+            )
+            for (
+                kind, x, y, hp, timer, pattern, shoot_cooldown, volleys_fired, burn_timer, burn_tick, move_mul
+            ) in state["enemies"]
+        ]
+        self.scripts.set_state(state["scripts"], self.enemies)
+        self.items = [
+            Item(active=True, kind=kind, pos=Vec2(x, y), vel=Vec2(vx, vy), w=w, h=h, lifetime=lifetime)
+            for kind, x, y, vx, vy, w, h, lifetime in state["items"]
+        ]
+        cosmetic_rng, laser_fx, flame_fx = state["fx"]
+        self._ctx.rng.set_state(cosmetic_rng)
+        self._laser_fx = list(laser_fx)
+        self._flame_fx = list(flame_fx)
+
+    def telemetry_sample(self) -> tuple[int, int, int, int, int, int, int, int]:
+        weapons = 0
+        if self.laser.active:
+            weapons |= WEAPON_LASER
+        if self._laser_charging:
+            weapons |= WEAPON_LASER_CHARGING
+        if self.flame.active:
+            weapons |= WEAPON_FLAME
+        return (
+            sum(1 for e in self.enemies if e.active),
+            sum(1 for p in self.projectiles if p.active),
+            len(self.bullets),
+            sum(1 for fx in self.particles if fx.active),
+            sum(1 for it in self.items if it.active),
+            self.stage.section_index,
+            self.player.weapon_level,
+            weapons,
+        )
+
+    @property
+    def stage_section_names(self) -> list[str]:
+        return [sec.name for sec in self.stage.sections]
+
+    @property
+    def width(self) -> int:
+        return self._w
+
+    @property
+    def height(self) -> int:
+        return self._h
 
-    def _spawn_explosion(self, x: float, y: float, count: int) -> None:
-        for i in range(count):
-            ang = (i * 37) % 360
-            vx = pyxel.cos(ang) * 1.2
-            vy = pyxel.sin(ang) * 1.2
-            self._spawn_particle(x=x, y=y, vx=vx, vy=vy, lifetime=18)
+    @property
+    def laser_charge_ratio(self) -> float:
+        if not self._laser_charging:
+            return 0.0
+        max_frames = int(self._ctx.config.get("weapons", {}).get("laser", {}).get("charge_max_frames", 45))
+        return self._laser_charge_frames / max(1, max_frames)
 
-    def _nearest_enemy(self, x: float, y: float) -> Enemy | None:
+    def nearest_enemy(self, x: float, y: float) -> Enemy | None:
         best: Enemy | None = None
         best_d = 1e18
         for e in self.enemies:
@@ -712,7 +1090,7 @@ class GameScene:
         for e in self.enemies:
             if not e.active:
                 continue
-            sp = a.sprites[f"enemy:{e.kind}"]
+            sp = a.sprites[e.arch.sprite_key]
             pyxel.blt(int(e.pos.x), int(e.pos.y), sp.img, sp.u, sp.v, sp.w, sp.h, sp.colkey)
 
         # Items
@@ -740,10 +1118,10 @@ class GameScene:
 
         # Enemy shots
         sp_enemy = a.sprites["shot:cannon"]
-        for p in self.enemy_shots:
-            if not p.active:
-                continue
-            pyxel.blt(int(p.pos.x), int(p.pos.y), sp_enemy.img, sp_enemy.u, sp_enemy.v, sp_enemy.w, sp_enemy.h, sp_enemy.colkey)
+        img, u, v, w, h, colkey = sp_enemy.img, sp_enemy.u, sp_enemy.v, sp_enemy.w, sp_enemy.h, sp_enemy.colkey
+        blt = pyxel.blt
+        for x, y, _, _ in self.bullets.rows():
+            blt(int(x), int(y), img, u, v, w, h, colkey)
 
         # Laser
         if self.laser.active:
@@ -834,9 +1212,12 @@ class GameScene:
         lifetime: int,
         radius: int = 0,
     ) -> None:
-        for p in self.projectiles:
+        for i, p in enumerate(self.projectiles):
             if p.active:
                 continue
+            stats = self.pool_stats["projectiles"]
+            if i >= stats.high_water:
+                stats.high_water = i + 1
             p.active = True
             p.kind = kind
             p.owner = owner
@@ -850,33 +1231,120 @@ class GameScene:
             p.lifetime = lifetime
             p.radius = radius
             return
+        if self._pool_exhausted("projectiles", self.projectiles):
+            self._spawn_projectile(
+                kind=kind, owner=owner, x=x, y=y, vx=vx, vy=vy, w=w, h=h, damage=damage, lifetime=lifetime,
+                radius=radius,
+            )
 
-    def _spawn_enemy_shot(self, *, x: float, y: float, vx: float, vy: float, damage: int, lifetime: int) -> None:
-        for p in self.enemy_shots:
-            if p.active:
-                continue
-            p.active = True
-            p.kind = "enemy"
-            p.owner = "enemy"
-            p.pos.x = x
-            p.pos.y = y
-            p.vel.x = vx
-            p.vel.y = vy
-            p.w = 2
-            p.h = 2
-            p.damage = damage
-            p.lifetime = lifetime
-            p.radius = 0
-            return
-
-    def _spawn_particle(self, *, x: float, y: float, vx: float, vy: float, lifetime: int) -> None:
-        for fx in self.particles:
-            if fx.active:
-                continue
-            fx.active = True
-            fx.pos.x = x
-            fx.pos.y = y
-            fx.vel.x = vx
-            fx.vel.y = vy
-            fx.lifetime = lifetime
+    def _fire_barrage(self, e: Enemy) -> None:
+        pattern = self._barrages[e.arch.index]
+        burst_pos = e.volleys_fired % pattern.volleys
+        e.shoot_cooldown = pattern.volley_interval if burst_pos + 1 < pattern.volleys else pattern.cooldown_frames
+        pl = self.player
+        xs, ys, vxs, vys = pattern.volley(
+            e.pos.x, e.pos.y + 3, pl.pos.x + pl.w / 2, pl.pos.y + pl.h / 2, e.volleys_fired
+        )
+        e.volleys_fired += 1
+        stored = self.bullets.emit(xs, ys, vxs, vys, pattern.damage, pattern.lifetime)
+        if stored == len(xs):
             return
+        # store full: grow now when allowed (bullets are gameplay), else drop the rest
+        stats = self.pool_stats["enemy_shots"]
+        stats.exhausted += 1
+        if stats.capacity < stats.max_capacity:
+            self._grow_bullets(max(self.pool_policy.next_capacity(stats), self.bullets.n + len(xs) - stored))
+            stored += self.bullets.emit(
+                xs[stored:], ys[stored:], vxs[stored:], vys[stored:], pattern.damage, pattern.lifetime
+            )
+        stats.dropped += len(xs) - stored
+
+    def _grow_bullets(self, capacity: int) -> None:
+        stats = self.pool_stats["enemy_shots"]
+        self.bullets.grow(min(capacity, stats.max_capacity))
+        stats.capacity = self.bullets.capacity
+        stats.grown += 1
+
+    def _sync_bullet_stats(self) -> PoolStats:
+        stats = self.pool_stats["enemy_shots"]
+        stats.capacity = self.bullets.capacity
+        stats.high_water = self.bullets.high_water
+        return stats
+
+    def _pool_exhausted(self, name: str, pool: list[Projectile]) -> bool:
+        # Every slot busy. Gameplay pools grow right away when allowed (a lost
+        # shot changes the game); returns True when the spawn should be retried.
+        stats = self.pool_stats[name]
+        stats.exhausted += 1
+        if stats.capacity >= stats.max_capacity:
+            stats.dropped += 1
+            return False
+        grow_pool(pool, stats, _POOL_FACTORIES[name], self.pool_policy.next_capacity(stats))
+        return True
+
+    def _grow_pools(self) -> None:
+        # End-of-frame growth before a pool runs out, so hot frames rarely allocate
+        policy = self.pool_policy
+        for name, pool in self._pools():
+            stats = self.pool_stats[name]
+            if policy.wants_growth(stats):
+                grow_pool(pool, stats, _POOL_FACTORIES[name], policy.next_capacity(stats))
+        stats = self._sync_bullet_stats()
+        if policy.wants_growth(stats):
+            self._grow_bullets(policy.next_capacity(stats))
+
+    def _pools(self) -> tuple[tuple[str, list[Any]], ...]:
+        return (("projectiles", self.projectiles), ("particles", self.particles))
+
+    def _fit_pool(self, name: str, pool: list[Any], slots: int) -> None:
+        # save states / rewind from a run whose pool had grown further
+        if slots > len(pool):
+            grow_pool(pool, self.pool_stats[name], _POOL_FACTORIES[name], slots)
+
+    def pool_overlay_text(self) -> str:
+        parts = [f"{name[0].upper()}{st.high_water}/{st.capacity}" for name, st in self.pool_stats.items()]
+        exhausted = sum(st.exhausted for st in self.pool_stats.values())
+        dropped = sum(st.dropped for st in self.pool_stats.values())
+        return f"POOL {' '.join(parts)} X{exhausted} D{dropped}"
+
+
+def _new_shot(kind: str, owner: str, damage: int) -> Projectile:
+    return Projectile(
+        active=False,
+        kind=kind,
+        owner=owner,
+        pos=Vec2(0.0, 0.0),
+        vel=Vec2(0.0, 0.0),
+        w=2,
+        h=2,
+        damage=damage,
+        lifetime=0,
+    )
+
+
+def _new_particle() -> Particle:
+    return Particle(active=False, pos=Vec2(0.0, 0.0), vel=Vec2(0.0, 0.0), lifetime=0)
+
+
+_POOL_FACTORIES: dict[str, Callable[[], Any]] = {
+    "projectiles": lambda: _new_shot("cannon", "player", 1),
+    "particles": _new_particle,
+}
+
+
+def _pool_state(pool: list[Projectile]) -> tuple[tuple[Any, ...], ...]:
+    return tuple(
+        (i, p.kind, p.owner, p.pos.x, p.pos.y, p.vel.x, p.vel.y, p.w, p.h, p.damage, p.lifetime, p.radius)
+        for i, p in enumerate(pool)
+        if p.active
+    )
+
+
+def _set_pool_state(pool: list[Projectile], state: tuple[tuple[Any, ...], ...]) -> None:
+    for p in pool:
+        p.active = False
+    for i, kind, owner, x, y, vx, vy, w, h, damage, lifetime, radius in state:
+        p = pool[i]
+        p.active = True
+        p.kind, p.owner, p.damage, p.lifetime, p.radius = kind, owner, damage, lifetime, radius
+        p.pos.x, p.pos.y, p.vel.x, p.vel.y, p.w, p.h = x, y, vx, vy, w, h
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any, Callable
 
 import pyxel
 
 from src.core.context import GameContext
+from src.core.input import CONFIRM, LEFT, RIGHT
+from src.ui.static_layer import StaticLayer
 
 
 class TitleScene:
@@ -13,6 +15,8 @@ class TitleScene:
         self._on_start = on_start
         self._ships = ["propeller", "jet", "fighter", "ufo"]
         self._idx = 0
+        window = ctx.config.get("window", {})
+        self._static = StaticLayer(int(window.get("width", 256)), int(window.get("height", 144)), self._paint_static)
 
     def on_enter(self) -> None:
         pass
@@ -22,29 +26,33 @@ class TitleScene:
 
     def update(self) -> None:
         inp = self._ctx.input.state
-        if inp.is_pressed("left"):
+        if inp.is_pressed(LEFT):
             self._idx = (self._idx - 1) % len(self._ships)
-            pyxel.play(0, 0)
-        if inp.is_pressed("right"):
+            self._ctx.audio.play(0)
+        if inp.is_pressed(RIGHT):
             self._idx = (self._idx + 1) % len(self._ships)
-            pyxel.play(0, 0)
-        if inp.is_pressed("confirm"):
-            pyxel.play(0, 1)
+            self._ctx.audio.play(0)
+        if inp.is_pressed(CONFIRM):
+            self._ctx.audio.play(1)
             self._on_start(self._ships[self._idx])
 
+    def _paint_static(self, target: Any) -> None:
+        font = self._ctx.assets.font
+        font.draw(52, 16, "SIDE-SCROLL SHOOTER", target)
+        font.draw(84, 36, "SELECT SHIP", target)
+
+        font.draw(60, 90, "J:START  K:MISSILE", target)
+        font.draw(36, 102, "L:BOMB  U:LASER  I:FLAME", target)
+
+        font.draw(44, 122, "WASD:MOVE  A/D:SELECT", target)
+        font.draw(24, 134, "GAMEPAD:DPAD MOVE  A START", target)
+
     def draw(self) -> None:
-        pyxel.cls(0)
         font = self._ctx.assets.font
         if font is None:
+            pyxel.cls(0)
             return
-        font.draw(52, 16, "SIDE-SCROLL SHOOTER")
-        font.draw(84, 36, "SELECT SHIP")
-
-        font.draw(60, 90, "J:START  K:MISSILE")
-        font.draw(36, 102, "L:BOMB  U:LASER  I:FLAME")
-
-        font.draw(44, 122, "WASD:MOVE  A/D:SELECT")
-        font.draw(24, 134, "GAMEPAD:DPAD MOVE  A START")
+        self._static.draw()
         ship = self._ships[self._idx]
         font.draw(88, 60, ship.upper())
         sp = self._ctx.assets.sprites[f"ship:{ship}"]
@@ -0,0 +1,5 @@
+import sys
+
+from src.sim.batch import main
+
+sys.exit(main())
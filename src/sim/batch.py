@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import itertools
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+from typing import Any
+
+from src.core.config import _parse_toml_value, load_config, validate_config
+from src.sim.headless import FRAME_BUCKET_MS, FRAME_BUCKETS, SessionResult, run_session
+from src.sim.policy import POLICIES, make_policy
+
+# Overrides are "dotted.path=v1,v2,..."; numeric path parts index into arrays,
+# e.g. stage.sections.2.spawn_rate=0.1,0.2
+Override = tuple[str, Any]
+
+_base_config: dict[str, Any] = {}
+
+
+def _set_path(config: dict[str, Any], path: str, value: Any) -> None:
+    parts = path.split(".")
+    cur: Any = config
+    for part in parts[:-1]:
+        cur = cur[int(part)] if isinstance(cur, list) else cur.setdefault(part, {})
+    last = parts[-1]
+    if isinstance(cur, list):
+        cur[int(last)] = value
+    else:
+        cur[last] = value
+
+
+def apply_overrides(config: dict[str, Any], overrides: tuple[Override, ...]) -> dict[str, Any]:
+    if not overrides:
+        return config
+    out = copy.deepcopy(config)
+    for path, value in overrides:
+        _set_path(out, path, value)
+    return out
+
+
+def parse_sweep(specs: list[str]) -> list[tuple[Override, ...]]:
+    axes: list[list[Override]] = []
+    for spec in specs:
+        if "=" not in spec:
+            raise ValueError(f"expected key=v1,v2,...: {spec}")
+        path, raw = spec.split("=", 1)
+        axes.append([(path.strip(), _parse_toml_value(v)) for v in raw.split(",")])
+    return [tuple(combo) for combo in itertools.product(*axes)] if axes else [()]
+
+
+def _init_worker(config_path: str) -> None:
+    global _base_config
+    _base_config = load_config(config_path).data
+
+
+def _run_task(task: tuple[int, tuple[Override, ...], int, str, int]) -> tuple[int, SessionResult]:
+    combo_index, overrides, seed, policy_name, max_frames = task
+    config = apply_overrides(_base_config, overrides)
+    return combo_index, run_session(config, seed, make_policy(policy_name), max_frames)
+
+
+def _percentile(hist: list[int], q: float) -> float:
+    total = sum(hist)
+    if total == 0:
+        return 0.0
+    target = q * total
+    acc = 0
+    for i, n in enumerate(hist):
+        acc += n
+        if acc >= target:
+            return (i + 1) * FRAME_BUCKET_MS
+    return FRAME_BUCKETS * FRAME_BUCKET_MS
+
+
+def aggregate(results: list[SessionResult], fps: int) -> dict[str, Any]:
+    n = len(results)
+    frames = sorted(r.frames for r in results)
+    total_frames = sum(frames)
+    seconds = max(1e-9, total_frames / fps)
+    kills_by_section: dict[str, float] = {}
+    damage: dict[str, int] = {}
+    hist = [0] * FRAME_BUCKETS
+    for r in results:
+        for k, v in r.kills_by_section.items():
+            kills_by_section[k] = kills_by_section.get(k, 0) + v
+        for k, v in r.damage_dealt.items():
+            damage[k] = damage.get(k, 0) + v
+        for i, c in enumerate(r.frame_hist):
+            hist[i] += c
+    pools: dict[str, dict[str, float]] = {}
+    for r in results:
+        for name, st in r.pool_stats.items():
+            agg = pools.setdefault(
+                name, {"high_water_max": 0, "high_water_mean": 0.0, "capacity_max": 0, "exhausted": 0, "dropped": 0}
+            )
+            agg["high_water_max"] = max(agg["high_water_max"], st.high_water)
+            agg["high_water_mean"] += st.high_water / max(1, n)
+            agg["capacity_max"] = max(agg["capacity_max"], st.capacity)
+            agg["exhausted"] += st.exhausted
+            agg["dropped"] += st.dropped
+    return {
+        "sessions": n,
+        "died": sum(1 for r in results if r.died) / max(1, n),
+        "survival_s": {
+            "mean": total_frames / max(1, n) / fps,
+            "median": frames[n // 2] / fps if n else 0.0,
+            "min": frames[0] / fps if n else 0.0,
+            "max": frames[-1] / fps if n else 0.0,
+        },
+        "kills_mean": sum(r.kills for r in results) / max(1, n),
+        "kills_per_section_mean": {k: v / max(1, n) for k, v in sorted(kills_by_section.items())},
+        "dps_per_weapon": {k: v / seconds for k, v in sorted(damage.items())},
+        "update_ms": {
+            "mean": sum(r.update_ms_total for r in results) / max(1, total_frames),
+            "p50": _percentile(hist, 0.50),
+            "p95": _percentile(hist, 0.95),
+            "p99": _percentile(hist, 0.99),
+            "max": max((r.update_ms_max for r in results), default=0.0),
+        },
+        "pools": pools,
+    }
+
+
+def run_batch(
+    config_path: str,
+    sweep: list[tuple[Override, ...]],
+    sessions: int,
+    base_seed: int,
+    policy_name: str,
+    max_frames: int,
+    workers: int,
+) -> dict[str, Any]:
+    base = load_config(config_path).data
+    for overrides in sweep:
+        validate_config(apply_overrides(base, overrides), source=f"override {overrides}")
+    fps = int(base.get("window", {}).get("fps", 60))
+
+    tasks = [
+        (ci, overrides, base_seed + s, policy_name, max_frames)
+        for ci, overrides in enumerate(sweep)
+        for s in range(sessions)
+    ]
+    by_combo: dict[int, list[SessionResult]] = {i: [] for i in range(len(sweep))}
+    t0 = time.perf_counter()
+    if workers <= 1:
+        _init_worker(config_path)
+        for task in tasks:
+            ci, result = _run_task(task)
+            by_combo[ci].append(result)
+    else:
+        # big chunks keep IPC overhead flat so throughput scales with cores
+        chunksize = max(1, len(tasks) // (workers * 8))
+        with Pool(workers, initializer=_init_worker, initargs=(config_path,)) as pool:
+            for ci, result in pool.imap_unordered(_run_task, tasks, chunksize=chunksize):
+                by_combo[ci].append(result)
+    wall = time.perf_counter() - t0
+
+    sim_frames = sum(r.frames for rs in by_combo.values() for r in rs)
+    return {
+        "policy": policy_name,
+        "workers": workers,
+        "wall_s": wall,
+        "sessions_per_s": len(tasks) / max(1e-9, wall),
+        "sim_frames_per_s": sim_frames / max(1e-9, wall),
+        "runs": [
+            {"overrides": dict(sweep[ci]), **aggregate(rs, fps)}
+            for ci, rs in sorted(by_combo.items())
+        ],
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(
+        f"policy={report['policy']} workers={report['workers']} wall={report['wall_s']:.1f}s "
+        f"sessions/s={report['sessions_per_s']:.1f} sim-frames/s={report['sim_frames_per_s']:.0f}"
+    )
+    for run in report["runs"]:
+        label = " ".join(f"{k}={v}" for k, v in run["overrides"].items()) or "(base config)"
+        surv = run["survival_s"]
+        ms = run["update_ms"]
+        print(f"\n{label}")
+        print(
+            f"  sessions={run['sessions']} died={run['died']:.0%} survival mean={surv['mean']:.1f}s "
+            f"median={surv['median']:.1f}s min={surv['min']:.1f}s max={surv['max']:.1f}s"
+        )
+        print(f"  kills mean={run['kills_mean']:.1f}  per section: " + ", ".join(
+            f"{k}={v:.1f}" for k, v in run["kills_per_section_mean"].items()
+        ))
+        print("  dps: " + ", ".join(f"{k}={v:.2f}" for k, v in run["dps_per_weapon"].items()))
+        print(
+            f"  update ms: mean={ms['mean']:.3f} p50={ms['p50']:.2f} p95={ms['p95']:.2f} "
+            f"p99={ms['p99']:.2f} max={ms['max']:.2f}"
+        )
+        print("  pools (high-water mean/max, capacity, exhausted, dropped): " + ", ".join(
+            f"{k}={v['high_water_mean']:.0f}/{v['high_water_max']} cap={v['capacity_max']} "
+            f"x={v['exhausted']} d={v['dropped']}"
+            for k, v in run["pools"].items()
+        ))
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m src.sim", description="Headless batch balance simulator.")
+    ap.add_argument("--config", default="config/game.toml")
+    ap.add_argument("--sessions", type=int, default=100, help="sessions per parameter combination")
+    ap.add_argument("--seed", type=int, default=1, help="first seed; sessions use seed, seed+1, ...")
+    ap.add_argument("--frames", type=int, default=60 * 60 * 5, help="max frames per session")
+    ap.add_argument("--policy", default="scripted", choices=sorted(POLICIES))
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument(
+        "--set",
+        dest="sweep",
+        action="append",
+        default=[],
+        metavar="KEY=V1,V2",
+        help="config override / sweep axis, e.g. items.drop_chance=0.1,0.2 (repeatable)",
+    )
+    ap.add_argument("--out", help="write the full JSON report here")
+    args = ap.parse_args(argv)
+
+    report = run_batch(
+        args.config,
+        parse_sweep(args.sweep),
+        args.sessions,
+        args.seed,
+        args.policy,
+        args.frames,
+        max(1, args.workers),
+    )
+    _print_report(report)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from src.core.audio import SoundMixer
+from src.core.context import GameContext
+from src.core.input import Input
+from src.core.rng import RngStreams
+from src.core.statehash import StateTraceWriter
+from src.scenes.game_scene import GameScene
+from src.sim.policy import Policy
+from src.systems.masks import build_masks
+from src.systems.pools import PoolStats
+
+# frame-time histogram: FRAME_BUCKETS buckets of FRAME_BUCKET_MS, last bucket is overflow
+FRAME_BUCKET_MS = 0.05
+FRAME_BUCKETS = 400
+
+
+class HeadlessAssets:
+    # Stand-in for Assets when no pyxel window exists. update() only needs theme
+    # switching to be callable; draw() is never called headless.
+    def __init__(self) -> None:
+        self.sprites: dict[str, Any] = {}
+        self.masks = build_masks()  # collision.mode = "mask" works without pyxel
+        self.font = None
+        self.themes: dict[str, Any] = {}
+
+    def load_gameplay(self) -> None:
+        pass
+
+    def apply_theme(self, name: str, layers: Any = ()) -> list[Any]:
+        return []
+
+    def prefetch_theme(self, name: str) -> None:
+        pass
+
+
+def make_headless_context(
+    config: dict[str, Any], seed: int, trace: StateTraceWriter | None = None, skip_cosmetic: bool = True
+) -> GameContext:
+    return GameContext(
+        config=config,
+        input=Input(config),
+        rng=RngStreams(seed),
+        debug_enabled=False,
+        assets=HeadlessAssets(),
+        audio=SoundMixer({}, channels=0),
+        trace=trace,
+        skip_cosmetic=skip_cosmetic,
+        realtime=False,
+    )
+
+
+@dataclass
+class SessionResult:
+    seed: int
+    frames: int
+    died: bool
+    kills: int
+    kills_by_section: dict[str, int] = field(default_factory=dict)
+    damage_dealt: dict[str, int] = field(default_factory=dict)
+    frame_hist: list[int] = field(default_factory=list)
+    update_ms_total: float = 0.0
+    update_ms_max: float = 0.0
+    pool_stats: dict[str, PoolStats] = field(default_factory=dict)
+
+
+def run_session(
+    config: dict[str, Any], seed: int, policy: Policy, max_frames: int, ship: str = "propeller"
+) -> SessionResult:
+    ctx = make_headless_context(config, seed)
+    dead: list[int] = []
+    scene = GameScene(ctx, selected_ship=ship, on_game_over=dead.append)
+    policy.reset(seed)
+
+    hist = [0] * FRAME_BUCKETS
+    kills_by_section: dict[str, int] = {}
+    total_ms = 0.0
+    max_ms = 0.0
+    frames = 0
+    clock = perf_counter
+    while frames < max_frames and not dead:
+        ctx.input.feed(policy.act(scene))
+        section = scene.stage.current_section().name
+        kills_before = scene.kills
+        t0 = clock()
+        scene.update()
+        ms = (clock() - t0) * 1000.0
+        frames += 1
+        total_ms += ms
+        if ms > max_ms:
+            max_ms = ms
+        hist[min(FRAME_BUCKETS - 1, int(ms / FRAME_BUCKET_MS))] += 1
+        if scene.kills != kills_before:
+            kills_by_section[section] = kills_by_section.get(section, 0) + scene.kills - kills_before
+
+    return SessionResult(
+        seed=seed,
+        frames=frames,
+        died=bool(dead),
+        kills=scene.kills,
+        kills_by_section=kills_by_section,
+        damage_dealt=dict(scene.damage_dealt),
+        frame_hist=hist,
+        update_ms_total=total_ms,
+        update_ms_max=max_ms,
+        pool_stats=scene.pool_stats,
+    )
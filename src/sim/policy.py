@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from random import Random
+from typing import TYPE_CHECKING, Protocol
+
+from src.core.input import (
+    DOWN,
+    FIRE_BOMB,
+    FIRE_CANNON,
+    FIRE_FLAME,
+    FIRE_LASER,
+    FIRE_MISSILE,
+    LEFT,
+    RIGHT,
+    UP,
+)
+from src.systems.bullets import BULLET_SIZE
+
+if TYPE_CHECKING:
+    from src.scenes.game_scene import GameScene
+
+
+class Policy(Protocol):
+    # Produces the held action bits (same layout as Input.state.held) for one frame.
+    def reset(self, seed: int) -> None: ...
+    def act(self, scene: GameScene) -> int: ...
+
+
+class ScriptedPolicy:
+    # Deterministic baseline: track the nearest enemy vertically, keep cannon,
+    # missiles and bombs firing, and release a charged laser every 60 frames.
+    def reset(self, seed: int) -> None:
+        self._frame = 0
+
+    def act(self, scene: GameScene) -> int:
+        self._frame += 1
+        held = FIRE_CANNON | FIRE_MISSILE | FIRE_BOMB
+        if self._frame % 60 < 50:
+            held |= FIRE_LASER
+
+        p = scene.player
+        py = p.pos.y + p.h / 2
+        target = scene.nearest_enemy(p.pos.x, py)
+        if target is not None:
+            ty = target.pos.y + target.arch.h / 2
+            if ty < py - 2:
+                held |= UP
+            elif ty > py + 2:
+                held |= DOWN
+        return held
+
+
+# (dx, dy, bits) for the nine moves the dodge search considers; staying put first
+_MOVES = (
+    (0, 0, 0),
+    (0, -1, UP),
+    (0, 1, DOWN),
+    (-1, 0, LEFT),
+    (1, 0, RIGHT),
+    (-1, -1, LEFT | UP),
+    (-1, 1, LEFT | DOWN),
+    (1, -1, RIGHT | UP),
+    (1, 1, RIGHT | DOWN),
+)
+# horizontal speed multiplier per enemy pattern (mirrors GameScene._update_enemies)
+_PATTERN_VX = {"dash": 1.8, "formation": 1.2}
+_LOOKAHEAD = (2, 5, 9, 14)  # frames ahead checked for each move
+_MARGIN = 3.0  # extra pixels kept clear around the player hitbox
+_SCAN_X = 80.0  # threats further ahead than this are ignored
+
+
+class DodgeFirePolicy:
+    # Survival-first heuristic: every frame, try the nine moves, predict where
+    # enemies and enemy shots will be a few frames ahead (straight-line motion),
+    # and take the move with the least overlap. Ties go to lining up with the
+    # nearest enemy, picking up items and staying near the left edge.
+    fire = FIRE_CANNON | FIRE_MISSILE | FIRE_BOMB
+
+    def reset(self, seed: int) -> None:
+        self._frame = 0
+
+    def act(self, scene: GameScene) -> int:
+        self._frame += 1
+        return self.fire | self._move(scene)
+
+    def _move(self, scene: GameScene) -> int:
+        p = scene.player
+        px, py, pw, ph = p.pos.x, p.pos.y, p.w, p.h
+
+        # (x, y, w, h, vx, vy) of everything that can hurt the player soon
+        threats: list[tuple[float, float, float, float, float, float]] = []
+        for x, y, vx, vy in scene.bullets.rows():
+            if x > px - 8 and x - px < _SCAN_X:
+                threats.append((x, y, BULLET_SIZE, BULLET_SIZE, vx, vy))
+        for e in scene.enemies:
+            if e.active and e.pos.x > px - 24 and e.pos.x - px < _SCAN_X:
+                vx = -e.arch.speed * _PATTERN_VX.get(e.pattern, 1.0)
+                threats.append((e.pos.x, e.pos.y, e.arch.w, e.arch.h, vx, 0.0))
+
+        cy = py + ph / 2
+        target = scene.nearest_enemy(px, cy)
+        goal_y = cy if target is None else target.pos.y + target.arch.h / 2
+        goal_x = 28.0
+        for it in scene.items:
+            if it.active and it.pos.x > px:
+                goal_x, goal_y = it.pos.x, it.pos.y
+                break
+
+        w, h = scene.width - pw, scene.height - ph
+        speed = p.speed
+        best_bits = 0
+        best_cost = 1e18
+        for dx, dy, bits in _MOVES:
+            danger = 0.0
+            for t in _LOOKAHEAD:
+                mx = min(w, max(0.0, px + dx * speed * t)) - _MARGIN
+                my = min(h, max(0.0, py + dy * speed * t)) - _MARGIN
+                mw = pw + 2 * _MARGIN
+                mh = ph + 2 * _MARGIN
+                for tx, ty, tw, th, vx, vy in threats:
+                    ox = tx + vx * t
+                    oy = ty + vy * t
+                    if ox < mx + mw and mx < ox + tw and oy < my + mh and my < oy + th:
+                        danger += 1.0 / t
+            if danger * 1000.0 > best_cost:
+                continue
+            nx = px + dx * speed
+            ny = py + dy * speed + ph / 2
+            cost = danger * 1000.0 + abs(ny - goal_y) + 0.25 * abs(nx - goal_x)
+            if cost < best_cost:
+                best_cost = cost
+                best_bits = bits
+        return best_bits
+
+
+class WeaponStressPolicy(DodgeFirePolicy):
+    # Worst-case load: dodges like DodgeFirePolicy but keeps every weapon busy -
+    # cannon, missiles and bombs on cooldown, flame held whenever the laser is
+    # idle, and the laser released as soon as it reaches full charge.
+    fire = FIRE_CANNON | FIRE_MISSILE | FIRE_BOMB | FIRE_FLAME
+
+    def act(self, scene: GameScene) -> int:
+        self._frame += 1
+        held = self.fire | self._move(scene)
+        if scene.laser_charge_ratio >= 1.0:
+            return held  # release for one frame -> full-power shot
+        return held | FIRE_LASER
+
+
+class RandomPolicy:
+    # Uniform random action bits, held for a few frames at a time so movement
+    # and laser charging actually happen.
+    def reset(self, seed: int) -> None:
+        self._rng = Random(seed ^ 0x5EED)
+        self._held = 0
+        self._left = 0
+
+    def act(self, scene: GameScene) -> int:
+        if self._left <= 0:
+            rng = self._rng
+            held = 0
+            for bit in (UP, DOWN, LEFT, RIGHT, FIRE_CANNON, FIRE_MISSILE, FIRE_BOMB, FIRE_LASER, FIRE_FLAME):
+                if rng.random() < 0.3:
+                    held |= bit
+            self._held = held
+            self._left = rng.randint(4, 30)
+        self._left -= 1
+        return self._held
+
+
+POLICIES: dict[str, type] = {
+    "scripted": ScriptedPolicy,
+    "dodge": DodgeFirePolicy,
+    "stress": WeaponStressPolicy,
+    "random": RandomPolicy,
+}
+
+
+def make_policy(name: str) -> Policy:
+    try:
+        return POLICIES[name]()
+    except KeyError:
+        raise ValueError(f"unknown policy: {name} (choose from {', '.join(POLICIES)})") from None
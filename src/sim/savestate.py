@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import marshal
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.scenes.game_scene import GameScene
+
+# Save states are marshal-encoded GameScene.get_state() dicts (plain tuples,
+# ints, floats and strings, so marshal is both the fastest and the most
+# compact stdlib encoder). Bump when get_state() changes shape.
+SAVESTATE_VERSION = 4
+# marshal format 2 writes no back-references or interning flags, so equal
+# states always encode to identical bytes (newer formats depend on refcounts)
+_MARSHAL_VERSION = 2
+
+
+class SaveStateError(ValueError):
+    pass
+
+
+def dumps(scene: GameScene) -> bytes:
+    return marshal.dumps((SAVESTATE_VERSION, scene.get_state()), _MARSHAL_VERSION)
+
+
+def loads(scene: GameScene, data: bytes) -> None:
+    try:
+        version, state = marshal.loads(data)
+    except (EOFError, ValueError, TypeError) as exc:
+        raise SaveStateError(f"corrupt save state: {exc}") from None
+    if version != SAVESTATE_VERSION:
+        raise SaveStateError(f"save state version {version} != {SAVESTATE_VERSION}")
+    scene.set_state(state)
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    # byte-wise a ^ b, the shorter one zero-padded; done as one big-int op in C
+    n = max(len(a), len(b))
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(n, "little")
+
+
+class RewindBuffer:
+    # Fixed-size history of per-frame save states.
+    #
+    # Snapshots are grouped: each group starts with a keyframe (zlib'd full
+    # state) followed by up to keyframe_interval - 1 deltas (zlib'd XOR against
+    # the previous snapshot; only moving entities differ between consecutive
+    # frames, so the XOR is mostly zeros and compresses to roughly a third of a
+    # raw state, about 3 KB in a busy scene). When the buffer is
+    # full the oldest whole group is dropped, so every stored frame can always
+    # be rebuilt from its group's keyframe.
+    def __init__(self, capacity: int = 600, keyframe_interval: int = 30, level: int = 1) -> None:
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.capacity = max(self.keyframe_interval, capacity)
+        self._level = level
+        # groups[i] = [(frame, length, blob), ...]; entry 0 is the keyframe
+        self._groups: list[list[tuple[int, int, bytes]]] = []
+        self._count = 0
+        self._last = b""
+        self.bytes_stored = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        self._groups.clear()
+        self._count = 0
+        self._last = b""
+        self.bytes_stored = 0
+
+    def push(self, scene: GameScene) -> None:
+        raw = dumps(scene)
+        groups = self._groups
+        if not groups or len(groups[-1]) >= self.keyframe_interval:
+            if self._count + self.keyframe_interval > self.capacity and groups:
+                dropped = groups.pop(0)
+                self._count -= len(dropped)
+                self.bytes_stored -= sum(len(b) for _, _, b in dropped)
+            groups.append([])
+            blob = zlib.compress(raw, self._level)
+        else:
+            blob = zlib.compress(_xor(self._last, raw), self._level)
+        groups[-1].append((scene.frame, len(raw), blob))
+        self._count += 1
+        self.bytes_stored += len(blob)
+        self._last = raw
+
+    def frames(self) -> list[int]:
+        return [frame for group in self._groups for frame, _, _ in group]
+
+    def snapshot(self, frame: int) -> bytes:
+        # raw save state for `frame` (GameScene.frame at the time of push)
+        for group in self._groups:
+            if group[0][0] <= frame <= group[-1][0]:
+                raw = b""
+                for f, length, blob in group:
+                    data = zlib.decompress(blob)
+                    raw = data if not raw else _xor(raw, data)[:length]
+                    if f == frame:
+                        return raw[:length]
+        raise KeyError(f"frame {frame} is not in the rewind buffer")
+
+    def rewind(self, scene: GameScene, frame: int) -> None:
+        # Restore `frame` and drop everything recorded after it, so pushing
+        # continues a consistent history from there.
+        raw = self.snapshot(frame)
+        loads(scene, raw)
+        while self._groups:
+            group = self._groups[-1]
+            while group and group[-1][0] > frame:
+                _, _, blob = group.pop()
+                self._count -= 1
+                self.bytes_stored -= len(blob)
+            if group:
+                break
+            self._groups.pop()
+        self._last = raw
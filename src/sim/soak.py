@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import argparse
+import cProfile
+import io
+import pstats
+import sys
+from time import perf_counter
+
+from src.core.config import load_config
+from src.core.context import GameContext
+from src.scenes.game_scene import GameScene
+from src.sim.headless import make_headless_context
+from src.sim.policy import POLICIES, make_policy
+from src.sim.savestate import RewindBuffer, dumps, loads
+
+
+def _reprofile_hitch(ctx: GameContext, scene: GameScene, rewind: RewindBuffer, ms: float) -> None:
+    # Rewind to the frame before the hitch, replay it under cProfile, then put
+    # the live state back. A replay that ends in a different state means the
+    # update is not deterministic; that is reported too.
+    held = ctx.input.state.held
+    after = dumps(scene)
+    rewind.rewind(scene, scene.frame - 1)
+    ctx.input.feed(held)
+    prof = cProfile.Profile()
+    t0 = perf_counter()
+    prof.runcall(scene.update)
+    replay_ms = (perf_counter() - t0) * 1000.0
+    same = dumps(scene) == after
+    loads(scene, after)
+    out = io.StringIO()
+    pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(12)
+    print(
+        f"hitch at frame {scene.frame}: {ms:.2f}ms, replay {replay_ms:.2f}ms (profiled)"
+        + ("" if same else " - REPLAY DIVERGED")
+    )
+    print(out.getvalue(), flush=True)
+
+
+def soak(
+    config_path: str,
+    policy_name: str,
+    total_frames: int,
+    seed: int,
+    report_every: int,
+    hitch_ms: float = 0.0,
+) -> int:
+    # One bot playing back-to-back sessions at uncapped tick rate (no window,
+    # no frame limiter) until total_frames have been simulated. A new session
+    # with the next seed starts whenever the bot dies.
+    config = load_config(config_path).data
+    policy = make_policy(policy_name)
+    fps = int(config.get("window", {}).get("fps", 60))
+
+    frames = 0
+    sessions = 0
+    deaths = 0
+    window_max_ms = 0.0
+    window_frames = 0
+    worst_ms = 0.0
+    rewind = RewindBuffer(capacity=120) if hitch_ms > 0 else None
+    next_profile = 0  # at most one profiled replay per second of game time
+    t_start = perf_counter()
+    t_window = t_start
+    while frames < total_frames:
+        ctx = make_headless_context(config, seed + sessions)
+        dead: list[int] = []
+        scene = GameScene(ctx, selected_ship="propeller", on_game_over=dead.append)
+        policy.reset(seed + sessions)
+        sessions += 1
+        if rewind is not None:
+            rewind.clear()
+        while not dead and frames < total_frames:
+            ctx.input.feed(policy.act(scene))
+            if rewind is not None:
+                rewind.push(scene)
+            t0 = perf_counter()
+            scene.update()
+            ms = (perf_counter() - t0) * 1000.0
+            if rewind is not None and ms > hitch_ms and not dead and frames >= next_profile:
+                _reprofile_hitch(ctx, scene, rewind, ms)
+                next_profile = frames + fps
+            frames += 1
+            window_frames += 1
+            if ms > window_max_ms:
+                window_max_ms = ms
+            if frames % report_every == 0:
+                now = perf_counter()
+                live = sum(1 for e in scene.enemies if e.active)
+                shots = sum(1 for p in scene.projectiles if p.active) + len(scene.bullets)
+                print(
+                    f"frame={frames} game_t={scene.frame / fps:.0f}s section={scene.stage.current_section().name} "
+                    f"kills={scene.kills} life={scene.player.life} enemies={live} shots={shots} "
+                    f"ticks/s={window_frames / max(1e-9, now - t_window):.0f} max_update={window_max_ms:.2f}ms",
+                    flush=True,
+                )
+                worst_ms = max(worst_ms, window_max_ms)
+                window_max_ms = 0.0
+                window_frames = 0
+                t_window = now
+        if dead:
+            deaths += 1
+
+    wall = perf_counter() - t_start
+    worst_ms = max(worst_ms, window_max_ms)
+    print(
+        f"policy={policy_name} frames={frames} ({frames / fps / 60:.1f} game-min) sessions={sessions} "
+        f"deaths={deaths} wall={wall:.1f}s ticks/s={frames / max(1e-9, wall):.0f} worst_update={worst_ms:.2f}ms"
+    )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m src.sim.soak", description="Uncapped autopilot soak run.")
+    ap.add_argument("--config", default="config/game.toml")
+    ap.add_argument("--policy", default="stress", choices=sorted(POLICIES))
+    ap.add_argument("--minutes", type=float, default=60.0, help="game minutes to simulate")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--report-every", type=int, default=3600, help="frames between progress lines")
+    ap.add_argument(
+        "--hitch-ms",
+        type=float,
+        default=0.0,
+        help="keep a rewind buffer and re-run (profiled) any update slower than this",
+    )
+    args = ap.parse_args(argv)
+    fps = int(load_config(args.config).data.get("window", {}).get("fps", 60))
+    return soak(
+        args.config, args.policy, int(args.minutes * 60 * fps), args.seed, max(1, args.report_every), args.hitch_ms
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
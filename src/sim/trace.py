@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from src.core.config import _parse_toml_value, load_config, validate_config
+from src.core.statehash import StateTraceWriter, first_divergence, read_trace
+from src.scenes.game_scene import COSMETIC_STATE, GameScene
+from src.sim.batch import apply_overrides
+from src.sim.headless import make_headless_context
+from src.sim.policy import POLICIES, make_policy
+
+
+def record(
+    config_path: str,
+    out: str,
+    seed: int,
+    policy_name: str,
+    frames: int,
+    overrides: list[str],
+    cosmetic: bool = False,
+) -> int:
+    config = load_config(config_path).data
+    pairs = []
+    for spec in overrides:
+        path, _, raw = spec.partition("=")
+        pairs.append((path.strip(), _parse_toml_value(raw)))
+    config = apply_overrides(config, tuple(pairs))
+    validate_config(config, source="overrides")
+
+    writer = StateTraceWriter(out)
+    ctx = make_headless_context(config, seed, trace=writer, skip_cosmetic=not cosmetic)
+    dead: list[int] = []
+    scene = GameScene(ctx, selected_ship="propeller", on_game_over=dead.append)
+    policy = make_policy(policy_name)
+    policy.reset(seed)
+    while scene.frame < frames and not dead:
+        ctx.input.feed(policy.act(scene))
+        scene.update()
+    writer.close()
+    print(f"{out}: {writer.records} frames (seed={seed} policy={policy_name}{' died' if dead else ''})")
+    return 0
+
+
+def compare(path_a: str, path_b: str, gameplay_only: bool = False) -> int:
+    a = read_trace(path_a)
+    b = read_trace(path_b)
+    div = first_divergence(a, b, COSMETIC_STATE if gameplay_only else ())
+    if div is None:
+        print(f"identical: {len(a)} frames")
+        return 0
+    if div.subsystems == ["<length>"]:
+        print(f"identical for {div.index} frames, then one trace ends ({len(a)} vs {len(b)} frames)")
+    else:
+        print(f"first divergence at record {div.index} (frame {div.frame}): {', '.join(div.subsystems)}")
+    return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m src.sim.trace", description="Per-frame state hash traces.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    rec = sub.add_parser("record", help="run one headless session and write its state trace")
+    rec.add_argument("out")
+    rec.add_argument("--config", default="config/game.toml")
+    rec.add_argument("--seed", type=int, default=1)
+    rec.add_argument("--policy", default="stress", choices=sorted(POLICIES))
+    rec.add_argument("--frames", type=int, default=60 * 60)
+    rec.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE")
+    rec.add_argument("--cosmetic", action="store_true", help="also run particles / FX (skipped by default)")
+    cmp_ = sub.add_parser("compare", help="report the first frame and subsystems where two traces differ")
+    cmp_.add_argument("a")
+    cmp_.add_argument("b")
+    cmp_.add_argument("--gameplay-only", action="store_true", help="ignore particles and visual FX state")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "record":
+        return record(args.config, args.out, args.seed, args.policy, args.frames, args.overrides, args.cosmetic)
+    return compare(args.a, args.b, args.gameplay_only)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
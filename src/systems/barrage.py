@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import atan2, degrees
+from typing import Any
+
+from src.core.util import cos_deg, sin_deg
+
+BARRAGE_KINDS = ("radial", "aimed", "spiral", "fan")
+_AXES = {0.0: (1.0, 0.0), 90.0: (0.0, 1.0), 180.0: (-1.0, 0.0), 270.0: (0.0, -1.0)}
+
+
+def _unit(deg: float) -> tuple[float, float]:
+    # exact on the axes, so a straight-left shot has vy == 0.0
+    return _AXES.get(deg % 360.0) or (cos_deg(deg), sin_deg(deg))
+
+
+@dataclass(frozen=True)
+class BarragePattern:
+    # One enemy fire pattern, defined in [barrages.<name>]. A burst is `volleys`
+    # volleys `volley_interval` frames apart, then `cooldown_frames` of rest.
+    name: str
+    kind: str
+    count: int = 1  # bullets per volley
+    speed: float = 2.4
+    angle_deg: float = 180.0  # base direction (0 = right, 90 = down); aimed ignores it
+    spread_deg: float = 0.0  # fan / aimed: total arc covered by the volley
+    spin_deg: float = 0.0  # spiral: added to the base direction every volley
+    volleys: int = 1
+    volley_interval: int = 6
+    cooldown_frames: int = 60
+    damage: int = 10
+    lifetime: int = 120
+    # per-bullet unit vectors relative to the volley direction, built once
+    offsets: tuple[tuple[float, float], ...] = ()
+
+    @staticmethod
+    def build(name: str, merged: dict[str, Any]) -> BarragePattern:
+        kind = str(merged.get("kind", "fan"))
+        if kind not in BARRAGE_KINDS:
+            raise ValueError(f"barrage {name}: unknown kind {kind!r}")
+        count = max(1, int(merged.get("count", 1)))
+        spread = float(merged.get("spread_deg", 0.0))
+        if kind in ("radial", "spiral"):
+            angles = [360.0 * i / count for i in range(count)]
+        elif count == 1:
+            angles = [0.0]
+        else:
+            angles = [spread * (i / (count - 1) - 0.5) for i in range(count)]
+        return BarragePattern(
+            name=name,
+            kind=kind,
+            count=count,
+            speed=float(merged.get("speed", 2.4)),
+            angle_deg=float(merged.get("angle_deg", 180.0)),
+            spread_deg=spread,
+            spin_deg=float(merged.get("spin_deg", 0.0)),
+            volleys=max(1, int(merged.get("volleys", 1))),
+            volley_interval=max(1, int(merged.get("volley_interval", 6))),
+            cooldown_frames=max(1, int(merged.get("cooldown_frames", 60))),
+            damage=int(merged.get("damage", 10)),
+            lifetime=max(1, int(merged.get("lifetime", 120))),
+            offsets=tuple(_unit(a) for a in angles),
+        )
+
+    def volley(
+        self, x: float, y: float, target_x: float, target_y: float, volley_index: int
+    ) -> tuple[list[float], list[float], list[float], list[float]]:
+        # (xs, ys, vxs, vys) for one volley fired from (x, y)
+        if self.kind == "aimed":
+            base = degrees(atan2(target_y - y, target_x - x))
+        elif self.kind == "spiral":
+            base = self.angle_deg + self.spin_deg * volley_index
+        else:
+            base = self.angle_deg
+        ux, uy = _unit(base)
+        bx = ux * self.speed
+        by = uy * self.speed
+        vxs = [bx * ox - by * oy for ox, oy in self.offsets]
+        vys = [by * ox + bx * oy for ox, oy in self.offsets]
+        n = len(vxs)
+        return [x] * n, [y] * n, vxs, vys
+
+
+class BarrageTable:
+    def __init__(self, patterns: dict[str, BarragePattern]) -> None:
+        self._patterns = patterns
+
+    def get(self, name: str) -> BarragePattern:
+        pattern = self._patterns.get(name)
+        if pattern is None:
+            known = ", ".join(sorted(self._patterns)) or "none"
+            raise ValueError(f"unknown barrage: {name} (known [barrages]: {known})")
+        return pattern
+
+    @staticmethod
+    def from_config(config: dict[str, Any]) -> BarrageTable:
+        patterns = {
+            str(name): BarragePattern.build(str(name), raw)
+            for name, raw in config.get("barrages", {}).items()
+            if isinstance(raw, dict)
+        }
+        return BarrageTable(patterns)
+
+
+def single_shot(shot_speed: float, shot_damage: int, cooldown: int) -> BarragePattern:
+    # the classic turret shot: one bullet straight left per cooldown
+    return BarragePattern.build(
+        "single",
+        {
+            "kind": "fan",
+            "count": 1,
+            "speed": shot_speed,
+            "angle_deg": 180.0,
+            "cooldown_frames": cooldown,
+            "damage": shot_damage,
+            "lifetime": 120,
+        },
+    )
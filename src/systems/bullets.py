@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional: browser build / minimal installs use the stdlib arrays
+    np = None  # type: ignore[assignment]
+
+from src.systems.masks import CollisionMask, mask_hits_rect
+
+BULLET_SIZE = 2  # enemy bullets are 2x2 px
+_MARGIN = 24  # culled this far outside the screen
+
+# (name, typecode) per column; both backends use the same layout so save
+# states and state hashes do not depend on which one ran
+_COLUMNS = (("x", "d"), ("y", "d"), ("vx", "d"), ("vy", "d"), ("life", "i"), ("damage", "i"))
+
+
+class ArrayBulletStore:
+    # Enemy bullets as parallel columns, live ones packed in [0, n). Culling
+    # compacts in order, so iteration order (and collision order) is stable.
+    backend = "array"
+
+    def __init__(self, capacity: int) -> None:
+        self.n = 0
+        self.capacity = 0
+        self.high_water = 0
+        self._cols: dict[str, Any] = {}
+        self.grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _new_column(self, code: str, size: int) -> Any:
+        return array(code, bytes(array(code).itemsize * size))
+
+    def grow(self, capacity: int) -> None:
+        if capacity <= self.capacity:
+            return
+        for name, code in _COLUMNS:
+            col = self._new_column(code, capacity)
+            old = self._cols.get(name)
+            if old is not None:
+                col[: self.n] = old[: self.n]
+            self._cols[name] = col
+        self.capacity = capacity
+
+    def clear(self) -> None:
+        self.n = 0
+
+    def emit(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        vxs: Sequence[float],
+        vys: Sequence[float],
+        damage: int,
+        lifetime: int,
+    ) -> int:
+        # Appends as many bullets as fit; returns how many were stored.
+        count = min(len(xs), self.capacity - self.n)
+        if count <= 0:
+            return 0
+        c = self._cols
+        n = self.n
+        for i in range(count):
+            c["x"][n + i] = xs[i]
+            c["y"][n + i] = ys[i]
+            c["vx"][n + i] = vxs[i]
+            c["vy"][n + i] = vys[i]
+            c["life"][n + i] = lifetime
+            c["damage"][n + i] = damage
+        self.n = n + count
+        if self.n > self.high_water:
+            self.high_water = self.n
+        return count
+
+    def update(self, screen_w: int, screen_h: int) -> None:
+        c = self._cols
+        x, y, vx, vy, life, dmg = c["x"], c["y"], c["vx"], c["vy"], c["life"], c["damage"]
+        x_min, x_max = -_MARGIN, screen_w + _MARGIN
+        y_min, y_max = -_MARGIN, screen_h + _MARGIN
+        keep = 0
+        for i in range(self.n):
+            left = life[i] - 1
+            if left <= 0:
+                continue
+            nx = x[i] + vx[i]
+            ny = y[i] + vy[i]
+            if nx < x_min or nx > x_max or ny < y_min or ny > y_max:
+                continue
+            x[keep] = nx
+            y[keep] = ny
+            vx[keep] = vx[i]
+            vy[keep] = vy[i]
+            life[keep] = left
+            dmg[keep] = dmg[i]
+            keep += 1
+        self.n = keep
+
+    def collide(
+        self, rx: float, ry: float, rw: float, rh: float, mask: CollisionMask | None = None
+    ) -> int | None:
+        # Removes every bullet overlapping the rect (and the mask placed at its
+        # corner, if given); returns the damage of the first one (in store
+        # order), or None when nothing hit.
+        c = self._cols
+        x, y = c["x"], c["y"]
+        x0 = rx - BULLET_SIZE
+        y0 = ry - BULLET_SIZE
+        x1 = rx + rw
+        y1 = ry + rh
+        hit = [i for i in range(self.n) if x0 < x[i] < x1 and y0 < y[i] < y1]
+        if hit and mask is not None:
+            hit = _mask_filter(hit, x, y, mask, rx, ry)
+        if not hit:
+            return None
+        first = c["damage"][hit[0]]
+        self._remove(hit)
+        return first
+
+    def _remove(self, indices: list[int]) -> None:
+        drop = set(indices)
+        keep = 0
+        cols = [self._cols[name] for name, _ in _COLUMNS]
+        for i in range(self.n):
+            if i in drop:
+                continue
+            if keep != i:
+                for col in cols:
+                    col[keep] = col[i]
+            keep += 1
+        self.n = keep
+
+    def rows(self) -> Iterable[tuple[float, float, float, float]]:
+        # (x, y, vx, vy) of live bullets, for drawing and the autopilot bots
+        n = self.n
+        c = self._cols
+        return zip(c["x"][:n], c["y"][:n], c["vx"][:n], c["vy"][:n])
+
+    def get_state(self) -> tuple[Any, ...]:
+        n = self.n
+        return (n, *(self._cols[name][:n].tobytes() for name, _ in _COLUMNS))
+
+    def set_state(self, state: tuple[Any, ...]) -> None:
+        n = state[0]
+        self.grow(n)
+        for (name, code), raw in zip(_COLUMNS, state[1:]):
+            self._cols[name][:n] = array(code, raw)
+        self.n = n
+
+
+class NumpyBulletStore(ArrayBulletStore):
+    # Same layout and semantics as ArrayBulletStore, with update / collide as
+    # whole-column operations (thousands of bullets per frame).
+    backend = "numpy"
+
+    def _new_column(self, code: str, size: int) -> Any:
+        return np.zeros(size, dtype=np.float64 if code == "d" else np.int32)
+
+    def emit(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        vxs: Sequence[float],
+        vys: Sequence[float],
+        damage: int,
+        lifetime: int,
+    ) -> int:
+        count = min(len(xs), self.capacity - self.n)
+        if count <= 0:
+            return 0
+        c = self._cols
+        n = self.n
+        end = n + count
+        c["x"][n:end] = xs[:count]
+        c["y"][n:end] = ys[:count]
+        c["vx"][n:end] = vxs[:count]
+        c["vy"][n:end] = vys[:count]
+        c["life"][n:end] = lifetime
+        c["damage"][n:end] = damage
+        self.n = end
+        if end > self.high_water:
+            self.high_water = end
+        return count
+
+    def update(self, screen_w: int, screen_h: int) -> None:
+        n = self.n
+        if n == 0:
+            return
+        c = self._cols
+        x, y, life = c["x"][:n], c["y"][:n], c["life"][:n]
+        x += c["vx"][:n]
+        y += c["vy"][:n]
+        life -= 1
+        keep = (life > 0) & (x >= -_MARGIN) & (x <= screen_w + _MARGIN) & (y >= -_MARGIN) & (y <= screen_h + _MARGIN)
+        if not keep.all():
+            self._compact(keep)
+
+    def collide(
+        self, rx: float, ry: float, rw: float, rh: float, mask: CollisionMask | None = None
+    ) -> int | None:
+        n = self.n
+        if n == 0:
+            return None
+        c = self._cols
+        x, y = c["x"][:n], c["y"][:n]
+        hit = (x > rx - BULLET_SIZE) & (x < rx + rw) & (y > ry - BULLET_SIZE) & (y < ry + rh)
+        if not hit.any():
+            return None
+        if mask is not None:
+            # the rect pass leaves a handful of candidates; test those in Python
+            candidates = np.flatnonzero(hit).tolist()
+            kept = _mask_filter(candidates, x, y, mask, rx, ry)
+            if not kept:
+                return None
+            if len(kept) != len(candidates):
+                hit = np.zeros(n, dtype=bool)
+                hit[kept] = True
+        first = int(c["damage"][:n][hit][0])
+        self._compact(~hit)
+        return first
+
+    def _compact(self, keep: Any) -> None:
+        n = self.n
+        k = int(keep.sum())
+        for name, _ in _COLUMNS:
+            col = self._cols[name]
+            col[:k] = col[:n][keep]
+        self.n = k
+
+    def rows(self) -> Iterable[tuple[float, float, float, float]]:
+        n = self.n
+        c = self._cols
+        return zip(c["x"][:n].tolist(), c["y"][:n].tolist(), c["vx"][:n].tolist(), c["vy"][:n].tolist())
+
+    def set_state(self, state: tuple[Any, ...]) -> None:
+        n = state[0]
+        self.grow(n)
+        for (name, _), raw in zip(_COLUMNS, state[1:]):
+            col = self._cols[name]
+            col[:n] = np.frombuffer(raw, dtype=col.dtype)
+        self.n = n
+
+
+def _mask_filter(indices: list[int], x: Any, y: Any, mask: CollisionMask, mx: float, my: float) -> list[int]:
+    return [i for i in indices if mask_hits_rect(mask, mx, my, x[i], y[i], BULLET_SIZE, BULLET_SIZE)]
+
+
+def make_bullet_store(capacity: int, backend: str = "auto") -> ArrayBulletStore:
+    if backend == "numpy" and np is None:
+        raise ValueError("bullets.backend = 'numpy' but numpy is not installed")
+    if backend not in ("auto", "numpy", "array"):
+        raise ValueError(f"unknown bullets backend: {backend}")
+    if backend == "array" or np is None:
+        return ArrayBulletStore(capacity)
+    return NumpyBulletStore(capacity)
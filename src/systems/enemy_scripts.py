@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from src.core.names import BEHAVIOUR_NAMES, WAVE_NAMES
+from src.systems.scripting import AllDead, Reach, ScriptFn, Wait
+
+
+# Commands for GameScene._script_act.
+@dataclass(frozen=True)
+class Move:
+    mul: float  # the enemy's horizontal speed multiplier from the next frame on
+
+
+@dataclass(frozen=True)
+class Fire:
+    pass  # next volley of the enemy's barrage, then sleep until its cooldown is over
+
+
+@dataclass(frozen=True)
+class Spawn:
+    kind: str
+    pattern: str
+    x: int
+    y: int
+
+
+# Behaviours: the spawn pattern name picks one; every behaviour gets
+# (shoot cooldown, screen width, screen height). Speed changes apply from the
+# frame after the one the script runs in; the spawn frame moves at full speed.
+def stop_shoot(cooldown: int, w: int, h: int) -> Iterator[Any]:
+    # fly in for 39 frames, then crawl and fire whenever the barrage allows
+    yield Wait(38)
+    yield Move(0.3)
+    yield Wait(max(1, cooldown))
+    while True:
+        yield Fire()
+
+
+def hover(cooldown: int, w: int, h: int) -> Iterator[Any]:
+    # fly in to two thirds of the screen, hold for three volleys, then dash off
+    yield Reach(w * 2 // 3)
+    yield Move(0.0)
+    yield Wait(max(1, cooldown // 2))
+    for _ in range(3):
+        yield Fire()
+    yield Move(1.8)
+
+
+# Wave scripts: a stage section's `script` runs one when the section begins,
+# with (screen width, screen height).
+def pincer(w: int, h: int) -> Iterator[Any]:
+    # two rows of drones along the edges; a hovering turret once both are down
+    for i in range(4):
+        yield Spawn("drone", "straight", w + 10 + i * 16, 12)
+        yield Spawn("drone", "straight", w + 10 + i * 16, h - 28)
+    yield AllDead()
+    yield Wait(30)
+    yield Spawn("turret", "hover", w + 10, h // 2 - 4)
+
+
+def gauntlet(w: int, h: int) -> Iterator[Any]:
+    # hovering turrets one at a time, each after the last is gone
+    for y in (h // 4, h // 2, h * 3 // 4):
+        yield Spawn("turret", "hover", w + 10, y - 4)
+        yield AllDead()
+        yield Wait(20)
+
+
+BEHAVIOURS: dict[str, ScriptFn] = {"stop_shoot": stop_shoot, "hover": hover}
+WAVES: dict[str, ScriptFn] = {"pincer": pincer, "gauntlet": gauntlet}
+# config validation only sees the names
+if set(BEHAVIOURS) != set(BEHAVIOUR_NAMES) or set(WAVES) != set(WAVE_NAMES):
+    raise RuntimeError("enemy_scripts: BEHAVIOURS / WAVES do not match names.BEHAVIOUR_NAMES / WAVE_NAMES")
+
+
+def wave_spawns(name: str, w: int, h: int, limit: int = 1000) -> list[Spawn]:
+    # What a wave script spawns, found by running it with every wait skipped
+    # (scripts are pure, so this is what a game would see). Endless waves
+    # are cut off after `limit` values.
+    out: list[Spawn] = []
+    for i, value in enumerate(WAVES[name](w, h)):
+        if i >= limit:
+            break
+        if isinstance(value, Spawn):
+            out.append(value)
+    return out
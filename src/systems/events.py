@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Union
+
+from src.entities.enemy import Enemy
+
+
+@dataclass
+class EnemyKilled:
+    enemy: Enemy
+    cause: str  # weapon kind, "burn" or "collision"
+
+
+@dataclass
+class ItemDropped:
+    kind: str
+    x: float
+    y: float
+
+
+@dataclass
+class PlayerHit:
+    damage: int
+    x: float
+    y: float
+
+
+@dataclass
+class ExplosionRequested:
+    x: float
+    y: float
+    count: int  # particles
+    sound: int = -1  # played once per drain however many explosions request it
+
+
+GameEvent = Union[EnemyKilled, ItemDropped, PlayerHit, ExplosionRequested]
+
+
+class EventQueue:
+    # Hot loops only append; GameScene drains the queue once per frame. Handlers
+    # may push follow-up events (a kill requests an explosion and maybe a drop),
+    # which land in the next batch of the same drain.
+    def __init__(self) -> None:
+        self._events: list[GameEvent] = []
+        self._listeners: list[Callable[[list[GameEvent]], None]] = []
+        self.push = self._events.append
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add_listener(self, listener: Callable[[list[GameEvent]], None]) -> None:
+        # called with every drained batch after the scene handled it (telemetry, debug)
+        self._listeners.append(listener)
+
+    def take(self) -> list[GameEvent]:
+        batch = self._events[:]
+        self._events.clear()
+        return batch
+
+    def notify(self, batch: list[GameEvent]) -> None:
+        for listener in self._listeners:
+            listener(batch)
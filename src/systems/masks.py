@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import ceil, floor
+
+from src.core.sprite_patterns import collision_patterns
+from src.core.types import Rect
+
+
+@dataclass(frozen=True)
+class CollisionMask:
+    # One packed int per row, bit x set = opaque pixel at column x.
+    w: int
+    h: int
+    rows: tuple[int, ...]
+
+    @staticmethod
+    def from_pattern(pattern: list[str]) -> CollisionMask:
+        rows = tuple(sum(1 << x for x, ch in enumerate(row) if ch != " ") for row in pattern)
+        return CollisionMask(max((len(row) for row in pattern), default=0), len(pattern), rows)
+
+    @staticmethod
+    def solid(w: int, h: int) -> CollisionMask:
+        return CollisionMask(w, h, ((1 << w) - 1,) * h)
+
+    def crop(self, x: int, y: int, w: int, h: int) -> CollisionMask:
+        # the part under a hitbox; pixels outside the sprite are empty
+        keep = (1 << w) - 1
+        rows = tuple(
+            (self.rows[sy] >> x if x >= 0 else self.rows[sy] << -x) & keep if 0 <= sy < self.h else 0
+            for sy in range(y, y + h)
+        )
+        return CollisionMask(w, h, rows)
+
+
+def masks_overlap(a: CollisionMask, ax: float, ay: float, b: CollisionMask, bx: float, by: float) -> bool:
+    # Masks sit at (ax, ay) / (bx, by) snapped to the pixel grid the way
+    # draw() snaps sprites, so hits match what is on screen.
+    dx = floor(bx) - floor(ax)
+    dy = floor(by) - floor(ay)
+    y0 = max(0, dy)
+    y1 = min(a.h, dy + b.h)
+    ar, br = a.rows, b.rows
+    if dx >= 0:
+        for y in range(y0, y1):
+            if ar[y] & (br[y - dy] << dx):
+                return True
+    else:
+        for y in range(y0, y1):
+            if (ar[y] << -dx) & br[y - dy]:
+                return True
+    return False
+
+
+def mask_hits_rect(m: CollisionMask, mx: float, my: float, rx: float, ry: float, rw: float, rh: float) -> bool:
+    # mask against a solid rect (beams, enemy bullets)
+    ox = floor(mx)
+    oy = floor(my)
+    x0 = max(0, floor(rx) - ox)
+    x1 = min(m.w, ceil(rx + rw) - ox)
+    if x0 >= x1:
+        return False
+    band = ((1 << (x1 - x0)) - 1) << x0
+    rows = m.rows
+    for y in range(max(0, floor(ry) - oy), min(m.h, ceil(ry + rh) - oy)):
+        if rows[y] & band:
+            return True
+    return False
+
+
+def masked_hit(a_mask: CollisionMask | None, a: Rect, b_mask: CollisionMask | None, b: Rect) -> bool:
+    # Narrow phase after an aabb() hit; each mask has its origin at its rect's
+    # corner, None means the rect is solid.
+    if a_mask is None:
+        return b_mask is None or mask_hits_rect(b_mask, b.x, b.y, a.x, a.y, a.w, a.h)
+    if b_mask is None:
+        return mask_hits_rect(a_mask, a.x, a.y, b.x, b.y, b.w, b.h)
+    return masks_overlap(a_mask, a.x, a.y, b_mask, b.x, b.y)
+
+
+class MaskSet:
+    def __init__(self, masks: dict[str, CollisionMask]) -> None:
+        self._masks = masks
+        self._hitboxes: dict[tuple[str, int, int, int, int], CollisionMask] = {}
+
+    def hitbox(self, key: str, x: int, y: int, w: int, h: int) -> CollisionMask:
+        # Sprite mask cropped to a hitbox at (x, y) inside the sprite; built
+        # once per (sprite, hitbox). Unknown sprites collide as a solid box.
+        k = (key, x, y, w, h)
+        mask = self._hitboxes.get(k)
+        if mask is None:
+            sprite = self._masks.get(key)
+            mask = sprite.crop(x, y, w, h) if sprite is not None else CollisionMask.solid(w, h)
+            self._hitboxes[k] = mask
+        return mask
+
+
+def build_masks() -> MaskSet:
+    return MaskSet({key: CollisionMask.from_pattern(p) for key, p in collision_patterns().items()})
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import ceil
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class PoolStats:
+    capacity: int
+    max_capacity: int
+    high_water: int = 0  # highest slot used + 1 (spawns take the first free slot)
+    exhausted: int = 0  # spawns that found every slot busy
+    dropped: int = 0  # exhausted spawns that were lost (pool at max_capacity or growth off)
+    grown: int = 0
+
+
+@dataclass
+class PoolPolicy:
+    grow: bool = True
+    factor: float = 1.5
+    grow_at: float = 0.75  # grow at the end of a frame once high_water passes this share of capacity
+    max_scale: float = 4.0  # max_capacity = configured capacity * max_scale
+
+    @staticmethod
+    def from_config(config: dict[str, Any]) -> PoolPolicy:
+        pools = config.get("pools", {})
+        return PoolPolicy(
+            grow=bool(pools.get("grow", True)),
+            factor=max(1.1, float(pools.get("grow_factor", 1.5))),
+            grow_at=float(pools.get("grow_at", 0.75)),
+            max_scale=max(1.0, float(pools.get("max_scale", 4.0))),
+        )
+
+    def new_stats(self, capacity: int) -> PoolStats:
+        max_capacity = int(capacity * self.max_scale) if self.grow else capacity
+        return PoolStats(capacity=capacity, max_capacity=max_capacity)
+
+    def wants_growth(self, stats: PoolStats) -> bool:
+        return self.grow and stats.capacity < stats.max_capacity and stats.high_water > stats.capacity * self.grow_at
+
+    def next_capacity(self, stats: PoolStats) -> int:
+        return min(stats.max_capacity, max(stats.capacity + 1, int(ceil(stats.capacity * self.factor))))
+
+
+def grow_pool(pool: list[T], stats: PoolStats, make: Callable[[], T], capacity: int) -> None:
+    # Appends inactive slots; existing slot indices (save states, rewind) stay valid.
+    pool.extend(make() for _ in range(capacity - len(pool)))
+    stats.capacity = len(pool)
+    stats.max_capacity = max(stats.max_capacity, stats.capacity)
+    stats.grown += 1
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+ScriptFn = Callable[..., Iterator[Any]]
+
+
+# Wait conditions a script can yield; anything else it yields is a command.
+@dataclass(frozen=True)
+class Wait:
+    frames: int  # resume this many frames later (0 = carry on now)
+
+
+@dataclass(frozen=True)
+class Reach:
+    x: float  # resume once the actor is at or left of x (enemies fly leftwards)
+
+
+@dataclass(frozen=True)
+class AllDead:
+    pass  # resume once everything this script spawned is gone
+
+
+@dataclass
+class Script:
+    sid: int  # start order; breaks ties between scripts due on the same frame
+    name: str
+    args: tuple[Any, ...]
+    actor: Any  # entity the script drives (anything with .active); None for wave scripts
+    gen: Iterator[Any]
+    steps: int = 0  # values taken from gen so far
+    wake: int = 0
+    until: Reach | AllDead | None = None  # condition the script is parked on
+    children: list[Any] = field(default_factory=list)  # spawned by this script (AllDead)
+
+
+class ScriptRunner:
+    # Enemy behaviours and wave scripts as generators. A script yields wait
+    # conditions (Wait / Reach / AllDead) and commands; commands go to
+    # act(script, command), which returns the frames the script then sleeps.
+    # Sleeping scripts sit in a heap keyed by wake frame, so a frame only
+    # touches the scripts that are due. Reach asks eta(actor, x) for the frames
+    # still to go (0 = there) and re-checks when they are up, instead of
+    # testing the position every frame.
+    # Scripts must be pure: what they need comes in as args and they see the
+    # world only through their waits. (name, args, steps) then rebuilds one
+    # for a save state by replaying its first `steps` values.
+    def __init__(
+        self,
+        library: dict[str, ScriptFn],
+        act: Callable[[Script, Any], int],
+        eta: Callable[[Any, float], int],
+    ) -> None:
+        self._library = library
+        self._act = act
+        self._eta = eta
+        self._scripts: dict[int, Script] = {}
+        self._heap: list[tuple[int, int]] = []  # (wake, sid), one entry per script
+        self._next_sid = 0
+        self.resumed = 0  # scripts resumed by the last update()
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._library
+
+    def start(self, name: str, args: tuple[Any, ...], actor: Any, frame: int) -> Script:
+        # runs up to its first wait in the update() of `frame`
+        script = Script(self._next_sid, name, args, actor, self._library[name](*args), wake=frame)
+        self._next_sid += 1
+        self._scripts[script.sid] = script
+        heapq.heappush(self._heap, (frame, script.sid))
+        return script
+
+    def clear(self) -> None:
+        self._scripts.clear()
+        self._heap.clear()
+        self._next_sid = 0
+
+    def update(self, frame: int) -> None:
+        heap = self._heap
+        scripts = self._scripts
+        resumed = 0
+        while heap and heap[0][0] <= frame:
+            _, sid = heapq.heappop(heap)
+            script = scripts[sid]
+            if script.actor is not None and not script.actor.active:
+                del scripts[sid]
+                continue
+            resumed += 1
+            self._resume(script, frame)
+        self.resumed = resumed
+
+    def prune(self) -> None:
+        # drop the scripts of dead actors now rather than when they would wake
+        dead = [sid for sid, s in self._scripts.items() if s.actor is not None and not s.actor.active]
+        if not dead:
+            return
+        for sid in dead:
+            del self._scripts[sid]
+        self._heap = [(s.wake, s.sid) for s in self._scripts.values()]
+        heapq.heapify(self._heap)
+
+    def _resume(self, script: Script, frame: int) -> None:
+        sleep = self._check(script) if script.until is not None else 0
+        while sleep == 0:
+            try:
+                value = next(script.gen)
+            except StopIteration:
+                del self._scripts[script.sid]
+                return
+            script.steps += 1
+            script.until = None
+            if isinstance(value, Wait):
+                sleep = max(0, value.frames)
+            elif isinstance(value, (Reach, AllDead)):
+                script.until = value
+                sleep = self._check(script)
+            else:
+                sleep = self._act(script, value)
+        script.wake = frame + sleep
+        heapq.heappush(self._heap, (script.wake, script.sid))
+
+    def _check(self, script: Script) -> int:
+        # frames until the awaited condition may hold, 0 = it holds now
+        if isinstance(script.until, Reach):
+            return self._eta(script.actor, script.until.x)
+        script.children = [c for c in script.children if c.active]
+        return 1 if script.children else 0
+
+    def get_state(self, index: Callable[[Any], int]) -> tuple[Any, ...]:
+        # index(entity) -> its position in the saved entity list (-1 for None)
+        return tuple(
+            (s.name, s.args, index(s.actor), s.steps, s.wake, tuple(index(c) for c in s.children if c.active))
+            for s in self._scripts.values()
+            if s.actor is None or s.actor.active
+        )
+
+    def set_state(self, state: tuple[Any, ...], actors: list[Any]) -> None:
+        self.clear()
+        for name, args, actor, steps, wake, children in state:
+            script = self.start(name, args, actors[actor] if actor >= 0 else None, wake)
+            script.children = [actors[i] for i in children]
+            value = None
+            for _ in range(steps):
+                value = next(script.gen)
+            script.steps = steps
+            if isinstance(value, (Reach, AllDead)):
+                script.until = value
+
+    def overlay_text(self) -> str:
+        return f"SCRIPTS n={len(self._scripts)} resumed={self.resumed}"
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import log
+from random import Random
+from typing import Any, Sequence
+
+from src.core.names import split_spec
+
+
+@dataclass(frozen=True)
+class SpawnSpec:
+    kind: str
+    pattern: str
+
+
+class AliasTable:
+    # Vose's alias method: O(n) build, O(1) sample with a single rng.random() call.
+    def __init__(self, weights: Sequence[float]) -> None:
+        n = len(weights)
+        if n == 0:
+            raise ValueError("alias table needs at least one weight")
+        total = float(sum(max(0.0, float(w)) for w in weights))
+        if total <= 0.0:
+            raise ValueError("alias table weights must sum to a positive value")
+        scaled = [max(0.0, float(w)) * n / total for w in weights]
+        prob = [0.0] * n
+        alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = (scaled[g] + scaled[s]) - 1.0
+            if scaled[g] < 1.0:
+                small.append(g)
+            else:
+                large.append(g)
+        # leftovers are 1.0 up to float error
+        for i in large:
+            prob[i] = 1.0
+            alias[i] = i
+        for i in small:
+            prob[i] = 1.0
+            alias[i] = i
+        self._n = n
+        self._prob = prob
+        self._alias = alias
+
+    def __len__(self) -> int:
+        return self._n
+
+    def sample(self, rng: Random) -> int:
+        u = rng.random() * self._n
+        i = int(u)
+        if u - i < self._prob[i]:
+            return i
+        return self._alias[i]
+
+
+@dataclass(frozen=True)
+class SpawnTable:
+    specs: tuple[SpawnSpec, ...]
+    sampler: AliasTable
+    formation: tuple[SpawnSpec, ...]
+
+    def choose(self, rng: Random) -> SpawnSpec:
+        return self.specs[self.sampler.sample(rng)]
+
+
+DEFAULT_SPAWNS = ("drone:dash", "fighter:sine", "turret:stop_shoot")
+DEFAULT_SPAWN_WEIGHTS = (0.35, 0.35, 0.30)
+DEFAULT_FORMATION = ("drone", "fighter", "drone")
+
+
+def _parse_spec(raw: Any) -> SpawnSpec:
+    kind, pattern = split_spec(raw)
+    return SpawnSpec(kind=kind, pattern=pattern)
+
+
+def build_spawn_table(spawns: Any, weights: Any, formation: Any) -> SpawnTable:
+    if isinstance(spawns, (list, tuple)) and spawns:
+        entries = list(spawns)
+        raw_weights = list(weights) if isinstance(weights, (list, tuple)) and weights else []
+    else:
+        entries = list(DEFAULT_SPAWNS)
+        raw_weights = list(DEFAULT_SPAWN_WEIGHTS)
+    if len(raw_weights) != len(entries):
+        # missing or mismatched weights: uniform over the listed entries
+        raw_weights = [1.0] * len(entries)
+    kinds = list(formation) if isinstance(formation, (list, tuple)) and formation else list(DEFAULT_FORMATION)
+    return SpawnTable(
+        specs=tuple(_parse_spec(e) for e in entries),
+        sampler=AliasTable([float(w) for w in raw_weights]),
+        formation=tuple(SpawnSpec(kind=str(k), pattern="formation") for k in kinds),
+    )
+
+
+def geometric_gap(rng: Random, p: float) -> int:
+    # Frames until the next success of a per-frame Bernoulli(p) trial (>= 1).
+    # Drawing the gap once replaces one rng.random() call per frame.
+    if p >= 1.0:
+        return 1
+    if p <= 0.0:
+        return 1 << 30
+    return 1 + int(log(1.0 - rng.random()) / log(1.0 - p))
@@ -2,91 +2,152 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from random import Random
+from typing import Any
 
+from src.core.names import SPAWN_MODES
 from src.core.types import Vec2
-from src.entities.enemy import Enemy
+from src.entities.enemy import Enemy, EnemyArchetypeTable
+from src.systems.spawn_table import SpawnSpec, SpawnTable, geometric_gap
+from src.systems.stage import StageSection
 
 
 @dataclass(frozen=True)
-class SpawnSpec:
-    kind: str
-    pattern: str
+class SpawnEvent:
+    frame: int
+    spec: SpawnSpec
+    x: int
+    y: int
 
 
 class Spawner:
-    def __init__(self, rng: Random, screen_w: int, screen_h: int) -> None:
+    def __init__(
+        self,
+        rng: Random,
+        screen_w: int,
+        screen_h: int,
+        archetypes: EnemyArchetypeTable,
+        *,
+        mode: str = "stream",
+        formation_chance: float = 0.12,
+        formation_cooldown: int = 120,
+    ) -> None:
+        if mode not in SPAWN_MODES:
+            raise ValueError(f"unknown spawn mode: {mode}")
         self._rng = rng
         self._w = screen_w
         self._h = screen_h
-        self._formation_timer = 0
+        self._archetypes = archetypes
+        self._timeline = mode == "timeline"
+        self._formation_chance = formation_chance
+        self._formation_cooldown = max(1, formation_cooldown)
+        self._table: SpawnTable | None = None
+        self._spawn_rate = 0.0
+        # stream mode: frames until the next single / formation spawn
+        self._spawn_wait = 0
+        self._formation_wait = 0
+        # timeline mode: sorted events for the current section + cursor
+        self._events: list[SpawnEvent] = []
+        self._cursor = 0
+        self._frame = 0
 
-    def update(self, spawn_rate: float, enemies: list[Enemy], section_name: str) -> None:
-        self._formation_timer = max(0, self._formation_timer - 1)
-        if self._formation_timer == 0 and self._rng.random() < spawn_rate * 0.12:
-            self._formation_timer = 120
-            self._spawn_formation(enemies, section_name)
+    def begin_section(self, section: StageSection, frames: int) -> None:
+        self._table = section.spawn_table
+        self._spawn_rate = section.spawn_rate
+        self._spawn_wait = geometric_gap(self._rng, self._spawn_rate)
+        self._formation_wait = geometric_gap(self._rng, self._spawn_rate * self._formation_chance)
+        self._frame = 0
+        self._cursor = 0
+        self._events = []
+        if self._timeline:
+            self._events = self._build_timeline(frames)
+
+    def update(self, enemies: list[Enemy]) -> None:
+        if self._table is None:
             return
-        if self._rng.random() >= spawn_rate:
+        if self._timeline:
+            self._frame += 1
+            events = self._events
+            while self._cursor < len(events) and events[self._cursor].frame <= self._frame:
+                ev = events[self._cursor]
+                enemies.append(self._create_enemy(ev.spec, ev.x, ev.y))
+                self._cursor += 1
             return
-        spec = self._choose_enemy(section_name)
-        x = self._w + 10
-        y = self._rng.randint(8, self._h - 32)
-        enemies.append(self._create_enemy(spec, x, y))
-
-    def _choose_enemy(self, section_name: str) -> SpawnSpec:
-        r = self._rng.random()
-        if section_name == "moon":
-            if r < 0.65:
-                return SpawnSpec(kind="drone", pattern="straight")
-            if r < 0.88:
-                return SpawnSpec(kind="fighter", pattern="sine")
-            return SpawnSpec(kind="turret", pattern="stop_shoot")
-        if section_name == "space":
-            if r < 0.55:
-                return SpawnSpec(kind="fighter", pattern="sine")
-            if r < 0.80:
-                return SpawnSpec(kind="drone", pattern="dash")
-            return SpawnSpec(kind="turret", pattern="stop_shoot")
-        if section_name == "planet1":
-            if r < 0.45:
-                return SpawnSpec(kind="drone", pattern="wave")
-            if r < 0.78:
-                return SpawnSpec(kind="fighter", pattern="sine")
-            return SpawnSpec(kind="turret", pattern="stop_shoot")
-        # planet2
-        if r < 0.35:
-            return SpawnSpec(kind="drone", pattern="dash")
-        if r < 0.70:
-            return SpawnSpec(kind="fighter", pattern="sine")
-        return SpawnSpec(kind="turret", pattern="stop_shoot")
+
+        spawned = self._step(self._table)
+        if spawned is not None:
+            for spec, x, y in spawned:
+                enemies.append(self._create_enemy(spec, x, y))
+
+    def get_state(self) -> tuple[Any, ...]:
+        events = tuple((ev.frame, ev.spec.kind, ev.spec.pattern, ev.x, ev.y) for ev in self._events)
+        return (self._spawn_rate, self._spawn_wait, self._formation_wait, self._frame, self._cursor, events)
+
+    def set_state(self, state: tuple[Any, ...], section: StageSection) -> None:
+        # the spawn table is not serialized; it always belongs to the current section
+        self._table = section.spawn_table
+        self._spawn_rate, self._spawn_wait, self._formation_wait, self._frame, self._cursor, events = state
+        self._events = [
+            SpawnEvent(frame=f, spec=SpawnSpec(kind=k, pattern=pat), x=x, y=y) for f, k, pat, x, y in events
+        ]
+
+    def _step(self, table: SpawnTable) -> list[tuple[SpawnSpec, int, int]] | None:
+        # Advance one frame of the spawn process; same distribution as rolling
+        # formation / single spawns every frame, but rng is only touched on spawns.
+        self._formation_wait -= 1
+        self._spawn_wait -= 1
+        if self._formation_wait <= 0:
+            self._formation_wait = self._formation_cooldown - 1 + geometric_gap(
+                self._rng, self._spawn_rate * self._formation_chance
+            )
+            if self._spawn_wait <= 0:
+                self._spawn_wait = geometric_gap(self._rng, self._spawn_rate)
+            return self._formation(table)
+        if self._spawn_wait > 0:
+            return None
+        self._spawn_wait = geometric_gap(self._rng, self._spawn_rate)
+        spec = table.choose(self._rng)
+        return [(spec, self._w + 10, self._rng.randint(8, self._h - 32))]
+
+    def _formation(self, table: SpawnTable) -> list[tuple[SpawnSpec, int, int]]:
+        base_y = self._rng.randint(12, self._h - 48)
+        return [
+            (spec, self._w + 10 + i * 20, base_y + i * 10)
+            for i, spec in enumerate(table.formation)
+        ]
+
+    def _build_timeline(self, frames: int) -> list[SpawnEvent]:
+        assert self._table is not None
+        events: list[SpawnEvent] = []
+        frame = 0
+        while True:
+            # skip straight to the next due frame
+            skip = min(self._spawn_wait, self._formation_wait) - 1
+            if skip > 0:
+                self._spawn_wait -= skip
+                self._formation_wait -= skip
+                frame += skip
+            frame += 1
+            if frame > frames:
+                break
+            spawned = self._step(self._table)
+            if spawned is None:
+                continue
+            for spec, x, y in spawned:
+                events.append(SpawnEvent(frame=frame, spec=spec, x=x, y=y))
+        return events
+
+    def create(self, kind: str, pattern: str, x: int, y: int) -> Enemy:
+        # scripted spawns (wave scripts)
+        return self._create_enemy(SpawnSpec(kind=kind, pattern=pattern), x, y)
 
     def _create_enemy(self, spec: SpawnSpec, x: int, y: int) -> Enemy:
-        if spec.kind == "turret":
-            hp = 4
-            score = 2
-        elif spec.kind == "fighter":
-            hp = 3
-            score = 1
-        else:
-            hp = 2
-            score = 1
+        arch = self._archetypes.get(spec.kind)
         return Enemy(
             active=True,
-            kind=spec.kind,
+            arch=arch,
             pos=Vec2(float(x), float(y)),
-            vel=Vec2(-1.4, 0.0),
-            hp=hp,
+            hp=arch.hp,
             timer=0,
             pattern=spec.pattern,
-            w=12,
-            h=8,
-            score=score,
-            shoot_cooldown=60,
+            shoot_cooldown=arch.shoot_cooldown,
         )
-
-    def _spawn_formation(self, enemies: list[Enemy], section_name: str) -> None:
-        base_y = self._rng.randint(12, self._h - 48)
-        kinds = ["drone", "fighter", "drone"] if section_name != "moon" else ["drone", "drone", "drone"]
-        for i, kind in enumerate(kinds):
-            spec = SpawnSpec(kind=kind, pattern="formation")
-            enemies.append(self._create_enemy(spec, self._w + 10 + i * 20, base_y + i * 10))
@@ -1,21 +1,41 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from math import ceil
 from typing import Any
 
 import pyxel
 
+from src.core.scheduler import FrameScheduler
+from src.systems.spawn_table import SpawnTable, build_spawn_table
+
+DEFAULT_LAYERS = ("far:0.3", "near:1.0")
+
 
 @dataclass
 class StageSection:
     name: str
     distance: float
     spawn_rate: float
+    spawn_table: SpawnTable
+    # background layers back to front: (theme layer name, parallax factor)
+    layers: tuple[tuple[str, float], ...] = ()
+    script: str = ""  # wave script started when the section begins ("" = none)
+
+
+def parse_layers(raw: Any) -> tuple[tuple[str, float], ...]:
+    # ["far:0.3", "near:1.0"]; a missing factor scrolls with the stage
+    out = []
+    for entry in raw if isinstance(raw, list) else DEFAULT_LAYERS:
+        name, _, speed = str(entry).partition(":")
+        out.append((name.strip(), float(speed) if speed.strip() else 1.0))
+    return tuple(out)
 
 
 class Stage:
-    def __init__(self, config: dict[str, Any], assets: Any) -> None:
+    def __init__(self, config: dict[str, Any], assets: Any, tasks: FrameScheduler | None = None) -> None:
         self._assets = assets
+        self._tasks = tasks
         stage = config.get("stage", {})
         self.scroll_speed = float(stage.get("scroll_speed", 1.2))
         self.sections: list[StageSection] = []
@@ -25,44 +45,97 @@ class Stage:
                     name=str(sec.get("name", "moon")),
                     distance=float(sec.get("distance", 900)),
                     spawn_rate=float(sec.get("spawn_rate", 0.06)),
+                    spawn_table=build_spawn_table(sec.get("spawns"), sec.get("spawn_weights"), sec.get("formation")),
+                    layers=parse_layers(sec.get("layers")),
+                    script=str(sec.get("script", "")),
                 )
             )
         if not self.sections:
-            self.sections = [StageSection(name="moon", distance=900, spawn_rate=0.06)]
+            self.sections = [
+                StageSection(
+                    name="moon",
+                    distance=900,
+                    spawn_rate=0.06,
+                    spawn_table=build_spawn_table(None, None, None),
+                    layers=parse_layers(None),
+                )
+            ]
 
         self.section_index = 0
         self.section_progress = 0.0
         self.scroll_x = 0.0
-        self._assets.apply_theme(self.current_section().name)
+        self._strips: list[Any] = []  # current section's layer strips (none headless)
+        self._apply_theme()
+
+    def reset(self) -> None:
+        self.section_progress = 0.0
+        self.scroll_x = 0.0
+        if self.section_index != 0:
+            self.section_index = 0
+            self._apply_theme()
+        else:
+            self._defer_next()
+
+    def _apply_theme(self) -> None:
+        section = self.current_section()
+        self._strips = self._assets.apply_theme(section.name, [name for name, _ in section.layers])
+        # the next section's theme gets built in the background meanwhile, and
+        # its strips rendered on some frame with time to spare
+        self._assets.prefetch_theme(self._upcoming().name)
+        self._defer_next()
+
+    def _upcoming(self) -> StageSection:
+        return self.sections[(self.section_index + 1) % len(self.sections)]
+
+    def _defer_next(self) -> None:
+        # also after the owner's scheduler dropped its pending one-shots
+        upcoming = self._upcoming()
+        if self._tasks is not None and upcoming is not self.current_section():
+            names = [name for name, _ in upcoming.layers]
+            left = (self.current_section().distance - self.section_progress) / max(1e-6, self.scroll_speed)
+            max_delay = max(0, int(left) - 60)
+            self._tasks.defer("next_strips", lambda: self._assets.apply_theme(upcoming.name, names), max_delay)
 
     def current_section(self) -> StageSection:
         return self.sections[self.section_index]
 
-    def update(self) -> None:
+    def section_frames(self) -> int:
+        # number of update() calls the current section lasts
+        return max(1, int(ceil(self.current_section().distance / max(1e-6, self.scroll_speed))))
+
+    def update(self) -> bool:
         self.scroll_x += self.scroll_speed
         self.section_progress += self.scroll_speed
         if self.section_progress >= self.current_section().distance:
             self.section_progress = 0.0
             self.section_index = (self.section_index + 1) % len(self.sections)
-            self._assets.apply_theme(self.current_section().name)
+            self._apply_theme()
+            return True
+        return False
+
+    def get_state(self) -> tuple[int, float, float]:
+        return (self.section_index, self.section_progress, self.scroll_x)
+
+    def set_state(self, state: tuple[int, float, float]) -> None:
+        index, self.section_progress, self.scroll_x = state
+        if index != self.section_index:
+            self.section_index = index
+            self._apply_theme()
+        else:
+            self._defer_next()
 
     def draw_background(self, screen_w: int, screen_h: int) -> None:
         pyxel.cls(0)
-        theme = self._assets.themes[self.current_section().name]
-        self._draw_wrapped_tilemap(self._assets.TM_FAR, theme, screen_w, screen_h, int(self.scroll_x * 0.3))
-        self._draw_wrapped_tilemap(self._assets.TM_NEAR, theme, screen_w, screen_h, int(self.scroll_x))
-
-    def _draw_wrapped_tilemap(self, tm_id: int, theme: Any, screen_w: int, screen_h: int, offset_px: int) -> None:
-        tile_size = 8
-        map_w = int(theme.map_w)
-        start_tile_x = (offset_px // tile_size) % map_w
-        start_px = offset_px % tile_size
-        tiles_w = (screen_w // tile_size) + 2
-        tiles_h = (screen_h // tile_size) + 2
-
-        sx = -start_px
-        sy = 0
-        pyxel.bltm(sx, sy, tm_id, start_tile_x, 0, tiles_w, tiles_h, 0)
-        if start_tile_x + tiles_w > map_w:
-            overflow_tiles = (start_tile_x + tiles_w) - map_w
-            pyxel.bltm(sx + (map_w - start_tile_x) * tile_size, sy, tm_id, 0, 0, overflow_tiles, tiles_h, 0)
+        for (_, speed), strip in zip(self.current_section().layers, self._strips):
+            self._draw_strip(strip, int(self.scroll_x * speed), screen_w)
+
+    def _draw_strip(self, strip: Any, offset_px: int, screen_w: int) -> None:
+        # one region blit per wrap segment, however many tiles the layer has
+        strip_w = strip.width
+        u = offset_px % strip_w
+        x = 0
+        while x < screen_w:
+            w = min(strip_w - u, screen_w - x)
+            pyxel.blt(x, 0, strip, u, 0, w, strip.height, 0)
+            x += w
+            u = 0
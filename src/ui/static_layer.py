@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pyxel
+
+
+class StaticLayer:
+    # Off-screen copy of the parts of a screen that never change while it is
+    # shown. paint(target) draws them into an Image once; each frame is then
+    # a single opaque blt (it also replaces cls), with dynamic widgets on top.
+    def __init__(self, w: int, h: int, paint: Callable[[Any], None]) -> None:
+        self._w = w
+        self._h = h
+        self._paint = paint
+        self._image: Any = None
+        self._dirty = True
+
+    def invalidate(self) -> None:
+        # repainted on the next draw()
+        self._dirty = True
+
+    def draw(self) -> None:
+        if self._dirty:
+            if self._image is None:
+                self._image = pyxel.Image(self._w, self._h)
+            self._image.cls(0)
+            self._paint(self._image)
+            self._dirty = False
+        pyxel.blt(0, 0, self._image, 0, 0, self._w, self._h)